@@ -7,12 +7,45 @@
 
 import pygame
 import sys
-from src.player import Player
+from typing import Tuple
 from src.enemy import EnemyManager
+from src.timestep import FixedTimestep
+
+class DemoPlayer:
+    def __init__(self, x: int, y: int, size: int = 30, speed: int = 5):
+        """예제용 플레이어 초기화 (x, y는 중심 좌표, src.player.Player는 가위바위보 플레이어라 따로 둠)"""
+        self.rect = pygame.Rect(0, 0, size, size)
+        self.rect.center = (x, y)
+        self.speed = speed
+        self.color = (0, 0, 255)
+        self.dx = 0
+        self.dy = 0
+    
+    def handle_input(self, keys):
+        """WASD / 화살표 키로 이동 방향 설정"""
+        self.dx = ((keys[pygame.K_d] or keys[pygame.K_RIGHT]) - (keys[pygame.K_a] or keys[pygame.K_LEFT])) * self.speed
+        self.dy = ((keys[pygame.K_s] or keys[pygame.K_DOWN]) - (keys[pygame.K_w] or keys[pygame.K_UP])) * self.speed
+    
+    def update(self, screen_width: int, screen_height: int):
+        """이동하고 화면 안으로 제한"""
+        self.rect.move_ip(self.dx, self.dy)
+        self.rect.clamp_ip(pygame.Rect(0, 0, screen_width, screen_height))
+    
+    def get_position(self) -> Tuple[int, int]:
+        """중심 좌표"""
+        return self.rect.center
+    
+    def set_position(self, x: int, y: int):
+        """중심 좌표 설정"""
+        self.rect.center = (x, y)
+    
+    def draw(self, screen: pygame.Surface):
+        """플레이어 그리기"""
+        pygame.draw.rect(screen, self.color, self.rect)
 
 class ExampleGame:
-    def __init__(self, width: int = 800, height: int = 600):
-        """게임 초기화"""
+    def __init__(self, width: int = 800, height: int = 600, enemy_count: int = 5):
+        """게임 초기화 (enemy_count: 한 번에 등장하는 적 수)"""
         pygame.init()
         self.width = width
         self.height = height
@@ -22,6 +55,9 @@ class ExampleGame:
         self.running = True
         self.fps = 60
         
+        # 게임 로직은 그리기 프레임과 상관없이 60Hz 고정 스텝으로 진행
+        self.timestep = FixedTimestep()
+        
         # 색상 정의
         self.BLACK = (0, 0, 0)
         self.WHITE = (255, 255, 255)
@@ -31,7 +67,7 @@ class ExampleGame:
         self.YELLOW = (255, 255, 0)
         
         # 게임 오브젝트들
-        self.player = Player(width // 2, height // 2)
+        self.player = DemoPlayer(width // 2, height // 2)
         self.enemy_manager = EnemyManager()
         
         # 게임 상태
@@ -40,10 +76,12 @@ class ExampleGame:
         self.font = pygame.font.Font(None, 36)
         
         # 적 생성
-        self.enemy_manager.add_enemies_random(5, width, height)
+        self.enemy_count = enemy_count
+        self.enemy_manager.add_enemies_random(self.enemy_count, width, height)
         
         print("게임이 시작되었습니다!")
         print("조작법: WASD 또는 화살표 키로 이동")
+        print("C: 적 추적 모드 켜기/끄기")
         print("ESC: 게임 종료")
     
     def handle_events(self):
@@ -54,14 +92,21 @@ class ExampleGame:
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     self.running = False
+                elif event.key == pygame.K_c:
+                    self.enemy_manager.set_chase(not self.enemy_manager.chase)
                 elif event.key == pygame.K_r and self.game_over:
                     self.restart_game()
     
     def update(self):
-        """게임 로직 업데이트"""
-        if self.game_over:
-            return
-        
+        """게임 로직 업데이트 (흐른 시간만큼 고정 스텝 실행)"""
+        steps = self.timestep.advance()
+        for _ in range(steps):
+            if self.game_over:
+                return
+            self.step()
+    
+    def step(self):
+        """고정 스텝 하나 진행"""
         # 키보드 입력 처리
         keys = pygame.key.get_pressed()
         self.player.handle_input(keys)
@@ -78,12 +123,9 @@ class ExampleGame:
             enemy.deactivate()
             self.score += 10
         
-        # 비활성화된 적들 제거
-        self.enemy_manager.remove_inactive_enemies()
-        
         # 모든 적이 제거되면 새로운 적들 생성
-        if len(self.enemy_manager.get_active_enemies()) == 0:
-            self.enemy_manager.add_enemies_random(5, self.width, self.height)
+        if self.enemy_manager.get_active_count() == 0:
+            self.enemy_manager.add_enemies_random(self.enemy_count, self.width, self.height)
     
     def draw(self):
         """화면 그리기"""
@@ -93,8 +135,8 @@ class ExampleGame:
         # 플레이어 그리기
         self.player.draw(self.screen)
         
-        # 적들 그리기
-        self.enemy_manager.draw(self.screen)
+        # 적들 그리기 (스텝 사이 위치 보간)
+        self.enemy_manager.draw(self.screen, self.timestep.alpha)
         
         # 점수 표시
         score_text = self.font.render(f"점수: {self.score}", True, self.WHITE)
@@ -127,8 +169,8 @@ class ExampleGame:
     def restart_game(self):
         """게임 재시작"""
         self.player.set_position(self.width // 2, self.height // 2)
-        self.enemy_manager = EnemyManager()
-        self.enemy_manager.add_enemies_random(5, self.width, self.height)
+        self.enemy_manager.clear()
+        self.enemy_manager.add_enemies_random(self.enemy_count, self.width, self.height)
         self.score = 0
         self.game_over = False
     
@@ -7,7 +7,8 @@
 
 import pygame
 import sys
-from typing import Tuple
+from typing import Optional, Tuple
+from src.event_wait import wait_events
 
 class Game:
     def __init__(self, width: int = 800, height: int = 600, title: str = "파이썬 게임"):
@@ -21,6 +22,7 @@ class Game:
         self.clock = pygame.time.Clock()
         self.running = True
         self.fps = 60
+        self.idle_timeout = 1000  # 정적인 화면에서 이벤트를 기다리는 최대 시간 (ms)
         
         # 색상 정의
         self.BLACK = (0, 0, 0)
@@ -31,9 +33,15 @@ class Game:
         
         print(f"게임이 시작되었습니다: {title}")
     
-    def handle_events(self):
+    def wait_events(self) -> list:
+        """이번 프레임에 처리할 이벤트 목록 (정적인 화면이면 입력이 올 때까지 기다림)"""
+        return wait_events(self.is_animating(), self.idle_timeout)
+    
+    def handle_events(self, events: Optional[list] = None):
         """이벤트 처리"""
-        for event in pygame.event.get():
+        if events is None:
+            events = pygame.event.get()
+        for event in events:
             if event.type == pygame.QUIT:
                 self.running = False
             elif event.type == pygame.KEYDOWN:
@@ -57,6 +65,10 @@ class Game:
         """마우스 클릭 이벤트 처리 (오버라이드 가능)"""
         pass
     
+    def is_animating(self) -> bool:
+        """매 프레임 갱신이 필요한지 (오버라이드 가능, 입력 없이는 바뀌지 않는 화면만 False 반환)"""
+        return True
+    
     def update(self):
         """게임 로직 업데이트 (오버라이드 가능)"""
         pass
@@ -77,7 +89,8 @@ class Game:
     def run(self):
         """메인 게임 루프"""
         while self.running:
-            self.handle_events()
+            # is_animating이 False인 화면은 입력이 올 때까지 잠들어 CPU를 쓰지 않음
+            self.handle_events(self.wait_events())
             self.update()
             self.draw()
             self.clock.tick(self.fps)
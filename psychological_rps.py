@@ -6,13 +6,18 @@
 
 import pygame
 import sys
+from typing import Optional
 from src.player import Choice
 from src.game_manager import GameManager, GameState, GameMode
 from src.ui import UI
+from src.speculation import AIMoveSpeculator
+from src.dirty_rects import DirtyRectTracker
+from src.timestep import FixedTimestep
+from src.event_wait import wait_events
 
 class PsychologicalRPS:
-    def __init__(self, width: int = 800, height: int = 600):
-        """게임 초기화"""
+    def __init__(self, width: int = 800, height: int = 600, dirty_rects: bool = True):
+        """게임 초기화 (dirty_rects면 바뀐 영역만 다시 그림)"""
         pygame.init()
         self.width = width
         self.height = height
@@ -21,11 +26,22 @@ class PsychologicalRPS:
         self.clock = pygame.time.Clock()
         self.running = True
         self.fps = 60
+        self.idle_timeout = 1000  # 애니메이션이 없을 때 이벤트를 기다리는 최대 시간 (ms)
         
         # 게임 매니저와 UI
-        self.game_manager = GameManager()
+        self.game_manager = GameManager((width, height))
         self.ui = UI(width, height)
         
+        # 입력 대기 중 다음 AI 선택 미리 계산
+        self.ai_speculator = AIMoveSpeculator(self.game_manager.computer)
+        
+        # 바뀐 위젯 영역만 다시 그리기
+        self.dirty_rects = dirty_rects
+        self.dirty_tracker = DirtyRectTracker(self.screen.get_rect())
+        
+        # 애니메이션은 그리기 프레임과 상관없이 60Hz 고정 스텝으로 진행
+        self.timestep = FixedTimestep()
+        
         # 색상
         self.BLACK = (0, 0, 0)
         self.WHITE = (255, 255, 255)
@@ -37,22 +53,37 @@ class PsychologicalRPS:
         print("3. 승자는 자신이 할당한 데미지만큼 상대방 체력을 깎습니다")
         print("4. 체력이 0이 되면 패배합니다")
     
-    def handle_events(self):
+    def is_animating(self) -> bool:
+        """매 프레임 갱신이 필요한지 (사망 애니메이션 중에만, 나머지 화면은 입력이 올 때까지 잠듦)"""
+        return self.game_manager.get_state() == GameState.DEATH_ANIMATION
+    
+    def wait_events(self) -> list:
+        """이번 프레임에 처리할 이벤트 목록 (애니메이션이 없으면 입력이 올 때까지 기다림)"""
+        return wait_events(self.is_animating(), self.idle_timeout)
+    
+    def handle_events(self, events: Optional[list] = None):
         """이벤트 처리"""
-        for event in pygame.event.get():
+        if events is None:
+            events = pygame.event.get()
+        for event in events:
             if event.type == pygame.QUIT:
                 self.running = False
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     self.running = False
+            elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+                # 누르고 뗀 것이 같은 묶음에 들어와도 놓치지 않도록 클릭은 이벤트로 처리
+                action = self.ui.handle_mouse(event.pos, True, self.game_manager.get_state())
+                if action:
+                    self.handle_action(action)
+            elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED):
+                # 창이 다시 보이면 화면 전체를 다시 그려야 함
+                self.dirty_tracker.invalidate()
         
-        # 마우스 이벤트 처리
+        # 호버와 슬라이더 드래그는 현재 마우스 상태로 갱신 (버튼 동작은 위의 클릭 이벤트에서만)
         mouse_pos = pygame.mouse.get_pos()
-        mouse_click = pygame.mouse.get_pressed()[0]
-        
-        action = self.ui.handle_mouse(mouse_pos, mouse_click)
-        if action:
-            self.handle_action(action)
+        mouse_held = pygame.mouse.get_pressed()[0]
+        self.ui.handle_mouse(mouse_pos, mouse_held, self.game_manager.get_state())
     
     def handle_action(self, action: str):
         """액션 처리"""
@@ -93,6 +124,9 @@ class PsychologicalRPS:
         else:
             print("연습 모드: AI가 기본 난이도로 설정됩니다.")
             self.game_manager.computer.set_difficulty(1.0)
+        
+        # 난이도에 맞는 컴퓨터 데미지 배분 (배분 표가 없으면 랜덤)
+        self.game_manager.setup_computer_damage(self.game_manager.computer.get_difficulty())
     
     def handle_setup_confirmation(self):
         """데미지 배분 확인 처리"""
@@ -110,8 +144,8 @@ class PsychologicalRPS:
             self.game_manager.player.set_choice(choice)
             print(f"플레이어 선택: {choice.value}")
             
-            # 컴퓨터 선택
-            self.game_manager.computer_choose()
+            # 컴퓨터 선택 (미리 계산한 결과가 유효하면 사용)
+            self.game_manager.computer_choose(self.ai_speculator.take())
             print(f"컴퓨터 선택: {self.game_manager.computer.get_choice().value}")
             
             # 라운드 처리
@@ -138,18 +172,51 @@ class PsychologicalRPS:
     
     def update(self):
         """게임 업데이트"""
-        # 사망 애니메이션 업데이트
+        # 플레이어 입력을 기다리는 동안 다음 AI 선택 미리 계산, 다른 상태에서는 버림
+        state = self.game_manager.get_state()
+        if state in (GameState.PLAYING, GameState.ROUND_RESULT):
+            self.ai_speculator.prefetch()
+        else:
+            self.ai_speculator.discard()
+        
+        # 사망 애니메이션 업데이트 (흐른 시간만큼 고정 스텝 실행)
         if self.game_manager.get_state() == GameState.DEATH_ANIMATION:
-            self.game_manager.update_death_animation()
+            for _ in range(self.timestep.advance()):
+                self.game_manager.update_death_animation()
+                if self.game_manager.get_state() != GameState.DEATH_ANIMATION:
+                    break
+            self.game_manager.animation_alpha = self.timestep.alpha
+        else:
+            self.timestep.reset()
     
     def draw(self):
         """화면 그리기"""
+        state = self.game_manager.get_state()
+        if not self.dirty_rects:
+            self.draw_screen(state)
+            pygame.display.flip()
+            return
+        
+        rects = self.dirty_tracker.collect(self.ui.get_screen_key(state, self.game_manager),
+                                           self.ui.get_dirty_widgets(state, self.game_manager))
+        if rects is None:
+            self.draw_screen(state)
+            pygame.display.flip()
+        elif rects:
+            # 바뀐 영역만 잘라서 다시 그리고 그 영역만 화면에 반영
+            for rect in rects:
+                self.screen.set_clip(rect)
+                self.draw_screen(state)
+            self.screen.set_clip(None)
+            pygame.display.update(rects)
+        # 바뀐 것이 없으면 그리지 않음
+    
+    def draw_screen(self, state: GameState):
+        """현재 상태 화면 전체 그리기 (클립 영역이 있으면 그 안에만 그려짐)"""
         # 배경
         self.screen.fill(self.BLACK)
         
         # 게임 상태에 따른 화면 그리기
-        state = self.game_manager.get_state()
-        
         if state == GameState.MODE_SELECTION:
             self.ui.draw_mode_selection_screen(self.screen)
         elif state == GameState.SETUP:
@@ -162,18 +229,17 @@ class PsychologicalRPS:
             self.ui.draw_death_animation_screen(self.screen, self.game_manager)
         elif state == GameState.GAME_OVER:
             self.ui.draw_game_over_screen(self.screen, self.game_manager)
-        
-        # 화면 업데이트
-        pygame.display.flip()
     
     def run(self):
         """메인 게임 루프"""
         while self.running:
-            self.handle_events()
+            # 애니메이션이 없으면 입력이 올 때까지 잠들고, 애니메이션 중에는 고정 프레임으로 갱신
+            self.handle_events(self.wait_events())
             self.update()
             self.draw()
             self.clock.tick(self.fps)
         
+        self.ai_speculator.shutdown()
         pygame.quit()
         sys.exit()
 
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+AI 배치 추론
+여러 대전의 AIPlayerState 선택을 NumPy로 한 번에 계산합니다.
+같은 난수 흐름이면 make_choice를 하나씩 호출한 결과와 동일합니다.
+"""
+
+import numpy as np
+from typing import List, Sequence
+from .engine import Choice, CHOICE_ORDER, PLAYER_WIN, COMPUTER_WIN
+from .ai_engine import AIPlayerState
+
+def _pattern_distribution(counts: np.ndarray, usable: np.ndarray) -> np.ndarray:
+    """선택 횟수 배열 (N x 3)을 확률 분포로 변환 (사용할 수 없거나 비어 있으면 균등 분포)"""
+    totals = counts.sum(axis=1, keepdims=True)
+    usable = usable[:, None] & (totals > 0)
+    return np.where(usable, counts / np.maximum(totals, 1), 1/3)
+
+def predict_batch(sessions: Sequence[AIPlayerState]) -> np.ndarray:
+    """AI들의 플레이어 선택 예측 분포 (N x 3, CHOICE_ORDER 순서)"""
+    n = len(sessions)
+    lengths = np.fromiter((len(ai.player_history) for ai in sessions), dtype=np.int64, count=n)
+    recent_counts = np.array([ai.recent_counts for ai in sessions], dtype=np.int64).reshape(n, 3)
+    outcome_counts = np.array([ai.outcome_counts for ai in sessions], dtype=np.int64).reshape(n, 3)
+    win_counts = np.array([ai.choices_after_outcome(PLAYER_WIN) for ai in sessions], dtype=np.int64).reshape(n, 3)
+    lose_counts = np.array([ai.choices_after_outcome(COMPUTER_WIN) for ai in sessions], dtype=np.int64).reshape(n, 3)
+    weights = np.array([(ai.pattern_weights['recent_choice'], ai.pattern_weights['win_after_choice'],
+                         ai.pattern_weights['lose_after_choice'], ai.pattern_weights['random'])
+                        for ai in sessions], dtype=np.float64).reshape(n, 4)
+    
+    recent_pattern = _pattern_distribution(recent_counts, lengths >= 3)
+    win_pattern = _pattern_distribution(win_counts, outcome_counts[:, PLAYER_WIN] >= 2)
+    lose_pattern = _pattern_distribution(lose_counts, outcome_counts[:, COMPUTER_WIN] >= 2)
+    
+    # AIPlayerState.predict_from_patterns와 같은 순서로 더해 부동소수점 결과를 맞춤
+    return (recent_pattern * weights[:, 0:1] +
+            win_pattern * weights[:, 1:2] +
+            lose_pattern * weights[:, 2:3] +
+            (1/3) * weights[:, 3:4])
+
+def decide_batch(sessions: Sequence[AIPlayerState], apply: bool = True) -> List[Choice]:
+    """여러 AI의 다음 선택을 한 번에 결정 (apply면 set_choice까지 적용)"""
+    n = len(sessions)
+    choices: List[Choice] = [None] * n
+    if n == 0:
+        return choices
+    
+    predicted = np.argmax(predict_batch(sessions), axis=1)
+    
+    # 문맥/앙상블 예측기를 쓰는 AI는 기록 창 밖의 상태가 있으므로 개별 예측 사용
+    for i, ai in enumerate(sessions):
+        if len(ai.player_history) < 2:
+            continue
+        if ai.context_predictor is not None or ai.ensemble_predictor is not None:
+            prediction = ai.predict_player_choice()
+            predicted[i] = CHOICE_ORDER.index(max(prediction, key=prediction.get))
+    counters = (predicted + 1) % 3
+    
+    # 난수는 make_choice와 같은 순서로 AI마다 차례대로 뽑음
+    for i, ai in enumerate(sessions):
+        if len(ai.player_history) < 2:
+            ai.analysis_message = "데이터 부족으로 랜덤 선택"
+            choice = ai.rng.choice([Choice.SCISSORS, Choice.ROCK, Choice.PAPER])
+        elif ai.rng.random() < ai.difficulty:
+            predicted_choice = CHOICE_ORDER[predicted[i]]
+            choice = CHOICE_ORDER[counters[i]]
+            ai.analysis_message = f"플레이어가 {predicted_choice.value}를 선택할 것으로 예상하여 {choice.value}로 대응"
+        else:
+            ai.analysis_message = "랜덤 선택"
+            choice = ai.rng.choice([Choice.SCISSORS, Choice.ROCK, Choice.PAPER])
+        
+        choices[i] = choice
+        if apply:
+            ai.set_choice(choice)
+    return choices
@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+심리전 가위바위보 AI 엔진
+pygame 없이 패턴 분석과 선택을 수행합니다.
+"""
+
+import random
+from typing import List, Dict, Optional, Sequence, Tuple
+from collections import deque, OrderedDict
+from .engine import Choice, PlayerState, CHOICE_ORDER, CHOICE_INDEX, DRAW, PLAYER_WIN, COMPUTER_WIN
+from .predictors import ContextPredictor, EnsemblePredictor
+
+UNIFORM_DISTRIBUTION = {choice: 1/3 for choice in CHOICE_ORDER}
+
+# 기록 창 인코딩 한 자리 (플레이어 선택 3 x 결과 코드 3)
+WINDOW_TOKEN_COUNT = 9
+
+class AIPlayerState(PlayerState):
+    def __init__(self, name: str):
+        """AI 플레이어 상태 초기화 (렌더링 없음)"""
+        super().__init__(name)
+        
+        # 패턴 분석을 위한 데이터
+        self.player_history = deque(maxlen=10)  # 플레이어의 최근 10개 선택
+        self.ai_history = deque(maxlen=10)      # AI의 최근 10개 선택
+        self.round_results = deque(maxlen=10)   # 최근 10라운드 결과 (플레이어 선택, AI 선택, 결과 코드)
+        
+        # 증분 패턴 통계 (선택은 CHOICE_ORDER 인덱스)
+        self.recent_counts = [0, 0, 0]          # player_history 마지막 3개 선택 횟수
+        self.outcome_counts = [0, 0, 0]         # 창 안의 결과 코드별 라운드 수
+        self.choice_prefix = [[0, 0, 0]]        # choice_prefix[j]: player_history[:j] 안의 선택 횟수
+        self.window_code = 0                    # 창 안의 (플레이어 선택, 결과 코드)를 9진수로 인코딩
+        self.rounds_recorded = 0                # 지금까지 기록한 라운드 수 (예측 입력이 바뀌었는지 판단용)
+        
+        # 패턴 분석 가중치
+        self.pattern_weights = {
+            'recent_choice': 0.4,      # 최근 선택 패턴
+            'win_after_choice': 0.3,   # 승리 후 선택 패턴
+            'lose_after_choice': 0.2,  # 패배 후 선택 패턴
+            'random': 0.1              # 랜덤 요소
+        }
+        
+        # AI 난이도 (0.0 ~ 1.0)
+        self.difficulty = 0.7
+        
+        # 패턴 분석 메시지
+        self.analysis_message = ""
+        
+        # 난수 생성기 (시뮬레이션에서는 시드가 고정된 random.Random으로 교체)
+        self.rng = random
+        
+        # 추가 예측기 (기본 비활성화)
+        self.context_predictor: Optional[ContextPredictor] = None
+        self.ensemble_predictor: Optional[EnsemblePredictor] = None
+        
+        # 기록 창 -> 예측 분포 메모 캐시 (기본 비활성화)
+        self.prediction_cache: Optional[OrderedDict] = None
+        self.prediction_cache_size = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+    
+    def record_player_choice(self, choice: Choice):
+        """플레이어 선택 기록 (최근 선택 횟수와 누적 횟수 갱신)"""
+        history = self.player_history
+        if len(history) >= 3:
+            self.recent_counts[CHOICE_INDEX[history[-3]]] -= 1
+        history.append(choice)
+        self.recent_counts[CHOICE_INDEX[choice]] += 1
+        
+        # 창이 밀리면 앞쪽 누적 횟수가 모두 바뀌므로 다시 계산 (창 크기 10이라 라운드당 몇 번)
+        prefix = [[0, 0, 0]]
+        for past in history:
+            counts = prefix[-1][:]
+            counts[CHOICE_INDEX[past]] += 1
+            prefix.append(counts)
+        self.choice_prefix = prefix
+    
+    def record_ai_choice(self, choice: Choice):
+        """AI 선택 기록"""
+        self.ai_history.append(choice)
+    
+    def record_round_result(self, player_choice: Choice, ai_choice: Choice, winner: Optional[PlayerState]):
+        """라운드 결과 기록 (패턴 통계를 증분 갱신)"""
+        player_index = CHOICE_INDEX[player_choice]
+        if winner is None:
+            outcome = DRAW
+        elif winner is self:
+            outcome = COMPUTER_WIN
+        else:
+            outcome = PLAYER_WIN
+        
+        results = self.round_results
+        
+        # 10라운드 창에서 빠지는 라운드
+        if len(results) == results.maxlen:
+            oldest_outcome = results[0][2]
+            self.window_code -= (results[0][0] * 3 + oldest_outcome) * WINDOW_TOKEN_COUNT ** (results.maxlen - 1)
+            self.outcome_counts[oldest_outcome] -= 1
+        
+        results.append((player_index, CHOICE_INDEX[ai_choice], outcome))
+        self.rounds_recorded += 1
+        self.window_code = self.window_code * WINDOW_TOKEN_COUNT + player_index * 3 + outcome
+        self.outcome_counts[outcome] += 1
+        
+        if self.context_predictor is not None:
+            self.context_predictor.update(player_index, CHOICE_INDEX[ai_choice], outcome)
+        if self.ensemble_predictor is not None:
+            self.ensemble_predictor.update(player_index, CHOICE_INDEX[ai_choice], outcome)
+    
+    def _distribution(self, counts: List[int]) -> Dict[Choice, float]:
+        """선택 횟수를 확률 분포로 변환 (데이터가 없으면 균등 분포)"""
+        total = counts[0] + counts[1] + counts[2]
+        if total == 0:
+            return dict(UNIFORM_DISTRIBUTION)
+        return {choice: counts[i] / total for i, choice in enumerate(CHOICE_ORDER)}
+    
+    def choices_after_outcome(self, outcome: int) -> List[int]:
+        """승리/패배 후 패턴에 쓰는 선택 횟수 (창 안에 outcome 라운드가 k번이면 player_history[1:k])"""
+        # 기존 분석은 k번째 라운드 뒤의 선택이 아니라 player_history의 앞쪽 k - 1개를 세었으므로 같은 범위를 씀
+        k = min(self.outcome_counts[outcome], len(self.player_history))
+        if k < 2:
+            return [0, 0, 0]
+        end, start = self.choice_prefix[k], self.choice_prefix[1]
+        return [end[0] - start[0], end[1] - start[1], end[2] - start[2]]
+    
+    def analyze_recent_pattern(self) -> Dict[Choice, float]:
+        """최근 선택 패턴 분석"""
+        if len(self.player_history) < 3:
+            return dict(UNIFORM_DISTRIBUTION)
+        
+        # 최근 3개 선택 분석
+        return self._distribution(self.recent_counts)
+    
+    def analyze_win_pattern(self) -> Dict[Choice, float]:
+        """승리 후 선택 패턴 분석"""
+        # 플레이어가 승리한 라운드 (AI가 패배한 라운드)가 2번 이상 있어야 분석
+        if self.outcome_counts[PLAYER_WIN] < 2:
+            return dict(UNIFORM_DISTRIBUTION)
+        
+        # 승리 후 다음 선택 분석
+        return self._distribution(self.choices_after_outcome(PLAYER_WIN))
+    
+    def analyze_lose_pattern(self) -> Dict[Choice, float]:
+        """패배 후 선택 패턴 분석"""
+        # 플레이어가 패배한 라운드 (AI가 승리한 라운드)가 2번 이상 있어야 분석
+        if self.outcome_counts[COMPUTER_WIN] < 2:
+            return dict(UNIFORM_DISTRIBUTION)
+        
+        # 패배 후 다음 선택 분석
+        return self._distribution(self.choices_after_outcome(COMPUTER_WIN))
+    
+    def predict_player_choice(self) -> Dict[Choice, float]:
+        """플레이어의 다음 선택 예측"""
+        # 앙상블 메타 전략이 켜져 있으면 가중 합 대신 최고 후보의 예측 사용
+        if self.ensemble_predictor is not None:
+            ensemble_pattern = self.ensemble_predictor.predict()
+            return {choice: ensemble_pattern[i] for i, choice in enumerate(CHOICE_ORDER)}
+        
+        # 기록 창만으로 결정되는 예측은 메모 캐시에서 찾기
+        if self.prediction_cache is not None and self.context_predictor is None:
+            key = self.window_code * (self.round_results.maxlen + 1) + len(self.round_results)
+            cached = self.prediction_cache.get(key)
+            if cached is not None:
+                self.prediction_cache.move_to_end(key)
+                self.cache_hits += 1
+                return dict(cached)
+            
+            self.cache_misses += 1
+            prediction = self.predict_from_patterns()
+            self.prediction_cache[key] = prediction
+            if len(self.prediction_cache) > self.prediction_cache_size:
+                self.prediction_cache.popitem(last=False)
+            return dict(prediction)
+        
+        return self.predict_from_patterns()
+    
+    def predict_from_patterns(self) -> Dict[Choice, float]:
+        """패턴 분석 가중 합으로 다음 선택 예측"""
+        # 각 패턴 분석
+        recent_pattern = self.analyze_recent_pattern()
+        win_pattern = self.analyze_win_pattern()
+        lose_pattern = self.analyze_lose_pattern()
+        
+        # 가중 평균 계산
+        final_probabilities = {choice: 0.0 for choice in [Choice.SCISSORS, Choice.ROCK, Choice.PAPER]}
+        
+        for choice in [Choice.SCISSORS, Choice.ROCK, Choice.PAPER]:
+            prob = (recent_pattern[choice] * self.pattern_weights['recent_choice'] +
+                   win_pattern[choice] * self.pattern_weights['win_after_choice'] +
+                   lose_pattern[choice] * self.pattern_weights['lose_after_choice'] +
+                   (1/3) * self.pattern_weights['random'])
+            final_probabilities[choice] = prob
+        
+        # 가변 차수 문맥 예측기 (활성화된 경우 가중치를 더해 다시 정규화)
+        if self.context_predictor is not None:
+            context_pattern = self.context_predictor.predict()
+            context_weight = self.pattern_weights['context']
+            total_weight = sum(self.pattern_weights.values())
+            for i, choice in enumerate(CHOICE_ORDER):
+                final_probabilities[choice] = (final_probabilities[choice] +
+                                               context_pattern[i] * context_weight) / total_weight
+        
+        return final_probabilities
+    
+    def choose_counter_strategy(self, predicted_choice: Choice) -> Choice:
+        """예측된 선택에 대한 대응 전략"""
+        # 상성 규칙에 따른 대응
+        counter_map = {
+            Choice.SCISSORS: Choice.ROCK,    # 가위 -> 바위
+            Choice.ROCK: Choice.PAPER,       # 바위 -> 보
+            Choice.PAPER: Choice.SCISSORS    # 보 -> 가위
+        }
+        return counter_map[predicted_choice]
+    
+    def plan_choice(self) -> Tuple[Choice, str]:
+        """다음 선택과 분석 메시지 계산 (analysis_message는 바꾸지 않음)"""
+        if len(self.player_history) < 2:
+            # 데이터가 부족하면 랜덤 선택
+            return self.rng.choice([Choice.SCISSORS, Choice.ROCK, Choice.PAPER]), "데이터 부족으로 랜덤 선택"
+        
+        # 플레이어 선택 예측
+        prediction = self.predict_player_choice()
+        predicted_choice = max(prediction, key=prediction.get)
+        
+        # 난이도에 따른 결정
+        if self.rng.random() < self.difficulty:
+            # 패턴 분석 기반 선택
+            counter_choice = self.choose_counter_strategy(predicted_choice)
+            return counter_choice, f"플레이어가 {predicted_choice.value}를 선택할 것으로 예상하여 {counter_choice.value}로 대응"
+        else:
+            # 랜덤 선택
+            return self.rng.choice([Choice.SCISSORS, Choice.ROCK, Choice.PAPER]), "랜덤 선택"
+    
+    def make_choice(self) -> Choice:
+        """AI가 선택하기"""
+        choice, self.analysis_message = self.plan_choice()
+        return choice
+    
+    def enable_context_predictor(self, max_order: int = 4, max_nodes: int = 4096,
+                                 order_weights: Optional[List[float]] = None, weight: float = 0.4):
+        """가변 차수 문맥 예측기 활성화 (pattern_weights['context']로 반영)"""
+        self.context_predictor = ContextPredictor(max_order, max_nodes, order_weights)
+        self.pattern_weights['context'] = weight
+    
+    def disable_context_predictor(self):
+        """문맥 예측기 비활성화"""
+        self.context_predictor = None
+        self.pattern_weights.pop('context', None)
+    
+    def enable_ensemble_predictor(self, windows: Sequence[int] = (5, 20, 100), decays: Sequence[float] = (0.5, 0.9, 0.99)):
+        """앙상블 메타 전략 활성화 (predict_player_choice의 가중 합을 대체)"""
+        self.ensemble_predictor = EnsemblePredictor(windows, decays)
+    
+    def disable_ensemble_predictor(self):
+        """앙상블 메타 전략 비활성화"""
+        self.ensemble_predictor = None
+    
+    def enable_prediction_cache(self, max_size: int = 4096):
+        """기록 창 기반 예측 메모 캐시 활성화 (pattern_weights를 바꾸면 clear_prediction_cache 호출)"""
+        self.prediction_cache = OrderedDict()
+        self.prediction_cache_size = max_size
+        self.cache_hits = 0
+        self.cache_misses = 0
+    
+    def clear_prediction_cache(self):
+        """예측 메모 캐시 비우기"""
+        if self.prediction_cache is not None:
+            self.prediction_cache.clear()
+    
+    def get_prediction_cache_stats(self) -> Dict[str, float]:
+        """캐시 적중/실패 횟수와 적중률 반환"""
+        lookups = self.cache_hits + self.cache_misses
+        return {
+            'hits': self.cache_hits,
+            'misses': self.cache_misses,
+            'size': len(self.prediction_cache) if self.prediction_cache is not None else 0,
+            'hit_rate': self.cache_hits / lookups if lookups else 0.0
+        }
+    
+    def get_analysis_message(self) -> str:
+        """분석 메시지 반환"""
+        return self.analysis_message
+    
+    def set_difficulty(self, difficulty: float):
+        """AI 난이도 설정 (0.0 ~ 1.0)"""
+        self.difficulty = max(0.0, min(1.0, difficulty))
+    
+    def get_difficulty(self) -> float:
+        """AI 난이도 반환"""
+        return self.difficulty
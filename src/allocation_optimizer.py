@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+데미지 배분 최적화기
+총합 20의 데미지 배분 231가지를 모든 조합으로 시뮬레이션해
+기대 승률과 게임 길이 표를 만들고 디스크에 저장합니다.
+시뮬레이션은 양쪽 모두 가위/바위/보를 균등한 무작위로 고른다고 가정하므로
+표의 승률과 강도 순위는 AI의 실제 패턴 분석 플레이가 아니라 이 가정에서의 값입니다.
+생성한 표는 assets/allocation_table.npz로 함께 배포합니다 (규칙을 바꾸면 다시 생성).
+"""
+
+import os
+import numpy as np
+from typing import List, Optional, Tuple
+from .engine import MAX_DAMAGE_TOTAL
+from .batch_engine import BatchSide, resolve_rounds
+
+# 기본 표 위치
+DEFAULT_TABLE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                  "assets", "allocation_table.npz")
+
+def all_allocations(total: int = MAX_DAMAGE_TOTAL) -> List[Tuple[int, int, int]]:
+    """가능한 모든 데미지 배분 (가위, 바위, 보) 목록"""
+    return [(scissors, rock, total - scissors - rock)
+            for scissors in range(total + 1)
+            for rock in range(total - scissors + 1)]
+
+ALLOCATIONS = all_allocations()
+ALLOCATION_INDEX = {allocation: i for i, allocation in enumerate(ALLOCATIONS)}
+
+def simulate_against_all(player_allocation: Tuple[int, int, int], games: int,
+                         max_rounds: int, rng: np.random.Generator) -> Tuple[np.ndarray, np.ndarray]:
+    """한 플레이어 배분을 모든 컴퓨터 배분과 대전 (컴퓨터 승률, 평균 라운드 수)"""
+    # 양쪽 모두 무작위 선택, 배치 판정기로 (배분 수 x 대전 수)를 한 번에 진행
+    count = len(ALLOCATIONS)
+    n = count * games
+    player = BatchSide(n)
+    computer = BatchSide(n)
+    player.allocation[:] = player_allocation
+    computer.allocation[:] = np.repeat(np.array(ALLOCATIONS, dtype=np.int32), games, axis=0)
+    
+    rounds = np.zeros(n, dtype=np.int32)
+    for _ in range(max_rounds):
+        active = player.is_alive() & computer.is_alive()
+        if not active.any():
+            break
+        player_choices = rng.integers(0, 3, size=n, dtype=np.int8)
+        computer_choices = rng.integers(0, 3, size=n, dtype=np.int8)
+        player, computer, _, _ = resolve_rounds(player_choices, computer_choices, player, computer, active)
+        rounds += active
+    
+    computer_won = ~player.is_alive()
+    win_rate = computer_won.reshape(count, games).mean(axis=1)
+    game_length = rounds.reshape(count, games).mean(axis=1)
+    return win_rate, game_length
+
+def build_table(games: int = 128, max_rounds: int = 100, seed: int = 0, verbose: bool = False) -> dict:
+    """모든 배분 쌍의 승률/게임 길이 표 생성"""
+    rng = np.random.default_rng(seed)
+    count = len(ALLOCATIONS)
+    win_rate = np.zeros((count, count), dtype=np.float32)
+    game_length = np.zeros((count, count), dtype=np.float32)
+    
+    for i, allocation in enumerate(ALLOCATIONS):
+        win_rate[i], game_length[i] = simulate_against_all(allocation, games, max_rounds, rng)
+        if verbose and (i + 1) % 20 == 0:
+            print(f"{i + 1}/{count} 배분 완료")
+    
+    return make_table_arrays(win_rate, game_length)
+
+def make_table_arrays(win_rate: np.ndarray, game_length: np.ndarray) -> dict:
+    """저장용 배열 구성 (강도 순위를 미리 계산해 두어 선택을 O(1)로 만듦)"""
+    # 컴퓨터 배분별 강도 = 모든 플레이어 배분에 대한 평균 승률 (양쪽 모두 균등 무작위 선택 가정)
+    strength = win_rate.mean(axis=0)
+    ranking = np.argsort(-strength, kind="stable")
+    
+    # 플레이어 배분별 최선의 대응 배분
+    best_response = np.argmax(win_rate, axis=1)
+    
+    return {
+        'allocations': np.array(ALLOCATIONS, dtype=np.uint8),
+        'win_rate': win_rate.astype(np.float16),        # [플레이어 배분, 컴퓨터 배분] 컴퓨터 승률
+        'game_length': game_length.astype(np.float16),  # [플레이어 배분, 컴퓨터 배분] 평균 라운드 수
+        'strength': strength.astype(np.float32),
+        'ranking': ranking.astype(np.uint8),
+        'best_response': best_response.astype(np.uint8),
+    }
+
+def save_table(arrays: dict, path: str = DEFAULT_TABLE_PATH):
+    """표를 압축된 npz 파일로 저장"""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    np.savez_compressed(path, **arrays)
+
+class AllocationTable:
+    def __init__(self, arrays: dict):
+        """배분 표 초기화"""
+        self.allocations = [tuple(int(v) for v in row) for row in arrays['allocations']]
+        self.win_rate = arrays['win_rate']
+        self.game_length = arrays['game_length']
+        self.strength = arrays['strength']
+        self.ranking = arrays['ranking']
+        self.best_response = arrays['best_response']
+    
+    @classmethod
+    def load(cls, path: str = DEFAULT_TABLE_PATH) -> "AllocationTable":
+        """npz 파일에서 표 로드"""
+        with np.load(path) as data:
+            return cls({key: data[key] for key in data.files})
+    
+    def strongest(self) -> Tuple[int, int, int]:
+        """평균 승률이 가장 높은 배분 반환"""
+        return self.allocations[self.ranking[0]]
+    
+    def pick(self, difficulty: float) -> Tuple[int, int, int]:
+        """난이도 (0.0 ~ 1.0)에 맞는 배분 반환 - 1.0이면 균등 무작위 대전 기준 가장 강한 배분"""
+        difficulty = max(0.0, min(1.0, difficulty))
+        rank = int(round((1.0 - difficulty) * (len(self.ranking) - 1)))
+        return self.allocations[self.ranking[rank]]
+    
+    def counter(self, player_allocation: Tuple[int, int, int]) -> Tuple[int, int, int]:
+        """플레이어 배분에 대한 최선의 대응 배분 반환"""
+        return self.allocations[self.best_response[ALLOCATION_INDEX[tuple(player_allocation)]]]
+    
+    def expected(self, player_allocation: Tuple[int, int, int], computer_allocation: Tuple[int, int, int]) -> Tuple[float, float]:
+        """배분 쌍의 (컴퓨터 기대 승률, 기대 게임 길이) 반환"""
+        i = ALLOCATION_INDEX[tuple(player_allocation)]
+        j = ALLOCATION_INDEX[tuple(computer_allocation)]
+        return float(self.win_rate[i, j]), float(self.game_length[i, j])
+
+_loaded_tables = {}
+
+def load_allocation_table(path: str = DEFAULT_TABLE_PATH) -> Optional[AllocationTable]:
+    """표 로드 (파일이 없으면 None, 한 번 로드한 표는 재사용)"""
+    if path not in _loaded_tables:
+        _loaded_tables[path] = AllocationTable.load(path) if os.path.exists(path) else None
+    return _loaded_tables[path]
+
+def main():
+    """표 생성 명령"""
+    import argparse
+    import time
+    
+    parser = argparse.ArgumentParser(description="데미지 배분 표 생성")
+    parser.add_argument("--games", type=int, default=128, help="배분 쌍마다 시뮬레이션할 대전 수")
+    parser.add_argument("--max-rounds", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default=DEFAULT_TABLE_PATH)
+    args = parser.parse_args()
+    
+    start = time.perf_counter()
+    arrays = build_table(args.games, args.max_rounds, args.seed, verbose=True)
+    save_table(arrays, args.output)
+    
+    table = AllocationTable(arrays)
+    print(f"저장 완료: {args.output} ({time.perf_counter() - start:.1f}초)")
+    print(f"가장 강한 배분: {table.strongest()} (평균 승률 {table.strength[table.ranking[0]]:.1%})")
+
+if __name__ == "__main__":
+    main()
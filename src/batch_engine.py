@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+심리전 가위바위보 배치 라운드 판정기
+N개의 대전을 NumPy 배열로 한 번에 처리합니다.
+선택은 engine.CHOICE_ORDER 기준 정수 (0: 가위, 1: 바위, 2: 보)로 표현합니다.
+"""
+
+import numpy as np
+from typing import List, Optional, Tuple
+from .engine import PlayerState, CHOICE_ORDER, CHOICE_INDEX, DRAW, PLAYER_WIN, COMPUTER_WIN
+
+SCISSORS, ROCK, PAPER = 0, 1, 2
+NO_CHOICE = -1
+
+class BatchSide:
+    def __init__(self, n: int, max_health: int = 20):
+        """N개 대전의 한쪽 플레이어 상태 배열 초기화"""
+        self.health = np.full(n, max_health, dtype=np.int32)
+        self.allocation = np.zeros((n, 3), dtype=np.int32)  # 가위, 바위, 보
+        
+        # 특수 능력 관련
+        self.last_choice = np.full(n, NO_CHOICE, dtype=np.int8)
+        self.consecutive_choices = np.zeros(n, dtype=np.int32)
+        self.special_ability_active = np.zeros(n, dtype=bool)
+        self.defense_bonus = np.zeros(n, dtype=bool)
+        
+        # 연속 보너스 관련
+        self.consecutive_wins = np.zeros(n, dtype=np.int32)
+        self.consecutive_losses = np.zeros(n, dtype=np.int32)
+        self.bonus_damage = np.zeros(n, dtype=np.float64)
+    
+    def __len__(self) -> int:
+        return len(self.health)
+    
+    @classmethod
+    def from_states(cls, states: List[PlayerState]) -> "BatchSide":
+        """PlayerState 목록으로부터 배열 상태 생성"""
+        side = cls(len(states))
+        for i, state in enumerate(states):
+            side.health[i] = state.health
+            side.allocation[i] = state.get_damage_allocation_tuple()
+            side.last_choice[i] = CHOICE_INDEX[state.last_choice] if state.last_choice else NO_CHOICE
+            side.consecutive_choices[i] = state.consecutive_choices
+            side.special_ability_active[i] = state.special_ability_active
+            side.defense_bonus[i] = state.defense_bonus
+            side.consecutive_wins[i] = state.consecutive_wins
+            side.consecutive_losses[i] = state.consecutive_losses
+            side.bonus_damage[i] = state.bonus_damage
+        return side
+    
+    def write_to(self, i: int, state: PlayerState):
+        """i번째 대전의 상태를 PlayerState에 기록"""
+        state.health = int(self.health[i])
+        state.set_damage_allocation(*(int(v) for v in self.allocation[i]))
+        state.last_choice = CHOICE_ORDER[self.last_choice[i]] if self.last_choice[i] != NO_CHOICE else None
+        state.consecutive_choices = int(self.consecutive_choices[i])
+        state.special_ability_active = bool(self.special_ability_active[i])
+        state.defense_bonus = bool(self.defense_bonus[i])
+        state.consecutive_wins = int(self.consecutive_wins[i])
+        state.consecutive_losses = int(self.consecutive_losses[i])
+        state.bonus_damage = float(self.bonus_damage[i])
+    
+    def copy(self) -> "BatchSide":
+        """배열 상태 복사"""
+        side = BatchSide.__new__(BatchSide)
+        for key, value in self.__dict__.items():
+            setattr(side, key, value.copy())
+        return side
+    
+    def is_alive(self) -> np.ndarray:
+        """생존 여부 배열 반환"""
+        return self.health > 0
+
+def _apply_choices(side: BatchSide, choices: np.ndarray, active: np.ndarray):
+    """PlayerState.set_choice 규칙을 배열에 적용"""
+    same = side.last_choice == choices
+    consecutive = np.where(same, side.consecutive_choices + 1, 1)
+    side.consecutive_choices = np.where(active, consecutive, side.consecutive_choices).astype(np.int32)
+    side.last_choice = np.where(active, choices, side.last_choice).astype(np.int8)
+    side.special_ability_active = np.where(active, side.consecutive_choices >= 2, side.special_ability_active)
+
+def _winner_damage(side: BatchSide, choices: np.ndarray) -> np.ndarray:
+    """MatchEngine.calculate_damage 규칙으로 승리 시 데미지 계산"""
+    index = np.clip(choices, 0, 2)
+    base_damage = side.allocation[np.arange(len(side)), index].astype(np.float64)
+    
+    # 특수 능력 (연속 가위 1.5배)
+    special_multiplier = np.where(side.special_ability_active & (choices == SCISSORS), 1.5, 1.0)
+    
+    # 연속 보너스
+    bonus_multiplier = np.where(side.bonus_damage > 0, side.bonus_damage, 1.0)
+    
+    return (base_damage * special_multiplier * bonus_multiplier).astype(np.int32)
+
+def _apply_result(side: BatchSide, won: np.ndarray, lost: np.ndarray, choices: np.ndarray, damage_taken: np.ndarray):
+    """승패에 따른 바위 방어, 연속 보너스, 체력 변화 적용"""
+    # 바위 특수 능력 (승리 시 방어 보너스 획득)
+    gains_defense = won & (choices == ROCK) & side.special_ability_active
+    
+    # 방어 보너스로 받는 데미지 절반 (최소 1, 한 번만 적용)
+    halved = lost & side.defense_bonus
+    damage_taken = np.where(halved, np.maximum(1, damage_taken // 2), damage_taken)
+    side.defense_bonus = (side.defense_bonus & ~lost) | gains_defense
+    
+    # 연속 승패 기록
+    side.consecutive_wins = np.where(won, side.consecutive_wins + 1, np.where(lost, 0, side.consecutive_wins)).astype(np.int32)
+    side.consecutive_losses = np.where(lost, side.consecutive_losses + 1, np.where(won, 0, side.consecutive_losses)).astype(np.int32)
+    
+    # 승리 시 record_win이 설정한 1.5배 보너스도 바로 리셋되므로 승자는 항상 0
+    bonus = np.where(lost & (side.consecutive_losses >= 3), 2.0, side.bonus_damage)
+    side.bonus_damage = np.where(won, 0.0, bonus)
+    
+    side.health = np.where(lost, np.maximum(0, side.health - damage_taken), side.health).astype(np.int32)
+
+def resolve_rounds(player_choices: np.ndarray, computer_choices: np.ndarray,
+                   player: BatchSide, computer: BatchSide,
+                   active: Optional[np.ndarray] = None) -> Tuple[BatchSide, BatchSide, np.ndarray, np.ndarray]:
+    """N개 대전의 한 라운드를 한 번에 처리 (새 플레이어 상태, 새 컴퓨터 상태, 결과 코드, 라운드 데미지)"""
+    # MatchEngine.play_round와 같은 규칙, active가 False인 대전은 변하지 않음
+    player_choices = np.asarray(player_choices, dtype=np.int8)
+    computer_choices = np.asarray(computer_choices, dtype=np.int8)
+    if active is None:
+        active = player.is_alive() & computer.is_alive()
+    active = active & (player_choices != NO_CHOICE) & (computer_choices != NO_CHOICE)
+    
+    player = player.copy()
+    computer = computer.copy()
+    _apply_choices(player, player_choices, active)
+    _apply_choices(computer, computer_choices, active)
+    
+    # 상성 규칙: (플레이어 - 컴퓨터) % 3 == 1 이면 플레이어 승리
+    diff = (player_choices.astype(np.int16) - computer_choices) % 3
+    player_won = active & (diff == 1)
+    computer_won = active & (diff == 2)
+    
+    # 데미지는 보너스 리셋 전 상태로 계산
+    damage = np.where(player_won, _winner_damage(player, player_choices),
+                      np.where(computer_won, _winner_damage(computer, computer_choices), 0)).astype(np.int32)
+    
+    _apply_result(player, player_won, computer_won, player_choices, damage)
+    _apply_result(computer, computer_won, player_won, computer_choices, damage)
+    
+    result = np.where(player_won, PLAYER_WIN, np.where(computer_won, COMPUTER_WIN, DRAW)).astype(np.int8)
+    return player, computer, result, damage
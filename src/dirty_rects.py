@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+변경 영역 (dirty rect) 추적기
+위젯마다 (영역, 상태 시그니처)를 받아 이전 프레임과 비교하고
+다시 그려야 하는 사각형 목록만 돌려줍니다.
+"""
+
+import pygame
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple
+
+# (위젯 이름, 영역, 시그니처)
+Widget = Tuple[str, pygame.Rect, Hashable]
+
+def merge_rects(rects: List[pygame.Rect]) -> List[pygame.Rect]:
+    """겹치는 사각형끼리 합치기"""
+    merged: List[pygame.Rect] = []
+    for rect in rects:
+        rect = pygame.Rect(rect)
+        i = 0
+        while i < len(merged):
+            if merged[i].colliderect(rect):
+                rect.union_ip(merged.pop(i))
+                i = 0
+            else:
+                i += 1
+        merged.append(rect)
+    return merged
+
+class DirtyRectTracker:
+    def __init__(self, screen_rect: pygame.Rect):
+        """변경 영역 추적기 초기화"""
+        self.screen_rect = pygame.Rect(screen_rect)
+        self.screen_key: Optional[Hashable] = None
+        self.widgets: Dict[str, Tuple[pygame.Rect, Hashable]] = {}
+        self.needs_full_redraw = True
+        self.full_redraws = 0
+        self.partial_redraws = 0
+        self.skipped_frames = 0
+    
+    def invalidate(self):
+        """다음 프레임은 화면 전체 다시 그리기 (창 노출, 크기 변경 등)"""
+        self.needs_full_redraw = True
+    
+    def collect(self, screen_key: Hashable, widgets: Iterable[Widget]) -> Optional[List[pygame.Rect]]:
+        """다시 그릴 영역 계산 (None이면 전체, 빈 목록이면 그릴 필요 없음)"""
+        previous = self.widgets
+        self.widgets = {name: (pygame.Rect(rect), signature) for name, rect, signature in widgets}
+        
+        # 화면 구성 자체가 바뀌면 (상태 전환, 새 라운드 등) 전체 다시 그리기
+        if self.needs_full_redraw or screen_key != self.screen_key:
+            self.needs_full_redraw = False
+            self.screen_key = screen_key
+            self.full_redraws += 1
+            return None
+        
+        dirty = []
+        for name, (rect, signature) in self.widgets.items():
+            old = previous.get(name)
+            if old is None:
+                dirty.append(rect)
+            elif old[1] != signature or old[0] != rect:
+                # 위젯이 움직였으면 이전 자리도 지워야 함
+                dirty.append(rect.union(old[0]))
+        for name, (rect, _) in previous.items():
+            if name not in self.widgets:
+                dirty.append(rect)
+        
+        # 일부만 겹친 위젯도 통째로 다시 그림 (잘린 상태로 그리면 테두리 픽셀이 어긋날 수 있음)
+        dirty = merge_rects(dirty)
+        pending = [rect for rect, _ in self.widgets.values()]
+        grown = True
+        while grown and dirty:
+            grown = False
+            for rect in pending:
+                if rect.collidelist(dirty) != -1 and not any(area.contains(rect) for area in dirty):
+                    dirty = merge_rects(dirty + [rect])
+                    grown = True
+        
+        dirty = [rect.clip(self.screen_rect) for rect in dirty]
+        dirty = [rect for rect in dirty if rect.width > 0 and rect.height > 0]
+        if dirty:
+            self.partial_redraws += 1
+        else:
+            self.skipped_frames += 1
+        return dirty
+    
+    def get_stats(self) -> dict:
+        """전체/부분 다시 그리기와 건너뛴 프레임 수 반환"""
+        return {
+            'full_redraws': self.full_redraws,
+            'partial_redraws': self.partial_redraws,
+            'skipped_frames': self.skipped_frames
+        }
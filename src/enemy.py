@@ -3,80 +3,261 @@
 """
 적 클래스
 게임의 적 캐릭터를 관리합니다.
+적 데이터는 EnemyManager의 NumPy 배열 (위치, 방향, 타이머, 활성 여부)에 열 단위로 저장하고
+이동, 벽 반사, 방향 변경을 한 번에 계산합니다. Enemy는 배열 한 칸을 가리키는 뷰이고
+속성을 바꾸면 배열에 바로 반영됩니다. Enemy(x, y)로 만든 단독 적들은 관리자 하나를 함께 씁니다.
+그리기는 (크기, 색상)별로 미리 그려 둔 스프라이트를 화면 안의 적 위치에 blits로 한 번에 찍습니다.
+추적 모드에서는 플레이어를 목표로 한 흐름장을 모든 적이 함께 써서 방향을 정합니다.
+배열 칸(슬롯)은 풀로 관리합니다. 비활성화된 적의 슬롯은 바로 빈 슬롯 스택에 반납되고
+새 적은 그 슬롯을 다시 쓰므로 웨이브가 반복돼도 배열이나 뷰를 새로 만들지 않습니다.
 """
 
+import numpy as np
 import pygame
-import random
-from typing import Tuple, List
+from typing import Dict, Tuple, List, Optional
+from .spatial_hash import GridIndex
+from .flow_field import FlowField
+
+# 이동 방향 (오른쪽, 왼쪽, 아래, 위)
+DIRECTIONS = np.array([(1, 0), (-1, 0), (0, 1), (0, -1)], dtype=np.int8)
+
+class EnemyRect(pygame.Rect):
+    def __init__(self, enemy: "Enemy"):
+        """적 한 명의 배열 칸과 연결된 사각형 (위치나 크기를 바꾸면 배열에도 반영)"""
+        super().__init__(enemy.x, enemy.y, enemy.width, enemy.height)
+        object.__setattr__(self, 'enemy', enemy)
+    
+    def refresh(self):
+        """배열 값으로 사각형 갱신 (배열에 다시 쓰지 않음)"""
+        enemy = self.enemy
+        pygame.Rect.update(self, enemy.x, enemy.y, enemy.width, enemy.height)
+    
+    def _write_back(self):
+        """사각형 값을 적 배열에 반영"""
+        enemy = self.enemy
+        enemy.manager.set_bounds(enemy.index, self.x, self.y, self.width, self.height)
+    
+    def __setattr__(self, name, value):
+        """속성 변경 (x, center, size 등) 후 배열에 반영"""
+        super().__setattr__(name, value)
+        self._write_back()
+    
+    def move_ip(self, *args):
+        """제자리 이동 후 배열에 반영"""
+        super().move_ip(*args)
+        self._write_back()
+    
+    def inflate_ip(self, *args):
+        """제자리 크기 변경 후 배열에 반영"""
+        super().inflate_ip(*args)
+        self._write_back()
+    
+    def clamp_ip(self, *args):
+        """제자리 영역 안으로 옮긴 후 배열에 반영"""
+        super().clamp_ip(*args)
+        self._write_back()
+    
+    def union_ip(self, *args):
+        """제자리 합치기 후 배열에 반영"""
+        super().union_ip(*args)
+        self._write_back()
+    
+    def update(self, *args):
+        """위치와 크기 한 번에 설정 후 배열에 반영"""
+        super().update(*args)
+        self._write_back()
+
+# 단독으로 만든 적들이 함께 쓰는 관리자 (첫 Enemy(x, y) 때 만듦)
+_shared_manager: Optional["EnemyManager"] = None
+# 공유 관리자 슬롯 -> 그 슬롯을 가진 단독 적의 id (적이 사라질 때 슬롯 반납용)
+_standalone_owners: Dict[int, int] = {}
+
+def shared_enemy_manager() -> "EnemyManager":
+    """단독 적들이 함께 쓰는 관리자 반환"""
+    global _shared_manager
+    if _shared_manager is None:
+        _shared_manager = EnemyManager(capacity=16)
+    return _shared_manager
 
 class Enemy:
     def __init__(self, x: int, y: int, width: int = 24, height: int = 24):
-        """적 초기화"""
-        self.x = x
-        self.y = y
-        self.width = width
-        self.height = height
-        self.speed = 2
-        self.color = (255, 0, 0)  # 빨간색
-        
-        # 적의 사각형 (충돌 감지용)
-        self.rect = pygame.Rect(x, y, width, height)
-        
-        # AI 관련 변수들
-        self.direction = random.choice([(1, 0), (-1, 0), (0, 1), (0, -1)])
-        self.change_direction_timer = 0
-        self.change_direction_interval = 60  # 1초마다 방향 변경 (60 FPS 기준)
-        
-        # 상태
-        self.active = True
+        """단독 적 초기화 (예전 사용법 호환용, 공유 관리자의 슬롯 하나를 씀)"""
+        manager = shared_enemy_manager()
+        self.manager = manager
+        self.index = manager.add_enemy(x, y, width, height).index
+        self._rect: Optional[EnemyRect] = None
+        _standalone_owners[self.index] = id(self)
+    
+    def __del__(self):
+        """단독 적이 사라지면 공유 관리자 슬롯 반납 (슬롯이 이미 다른 적에게 넘어갔으면 그대로 둠)"""
+        if _standalone_owners.get(self.index) == id(self) and self.manager is _shared_manager:
+            del _standalone_owners[self.index]
+            self.manager.release(self.index)
+    
+    @classmethod
+    def view(cls, manager: "EnemyManager", index: int) -> "Enemy":
+        """manager 배열의 index 번째 적을 가리키는 뷰 생성 (EnemyManager가 슬롯마다 만듦)"""
+        enemy = cls.__new__(cls)
+        enemy.manager = manager
+        enemy.index = index
+        enemy._rect = None
+        return enemy
+    
+    def _set_bounds(self, x: int, y: int, width: int, height: int):
+        """위치와 크기를 배열에 쓰고 들고 있는 사각형도 갱신"""
+        self.manager.set_bounds(self.index, x, y, width, height)
+        if self._rect is not None:
+            self._rect.refresh()
+    
+    @property
+    def x(self) -> int:
+        """x 좌표"""
+        return int(self.manager.x[self.index])
+    
+    @x.setter
+    def x(self, value: int):
+        """x 좌표 설정"""
+        self._set_bounds(value, self.y, self.width, self.height)
+    
+    @property
+    def y(self) -> int:
+        """y 좌표"""
+        return int(self.manager.y[self.index])
+    
+    @y.setter
+    def y(self, value: int):
+        """y 좌표 설정"""
+        self._set_bounds(self.x, value, self.width, self.height)
+    
+    @property
+    def prev_x(self) -> int:
+        """직전 고정 스텝 x 좌표"""
+        return int(self.manager.prev_x[self.index])
+    
+    @property
+    def prev_y(self) -> int:
+        """직전 고정 스텝 y 좌표"""
+        return int(self.manager.prev_y[self.index])
+    
+    @property
+    def width(self) -> int:
+        """너비"""
+        return int(self.manager.width[self.index])
+    
+    @width.setter
+    def width(self, value: int):
+        """너비 설정"""
+        self._set_bounds(self.x, self.y, value, self.height)
+    
+    @property
+    def height(self) -> int:
+        """높이"""
+        return int(self.manager.height[self.index])
+    
+    @height.setter
+    def height(self, value: int):
+        """높이 설정"""
+        self._set_bounds(self.x, self.y, self.width, value)
+    
+    @property
+    def speed(self) -> int:
+        """이동 속도"""
+        return int(self.manager.speed[self.index])
+    
+    @speed.setter
+    def speed(self, value: int):
+        """이동 속도 설정"""
+        self.manager.speed[self.index] = value
+    
+    @property
+    def color(self) -> Tuple[int, int, int]:
+        """색상"""
+        return tuple(int(c) for c in self.manager.color[self.index])
+    
+    @color.setter
+    def color(self, value: Tuple[int, int, int]):
+        """색상 설정 (스프라이트도 바꿈)"""
+        self.manager.color[self.index] = value
+        self.manager.restyle(self.index)
+    
+    @property
+    def direction(self) -> Tuple[int, int]:
+        """이동 방향 (dx, dy)"""
+        return (int(self.manager.dx[self.index]), int(self.manager.dy[self.index]))
+    
+    @direction.setter
+    def direction(self, value: Tuple[int, int]):
+        """이동 방향 설정"""
+        self.manager.dx[self.index], self.manager.dy[self.index] = value
+    
+    @property
+    def change_direction_timer(self) -> int:
+        """방향 변경 타이머"""
+        return int(self.manager.timer[self.index])
+    
+    @change_direction_timer.setter
+    def change_direction_timer(self, value: int):
+        """방향 변경 타이머 설정"""
+        self.manager.timer[self.index] = value
+    
+    @property
+    def change_direction_interval(self) -> int:
+        """방향 변경 간격 (고정 스텝 수)"""
+        return int(self.manager.interval[self.index])
+    
+    @change_direction_interval.setter
+    def change_direction_interval(self, value: int):
+        """방향 변경 간격 설정"""
+        self.manager.interval[self.index] = value
+    
+    @property
+    def active(self) -> bool:
+        """활성 여부"""
+        return bool(self.manager.active[self.index])
+    
+    @active.setter
+    def active(self, value: bool):
+        """활성 여부 설정 (슬롯 반납/재사용 포함)"""
+        if value:
+            self.manager.claim(self.index)
+        else:
+            self.manager.release(self.index)
+    
+    @property
+    def rect(self) -> EnemyRect:
+        """적의 사각형 (충돌 감지용, 값을 바꾸면 적 위치/크기에도 반영됨)"""
+        if self._rect is None:
+            self._rect = EnemyRect(self)
+        else:
+            self._rect.refresh()
+        return self._rect
+    
+    @rect.setter
+    def rect(self, value: pygame.Rect):
+        """적의 사각형 설정"""
+        value = pygame.Rect(value)
+        self._set_bounds(value.x, value.y, value.width, value.height)
     
     def update(self, screen_width: int, screen_height: int, player_pos: Tuple[int, int]):
-        """적 업데이트"""
+        """이 적 하나만 고정 스텝 하나 업데이트 (보통은 EnemyManager.update로 한 번에 처리)"""
         if not self.active:
             return
-        
-        # 방향 변경 타이머 업데이트
-        self.change_direction_timer += 1
-        if self.change_direction_timer >= self.change_direction_interval:
-            self.change_direction_timer = 0
-            self.change_direction()
-        
-        # 이동 처리
-        dx, dy = self.direction
-        new_x = self.x + dx * self.speed
-        new_y = self.y + dy * self.speed
-        
-        # 화면 경계 체크
-        if new_x < 0 or new_x > screen_width - self.width:
-            self.direction = (-dx, dy)
-            new_x = self.x
-        if new_y < 0 or new_y > screen_height - self.height:
-            self.direction = (dx, -dy)
-            new_y = self.y
-        
-        self.x = new_x
-        self.y = new_y
-        
-        # 사각형 위치 업데이트
-        self.rect.x = self.x
-        self.rect.y = self.y
+        self.manager.update_rows(self.index, self.index + 1, screen_width, screen_height, player_pos)
     
     def change_direction(self):
         """방향 변경"""
-        directions = [(1, 0), (-1, 0), (0, 1), (0, -1)]
-        self.direction = random.choice(directions)
+        dx, dy = DIRECTIONS[self.manager.rng.integers(0, len(DIRECTIONS))]
+        self.manager.dx[self.index] = dx
+        self.manager.dy[self.index] = dy
     
-    def draw(self, screen):
-        """적 그리기"""
+    def draw(self, screen, alpha: float = 1.0):
+        """적 그리기 (alpha: 직전 스텝과 현재 스텝 사이 보간 비율)"""
         if not self.active:
             return
         
-        pygame.draw.rect(screen, self.color, self.rect)
-        
-        # 적 중심점 표시 (디버깅용)
-        center_x = self.x + self.width // 2
-        center_y = self.y + self.height // 2
-        pygame.draw.circle(screen, (0, 0, 255), (center_x, center_y), 2)
+        x = int(self.prev_x + (self.x - self.prev_x) * alpha)
+        y = int(self.prev_y + (self.y - self.prev_y) * alpha)
+        screen.blit(self.manager.get_sprite(int(self.manager.sprite_index[self.index])), (x, y))
     
     def get_position(self) -> Tuple[int, int]:
         """적 위치 반환"""
@@ -88,62 +269,337 @@ class Enemy:
     
     def set_position(self, x: int, y: int):
         """적 위치 설정"""
-        self.x = x
-        self.y = y
-        self.rect.x = x
-        self.rect.y = y
+        manager = self.manager
+        manager.x[self.index] = manager.prev_x[self.index] = x
+        manager.y[self.index] = manager.prev_y[self.index] = y
+        manager.grid_dirty = True
     
     def check_collision(self, other_rect: pygame.Rect) -> bool:
         """다른 오브젝트와의 충돌 감지"""
         return self.rect.colliderect(other_rect)
     
     def deactivate(self):
-        """적 비활성화"""
-        self.active = False
+        """적 비활성화 (슬롯은 풀에 반납되어 다음에 생성되는 적이 재사용함)"""
+        self.manager.release(self.index)
     
     def activate(self):
-        """적 활성화"""
-        self.active = True
+        """적 활성화 (반납된 슬롯이면 풀에서 다시 꺼냄)"""
+        self.manager.claim(self.index)
 
 class EnemyManager:
-    def __init__(self):
-        """적 관리자 초기화"""
-        self.enemies: List[Enemy] = []
+    # 배열 열 이름 (용량을 늘릴 때 함께 복사)
+    COLUMNS = ('x', 'y', 'prev_x', 'prev_y', 'dx', 'dy', 'timer', 'interval',
+               'speed', 'width', 'height', 'color', 'sprite_index', 'active', 'free_position')
+    
+    def __init__(self, cell_size: int = 64, capacity: int = 256, seed: Optional[int] = None,
+                 show_centers: bool = True, chase: bool = False, flow_cell_size: int = 32):
+        """적 관리자 초기화 (show_centers: 디버깅용 중심점 표시 여부, chase: 플레이어 추적 여부)"""
+        self.count = 0         # 한 번이라도 쓴 슬롯 수 (배열 연산은 [:count] 범위만 함)
+        self.active_count = 0  # 활성 적 수 (생성/비활성화할 때마다 갱신)
+        self.free_count = 0    # 반납된 슬롯 수
+        self.capacity = 0
+        self.rng = np.random.default_rng(seed)
+        self._views: List[Enemy] = []  # 슬롯마다 하나씩 미리 만들어 둔 뷰 (활성 적만 보려면 enemies)
+        self._allocate(capacity)
+        
+        # 충돌 후보를 주변 칸에서만 찾기 위한 격자 (적이 움직이면 다음 질의 때 통째로 다시 만듦)
+        self.grid = GridIndex(cell_size)
+        self.grid_dirty = True
+        
+        # (너비, 높이, 색상) -> 스프라이트 번호, 스프라이트는 (중심점 없음, 중심점 있음) 한 쌍
+        self.show_centers = show_centers
+        self.sprite_keys: Dict[Tuple[int, int, Tuple[int, int, int]], int] = {}
+        self.sprites: List[Tuple[pygame.Surface, pygame.Surface]] = []
+        
+        # 추적 모드용 흐름장 (화면 크기를 알게 되는 첫 update에서 만듦)
+        self.chase = chase
+        self.flow_cell_size = flow_cell_size
+        self.flow_field: Optional[FlowField] = None
+    
+    def _allocate(self, capacity: int):
+        """배열 용량 확보 (기존 데이터 유지, 모자랄 때만 호출됨)"""
+        old = {name: getattr(self, name) for name in self.COLUMNS} if self.capacity else None
+        old_free_slots = self.free_slots if self.capacity else None
+        self.x = np.zeros(capacity, dtype=np.int32)
+        self.y = np.zeros(capacity, dtype=np.int32)
+        self.prev_x = np.zeros(capacity, dtype=np.int32)  # 직전 고정 스텝 위치 (그리기 보간용)
+        self.prev_y = np.zeros(capacity, dtype=np.int32)
+        self.dx = np.zeros(capacity, dtype=np.int8)
+        self.dy = np.zeros(capacity, dtype=np.int8)
+        self.timer = np.zeros(capacity, dtype=np.int32)
+        self.interval = np.zeros(capacity, dtype=np.int32)
+        self.speed = np.zeros(capacity, dtype=np.int32)
+        self.width = np.zeros(capacity, dtype=np.int32)
+        self.height = np.zeros(capacity, dtype=np.int32)
+        self.color = np.zeros((capacity, 3), dtype=np.uint8)
+        self.sprite_index = np.zeros(capacity, dtype=np.int32)
+        self.active = np.zeros(capacity, dtype=bool)
+        
+        # 빈 슬롯 스택과 각 슬롯의 스택 위치 (-1이면 스택에 없음)
+        self.free_slots = np.zeros(capacity, dtype=np.int64)
+        self.free_position = np.full(capacity, -1, dtype=np.int64)
+        if old is not None:
+            for name in self.COLUMNS:
+                getattr(self, name)[:self.count] = old[name][:self.count]
+            self.free_slots[:self.free_count] = old_free_slots[:self.free_count]
+        
+        self._views.extend(Enemy.view(self, index) for index in range(self.capacity, capacity))
+        self.capacity = capacity
     
-    def add_enemy(self, x: int, y: int):
+    def add_enemy(self, x: int, y: int, width: int = 24, height: int = 24) -> Enemy:
         """적 추가"""
-        enemy = Enemy(x, y)
-        self.enemies.append(enemy)
+        return self.add_enemies(np.array([x]), np.array([y]), width, height)[0]
+    
+    def _acquire(self, n: int) -> np.ndarray:
+        """슬롯 n개 확보 (반납된 슬롯을 먼저 쓰고 모자라면 새 슬롯 사용)"""
+        reused = min(n, self.free_count)
+        top = self.free_count - reused
+        slots = self.free_slots[top:self.free_count][::-1].copy()
+        self.free_position[slots] = -1
+        self.free_count = top
+        
+        fresh = n - reused
+        if fresh:
+            if self.count + fresh > self.capacity:
+                self._allocate(max(self.count + fresh, self.capacity * 2))
+            slots = np.concatenate((slots, np.arange(self.count, self.count + fresh)))
+            self.count += fresh
+        return slots
+    
+    def release(self, index: int):
+        """적 비활성화 후 슬롯을 빈 슬롯 스택에 반납 (O(1))"""
+        if not self.active[index]:
+            return
+        self.active[index] = False
+        self.free_slots[self.free_count] = index
+        self.free_position[index] = self.free_count
+        self.free_count += 1
+        self.active_count -= 1
+        self.grid_dirty = True
+    
+    def claim(self, index: int):
+        """반납된 슬롯을 스택에서 빼서 다시 활성화 (O(1), 한 번도 쓰지 않은 슬롯은 위치/크기가 없으므로 거부)"""
+        if not 0 <= index < self.count:
+            raise IndexError(f"생성된 적이 없는 슬롯입니다: {index}")
+        if self.active[index]:
+            return
+        # 스택 맨 위 슬롯을 빠지는 자리로 옮김
+        position = self.free_position[index]
+        last = self.free_slots[self.free_count - 1]
+        self.free_slots[position] = last
+        self.free_position[last] = position
+        self.free_position[index] = -1
+        self.free_count -= 1
+        self.active[index] = True
+        self.active_count += 1
+        self.grid_dirty = True
+    
+    def add_enemies(self, xs: np.ndarray, ys: np.ndarray, width: int = 24, height: int = 24) -> List[Enemy]:
+        """여러 적을 한 번에 추가 (풀의 슬롯 사용)"""
+        n = len(xs)
+        slots = self._acquire(n)
+        
+        self.x[slots] = self.prev_x[slots] = xs
+        self.y[slots] = self.prev_y[slots] = ys
+        self.width[slots] = width
+        self.height[slots] = height
+        self.speed[slots] = 2
+        self.color[slots] = (255, 0, 0)  # 빨간색
+        self.sprite_index[slots] = self._sprite(width, height, (255, 0, 0))
+        
+        # AI 관련 변수들
+        self.dx[slots], self.dy[slots] = DIRECTIONS[self.rng.integers(0, len(DIRECTIONS), n)].T
+        self.timer[slots] = 0
+        self.interval[slots] = 60  # 1초마다 방향 변경 (60Hz 고정 스텝 기준)
+        
+        # 상태
+        self.active[slots] = True
+        self.active_count += n
+        self.grid_dirty = True
+        
+        views = self._views
+        return [views[index] for index in slots.tolist()]
     
     def add_enemies_random(self, count: int, screen_width: int, screen_height: int):
         """랜덤 위치에 적들 추가"""
-        for _ in range(count):
-            x = random.randint(0, screen_width - 24)
-            y = random.randint(0, screen_height - 24)
-            self.add_enemy(x, y)
+        xs = self.rng.integers(0, screen_width - 24 + 1, count)
+        ys = self.rng.integers(0, screen_height - 24 + 1, count)
+        self.add_enemies(xs, ys)
     
     def update(self, screen_width: int, screen_height: int, player_pos: Tuple[int, int]):
-        """모든 적 업데이트"""
-        for enemy in self.enemies:
-            enemy.update(screen_width, screen_height, player_pos)
+        """모든 적 고정 스텝 하나 업데이트 (배열 연산)"""
+        self.update_rows(0, self.count, screen_width, screen_height, player_pos)
+    
+    def update_rows(self, start: int, end: int, screen_width: int, screen_height: int,
+                    player_pos: Tuple[int, int]):
+        """[start, end) 슬롯의 적들만 고정 스텝 하나 업데이트"""
+        rows = slice(start, end)
+        active = self.active[rows]
+        x, y = self.x[rows], self.y[rows]
+        dx, dy = self.dx[rows], self.dy[rows]
+        
+        self.prev_x[rows] = x
+        self.prev_y[rows] = y
+        
+        if self.chase and player_pos is not None:
+            # 흐름장에서 각 적 중심이 있는 칸의 방향을 읽음 (플레이어 칸이 바뀔 때만 다시 계산됨)
+            field = self.get_flow_field(screen_width, screen_height)
+            field.set_target(player_pos)
+            chase_dx, chase_dy = field.sample(x + self.width[rows] // 2, y + self.height[rows] // 2)
+            dx[active] = chase_dx[active]
+            dy[active] = chase_dy[active]
+        else:
+            # 방향 변경 타이머 업데이트
+            timer = self.timer[rows]
+            timer[active] += 1
+            due = np.flatnonzero(active & (timer >= self.interval[rows]))
+            if len(due):
+                timer[due] = 0
+                dx[due], dy[due] = DIRECTIONS[self.rng.integers(0, len(DIRECTIONS), len(due))].T
+        
+        # 이동 처리
+        speed = self.speed[rows]
+        new_x = x + dx * speed
+        new_y = y + dy * speed
+        
+        # 화면 경계 체크 (세로로 부딪히면 가로 반사는 적용되지 않던 기존 동작 유지)
+        out_x = active & ((new_x < 0) | (new_x > screen_width - self.width[rows]))
+        out_y = active & ((new_y < 0) | (new_y > screen_height - self.height[rows]))
+        flip_x = out_x & ~out_y
+        dx[flip_x] = -dx[flip_x]
+        dy[out_y] = -dy[out_y]
+        
+        x[:] = np.where(active & ~out_x, new_x, x)
+        y[:] = np.where(active & ~out_y, new_y, y)
+        
+        self.grid_dirty = True
+    
+    def get_flow_field(self, screen_width: int, screen_height: int) -> FlowField:
+        """추적용 흐름장 반환 (화면 크기가 바뀌면 새로 만듦)"""
+        field = self.flow_field
+        if field is None or (field.width, field.height) != (screen_width, screen_height):
+            field = self.flow_field = FlowField(screen_width, screen_height, self.flow_cell_size)
+        return field
+    
+    def set_chase(self, chase: bool):
+        """추적 모드 켜기/끄기 (끄면 마지막 방향에서 다시 무작위 이동)"""
+        self.chase = chase
+    
+    def set_bounds(self, index: int, x: int, y: int, width: int, height: int):
+        """적 하나의 위치와 크기 설정 (크기가 바뀌면 스프라이트도 바꿈)"""
+        resized = (self.width[index], self.height[index]) != (width, height)
+        self.x[index], self.y[index] = x, y
+        self.width[index], self.height[index] = width, height
+        if resized:
+            self.restyle(index)
+        self.grid_dirty = True
+    
+    def restyle(self, index: int):
+        """적 하나의 크기/색상에 맞는 스프라이트로 바꾸기"""
+        self.sprite_index[index] = self._sprite(self.width[index], self.height[index], self.color[index])
+    
+    def _sprite(self, width: int, height: int, color: Tuple[int, int, int]) -> int:
+        """(너비, 높이, 색상) 스프라이트 번호 반환 (없으면 그려서 추가)"""
+        key = (int(width), int(height), tuple(int(c) for c in color))
+        index = self.sprite_keys.get(key)
+        if index is None:
+            plain = pygame.Surface((key[0], key[1]))
+            plain.fill(key[2])
+            
+            # 적 중심점 표시 (디버깅용)
+            dotted = plain.copy()
+            pygame.draw.circle(dotted, (0, 0, 255), (key[0] // 2, key[1] // 2), 2)
+            
+            if pygame.display.get_surface() is not None:
+                plain, dotted = plain.convert(), dotted.convert()
+            index = self.sprite_keys[key] = len(self.sprites)
+            self.sprites.append((plain, dotted))
+        return index
     
-    def draw(self, screen):
-        """모든 적 그리기"""
-        for enemy in self.enemies:
-            enemy.draw(screen)
+    def get_sprite(self, index: int) -> pygame.Surface:
+        """스프라이트 번호에 해당하는 적 스프라이트 (show_centers에 따라 중심점 포함)"""
+        return self.sprites[index][1 if self.show_centers else 0]
+    
+    def draw(self, screen, alpha: float = 1.0):
+        """화면 안의 모든 적을 blits 한 번으로 그리기 (alpha: 고정 스텝 사이 보간 비율)"""
+        index = np.flatnonzero(self.active[:self.count])
+        if len(index) == 0:
+            return
+        prev_x, prev_y = self.prev_x[index], self.prev_y[index]
+        xs = (prev_x + (self.x[index] - prev_x) * alpha).astype(np.int32)
+        ys = (prev_y + (self.y[index] - prev_y) * alpha).astype(np.int32)
+        
+        # 화면 밖 적은 건너뜀
+        screen_width, screen_height = screen.get_size()
+        visible = ((xs + self.width[index] > 0) & (xs < screen_width) &
+                   (ys + self.height[index] > 0) & (ys < screen_height))
+        positions = np.column_stack((xs[visible], ys[visible])).tolist()
+        
+        variant = 1 if self.show_centers else 0
+        if len(self.sprites) == 1:
+            sprite = self.sprites[0][variant]
+            screen.blits([(sprite, position) for position in positions], False)
+        else:
+            sprites = [pair[variant] for pair in self.sprites]
+            screen.blits([(sprites[sprite], position) for sprite, position
+                          in zip(self.sprite_index[index[visible]].tolist(), positions)], False)
+    
+    def _get_grid(self) -> GridIndex:
+        """활성 적들의 격자 반환 (바뀐 것이 있으면 다시 만듦)"""
+        if self.grid_dirty:
+            n = self.count
+            self.grid.build(self.x[:n], self.y[:n], self.width[:n], self.height[:n], self.active[:n])
+            self.grid_dirty = False
+        return self.grid
     
     def check_collisions(self, player_rect: pygame.Rect) -> List[Enemy]:
         """플레이어와 충돌하는 적들 반환"""
-        colliding_enemies = []
-        for enemy in self.enemies:
-            if enemy.active and enemy.check_collision(player_rect):
-                colliding_enemies.append(enemy)
-        return colliding_enemies
+        return self.get_enemies_in_rect(player_rect)
+    
+    def get_enemies_at(self, pos: Tuple[int, int]) -> List[Enemy]:
+        """점 위에 있는 활성 적들 반환"""
+        views = self._views
+        return [views[index] for index in self._get_grid().query_point(pos).tolist()]
+    
+    def get_enemies_in_rect(self, rect: pygame.Rect) -> List[Enemy]:
+        """사각형과 겹치는 활성 적들 반환"""
+        views = self._views
+        return [views[index] for index in self._get_grid().query_rect(pygame.Rect(rect)).tolist()]
+    
+    def get_enemies_in_radius(self, center: Tuple[float, float], radius: float) -> List[Enemy]:
+        """원과 겹치는 활성 적들 반환"""
+        views = self._views
+        return [views[index] for index in self._get_grid().query_radius(center, radius).tolist()]
+    
+    def get_colliding_enemy_pairs(self) -> List[Tuple[Enemy, Enemy]]:
+        """서로 겹치는 활성 적 쌍 반환"""
+        views = self._views
+        return [(views[a], views[b]) for a, b in self._get_grid().query_pairs().tolist()]
     
     def remove_inactive_enemies(self):
-        """비활성화된 적들 제거"""
-        self.enemies = [enemy for enemy in self.enemies if enemy.active]
+        """비활성화된 적들 제거 (풀에서는 비활성화할 때 슬롯이 바로 반납되므로 할 일 없음, 호환용)"""
+        pass
+    
+    def clear(self):
+        """모든 적 제거 (배열과 뷰는 재사용을 위해 유지)"""
+        n = self.count
+        self.active[:n] = False
+        self.free_slots[:n] = np.arange(n)[::-1]
+        self.free_position[:n] = np.arange(n)[::-1]
+        self.free_count = n
+        self.active_count = 0
+        self.grid_dirty = True
+    
+    def get_active_count(self) -> int:
+        """활성화된 적 수 반환"""
+        return self.active_count
     
     def get_active_enemies(self) -> List[Enemy]:
         """활성화된 적들 반환"""
-        return [enemy for enemy in self.enemies if enemy.active]
+        views = self._views
+        return [views[index] for index in np.flatnonzero(self.active[:self.count]).tolist()]
+    
+    @property
+    def enemies(self) -> List[Enemy]:
+        """활성화된 적들 (슬롯 순서, 빈 슬롯과 반납된 슬롯은 빠짐)"""
+        return self.get_active_enemies()
@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+심리전 가위바위보 규칙 엔진
+pygame 없이 라운드 판정, 데미지 계산, 연속 보너스와 특수 능력 상태를 관리합니다.
+"""
+
+import random
+from typing import Tuple, Dict, Optional
+from enum import Enum
+
+class Choice(Enum):
+    ROCK = "바위"
+    PAPER = "보"
+    SCISSORS = "가위"
+
+# 데미지 배분 총합
+MAX_DAMAGE_TOTAL = 20
+
+# 정수 인코딩 순서 (가위, 바위, 보) - 데미지 배분 튜플과 같은 순서
+CHOICE_ORDER = (Choice.SCISSORS, Choice.ROCK, Choice.PAPER)
+CHOICE_INDEX = {choice: i for i, choice in enumerate(CHOICE_ORDER)}
+
+# 라운드 결과 코드
+DRAW = 0
+PLAYER_WIN = 1
+COMPUTER_WIN = 2
+
+def random_allocation(rng=random) -> Tuple[int, int, int]:
+    """총합 20의 랜덤 데미지 배분 반환 (가위, 바위, 보 순서)"""
+    total = MAX_DAMAGE_TOTAL
+    scissors = rng.randint(0, total)
+    remaining = total - scissors
+    rock = rng.randint(0, remaining)
+    paper = remaining - rock
+    return scissors, rock, paper
+
+class PlayerState:
+    def __init__(self, name: str):
+        """플레이어 상태 초기화 (렌더링 없음)"""
+        self.name = name
+        self.max_health = 20
+        self.health = self.max_health
+        
+        # 데미지 배분 (가위, 바위, 보)
+        self.damage_allocation = {
+            Choice.SCISSORS: 0,
+            Choice.ROCK: 0,
+            Choice.PAPER: 0
+        }
+        
+        # 현재 선택
+        self.current_choice = None
+        
+        # 특수 능력 관련
+        self.consecutive_choices = 0  # 연속 같은 선택 횟수
+        self.last_choice = None       # 이전 선택
+        self.special_ability_active = False  # 특수 능력 활성화 여부
+        self.defense_bonus = False    # 방어 보너스 (바위 특수 능력)
+        
+        # 연속 보너스 관련
+        self.consecutive_wins = 0     # 연속 승리 횟수
+        self.consecutive_losses = 0   # 연속 패배 횟수
+        self.bonus_damage = 0         # 보너스 데미지
+    
+    def set_damage_allocation(self, scissors: int, rock: int, paper: int):
+        """데미지 배분 설정"""
+        total = scissors + rock + paper
+        if total > MAX_DAMAGE_TOTAL:
+            raise ValueError("데미지 총합이 20을 초과할 수 없습니다!")
+        
+        self.damage_allocation[Choice.SCISSORS] = scissors
+        self.damage_allocation[Choice.ROCK] = rock
+        self.damage_allocation[Choice.PAPER] = paper
+    
+    def get_damage_allocation(self) -> Dict[Choice, int]:
+        """데미지 배분 반환"""
+        return self.damage_allocation.copy()
+    
+    def get_damage_allocation_tuple(self) -> Tuple[int, int, int]:
+        """데미지 배분을 튜플로 반환 (가위, 바위, 보 순서)"""
+        return (self.damage_allocation[Choice.SCISSORS],
+                self.damage_allocation[Choice.ROCK],
+                self.damage_allocation[Choice.PAPER])
+    
+    def set_choice(self, choice: Choice):
+        """선택 설정"""
+        # 연속 선택 체크
+        if self.last_choice == choice:
+            self.consecutive_choices += 1
+        else:
+            self.consecutive_choices = 1
+        
+        self.last_choice = choice
+        self.current_choice = choice
+        
+        # 특수 능력 체크
+        self.check_special_ability()
+    
+    def check_special_ability(self):
+        """특수 능력 체크"""
+        if self.consecutive_choices >= 2:
+            self.special_ability_active = True
+        else:
+            self.special_ability_active = False
+    
+    def get_choice(self) -> Choice:
+        """현재 선택 반환"""
+        return self.current_choice
+    
+    def take_damage(self, damage: int):
+        """데미지 받기"""
+        # 방어 보너스 적용
+        if self.defense_bonus:
+            damage = max(1, damage // 2)  # 데미지 절반으로 감소 (최소 1)
+            self.defense_bonus = False  # 한 번만 적용
+        
+        self.health = max(0, self.health - damage)
+    
+    def is_alive(self) -> bool:
+        """생존 여부 확인"""
+        return self.health > 0
+    
+    def get_health_percentage(self) -> float:
+        """체력 백분율 반환"""
+        return self.health / self.max_health
+    
+    def reset_choice(self):
+        """선택 초기화"""
+        self.current_choice = None
+        # 특수 능력은 유지 (다음 라운드까지)
+    
+    def apply_rock_special_ability(self):
+        """바위 특수 능력 적용 (방어 보너스)"""
+        self.defense_bonus = True
+    
+    def get_special_ability_damage_multiplier(self) -> float:
+        """특수 능력 데미지 배율 반환"""
+        if not self.special_ability_active:
+            return 1.0
+        
+        # 가위: 연속 공격 (1.5배)
+        if self.current_choice == Choice.SCISSORS:
+            return 1.5
+        # 보: 복사 능력 (기본 1.0배, 하지만 다른 효과)
+        elif self.current_choice == Choice.PAPER:
+            return 1.0
+        # 바위: 방어 능력 (기본 1.0배, 하지만 데미지 감소)
+        else:
+            return 1.0
+    
+    def record_win(self):
+        """승리 기록"""
+        self.consecutive_wins += 1
+        self.consecutive_losses = 0
+        
+        # 3연속 승리 보너스
+        if self.consecutive_wins >= 3:
+            self.bonus_damage = 1.5
+    
+    def record_loss(self):
+        """패배 기록"""
+        self.consecutive_losses += 1
+        self.consecutive_wins = 0
+        
+        # 3연속 패배 보너스 (다음 승리 시 2배 데미지)
+        if self.consecutive_losses >= 3:
+            self.bonus_damage = 2.0
+    
+    def get_bonus_damage_multiplier(self) -> float:
+        """보너스 데미지 배율 반환"""
+        return self.bonus_damage if self.bonus_damage > 0 else 1.0
+    
+    def reset_bonus_damage(self):
+        """보너스 데미지 리셋"""
+        self.bonus_damage = 0
+    
+    def get_total_damage(self) -> int:
+        """총 데미지 반환"""
+        return sum(self.damage_allocation.values())
+
+class MatchEngine:
+    def __init__(self, player: PlayerState, computer: PlayerState):
+        """대전 엔진 초기화"""
+        self.player = player
+        self.computer = computer
+    
+    def setup_computer_damage(self, difficulty: Optional[float] = None, table=None):
+        """컴퓨터 데미지 배분 설정"""
+        # 배분 표가 있으면 난이도에 맞는 배분 선택 (allocation_optimizer.AllocationTable)
+        if table is not None and difficulty is not None:
+            self.computer.set_damage_allocation(*table.pick(difficulty))
+            return
+        
+        # 랜덤하게 데미지 배분 (총합 20)
+        self.computer.set_damage_allocation(*random_allocation())
+    
+    def get_winner(self, choice1: Choice, choice2: Choice) -> Optional[PlayerState]:
+        """승자 결정"""
+        if choice1 == choice2:
+            return None  # 무승부
+        
+        # 상성 규칙
+        if (choice1 == Choice.SCISSORS and choice2 == Choice.PAPER) or \
+           (choice1 == Choice.ROCK and choice2 == Choice.SCISSORS) or \
+           (choice1 == Choice.PAPER and choice2 == Choice.ROCK):
+            return self.player
+        else:
+            return self.computer
+    
+    def calculate_damage(self, winner: PlayerState, choice: Choice) -> int:
+        """데미지 계산"""
+        base_damage = winner.damage_allocation[choice]
+        
+        # 특수 능력 적용
+        special_multiplier = winner.get_special_ability_damage_multiplier()
+        
+        # 연속 보너스 적용
+        bonus_multiplier = winner.get_bonus_damage_multiplier()
+        
+        # 최종 데미지 계산
+        final_damage = int(base_damage * special_multiplier * bonus_multiplier)
+        
+        return final_damage
+    
+    def process_round(self) -> Optional[dict]:
+        """라운드 처리 (양쪽 선택이 없으면 None 반환)"""
+        player_choice = self.player.get_choice()
+        computer_choice = self.computer.get_choice()
+        
+        if player_choice is None or computer_choice is None:
+            return None
+        
+        # AI가 플레이어 선택 기록
+        if hasattr(self.computer, 'record_player_choice'):
+            self.computer.record_player_choice(player_choice)
+            self.computer.record_ai_choice(computer_choice)
+        
+        winner = self.get_winner(player_choice, computer_choice)
+        
+        if winner:
+            damage = self.calculate_damage(winner, winner.get_choice())
+            loser = self.computer if winner == self.player else self.player
+            
+            # 바위 특수 능력 적용 (승리한 플레이어가 바위를 선택했을 때)
+            if winner.get_choice() == Choice.ROCK and winner.special_ability_active:
+                winner.apply_rock_special_ability()
+            
+            # 연속 보너스 적용
+            winner.record_win()
+            loser.record_loss()
+            
+            # 보너스 데미지 사용 후 리셋
+            if winner.bonus_damage > 0:
+                winner.reset_bonus_damage()
+            
+            loser.take_damage(damage)
+        else:
+            damage = 0
+        
+        # AI가 라운드 결과 기록
+        if hasattr(self.computer, 'record_round_result'):
+            self.computer.record_round_result(player_choice, computer_choice, winner)
+        
+        return {
+            'player_choice': player_choice,
+            'computer_choice': computer_choice,
+            'winner': winner,
+            'damage': damage
+        }
+    
+    def play_round(self, player_choice: Choice, computer_choice: Choice) -> dict:
+        """양쪽 선택을 설정하고 라운드를 처리한 뒤 선택 초기화"""
+        self.player.set_choice(player_choice)
+        self.computer.set_choice(computer_choice)
+        result = self.process_round()
+        self.player.reset_choice()
+        self.computer.reset_choice()
+        return result
+    
+    def is_over(self) -> bool:
+        """대전 종료 여부 확인"""
+        return not self.player.is_alive() or not self.computer.is_alive()
+    
+    def get_winner_player(self) -> Optional[PlayerState]:
+        """대전 승자 반환"""
+        if not self.player.is_alive():
+            return self.computer
+        elif not self.computer.is_alive():
+            return self.player
+        return None
+    
+    def reset(self):
+        """체력과 선택 초기화"""
+        self.player.health = self.player.max_health
+        self.computer.health = self.computer.max_health
+        self.player.reset_choice()
+        self.computer.reset_choice()
@@ -0,0 +1,20 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+입력 대기
+움직이는 것이 없는 화면에서는 이벤트가 올 때까지 잠들어 CPU를 쓰지 않도록
+게임 루프가 한 프레임에 처리할 이벤트 목록을 가져옵니다.
+"""
+
+import pygame
+
+def wait_events(animating: bool, idle_timeout: int = 1000) -> list:
+    """애니메이션 중이면 바로, 아니면 이벤트가 올 때까지 (최대 idle_timeout ms) 기다렸다가 이벤트 목록 반환"""
+    if animating:
+        return pygame.event.get()
+    
+    # 마우스 이동(호버), 클릭, 키 입력이 오면 깨어남
+    first = pygame.event.wait(idle_timeout)
+    events = [] if first.type == pygame.NOEVENT else [first]
+    events.extend(pygame.event.get())
+    return events
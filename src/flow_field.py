@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+흐름장 (flow field)
+화면을 격자로 나눠 목표 칸까지의 BFS 거리를 한 번 계산하고
+칸마다 목표 쪽으로 한 칸 가까워지는 방향을 저장해 둡니다.
+추적하는 오브젝트는 자기 칸의 방향만 읽으면 되므로 수가 많아도 길찾기 비용이 늘지 않습니다.
+"""
+
+import numpy as np
+from typing import Optional, Tuple
+
+# 이웃 칸 방향 (오른쪽, 왼쪽, 아래, 위)
+NEIGHBOURS = np.array([(1, 0), (-1, 0), (0, 1), (0, -1)], dtype=np.int8)
+
+class FlowField:
+    def __init__(self, width: int, height: int, cell_size: int = 32, blocked: Optional[np.ndarray] = None):
+        """흐름장 초기화 (blocked: 지나갈 수 없는 칸 표시, rows x columns)"""
+        self.width = width
+        self.height = height
+        self.cell_size = cell_size
+        self.columns = -(-width // cell_size)
+        self.rows = -(-height // cell_size)
+        shape = (self.rows, self.columns)
+        self.blocked = np.zeros(shape, dtype=bool) if blocked is None else np.asarray(blocked, dtype=bool)
+        
+        self.distance = np.full(shape, -1, dtype=np.int32)  # 목표 칸까지 칸 수 (-1: 갈 수 없음)
+        self.dx = np.zeros(shape, dtype=np.int8)
+        self.dy = np.zeros(shape, dtype=np.int8)
+        self.target_cell: Optional[Tuple[int, int]] = None
+        self.builds = 0
+    
+    def cell_of(self, pos: Tuple[float, float]) -> Tuple[int, int]:
+        """좌표가 속한 칸 (column, row), 화면 밖이면 가장 가까운 칸"""
+        column = min(max(int(pos[0]) // self.cell_size, 0), self.columns - 1)
+        row = min(max(int(pos[1]) // self.cell_size, 0), self.rows - 1)
+        return (column, row)
+    
+    def set_target(self, pos: Tuple[float, float]) -> bool:
+        """목표 위치 설정 (목표 칸이 바뀐 경우에만 다시 계산하고 True 반환)"""
+        cell = self.cell_of(pos)
+        if cell == self.target_cell:
+            return False
+        self.target_cell = cell
+        self._build()
+        return True
+    
+    def set_blocked(self, blocked: np.ndarray):
+        """막힌 칸 변경 (목표가 있으면 바로 다시 계산)"""
+        self.blocked = np.asarray(blocked, dtype=bool)
+        if self.target_cell is not None:
+            self._build()
+    
+    def _build(self):
+        """목표 칸에서 BFS로 거리와 방향 계산 (파면 전체를 배열 연산으로 한 칸씩 넓힘)"""
+        column, row = self.target_cell
+        distance = np.full((self.rows, self.columns), -1, dtype=np.int32)
+        passable = ~self.blocked
+        frontier = np.zeros_like(passable)
+        frontier[row, column] = True
+        
+        step = 0
+        while frontier.any():
+            distance[frontier] = step
+            grown = np.zeros_like(frontier)
+            grown[:, 1:] |= frontier[:, :-1]
+            grown[:, :-1] |= frontier[:, 1:]
+            grown[1:] |= frontier[:-1]
+            grown[:-1] |= frontier[1:]
+            frontier = grown & passable & (distance < 0)
+            step += 1
+        
+        # 이웃 중 가장 가까운 칸 쪽으로 (격자 밖과 갈 수 없는 칸은 무한대 취급)
+        far = np.iinfo(np.int32).max
+        cost = np.where(distance < 0, far, distance)
+        padded = np.pad(cost, 1, constant_values=far)
+        neighbours = np.stack((padded[1:-1, 2:], padded[1:-1, :-2], padded[2:, 1:-1], padded[:-2, 1:-1]))
+        best = neighbours.argmin(axis=0)
+        # 목표 칸과 갈 수 없는 칸은 멈춤
+        moving = neighbours.min(axis=0) < cost
+        self.dx = np.where(moving, NEIGHBOURS[best, 0], 0).astype(np.int8)
+        self.dy = np.where(moving, NEIGHBOURS[best, 1], 0).astype(np.int8)
+        self.distance = distance
+        self.builds += 1
+    
+    def sample(self, xs: np.ndarray, ys: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """좌표 배열들이 속한 칸의 이동 방향 (dx 배열, dy 배열)"""
+        columns = np.clip(xs // self.cell_size, 0, self.columns - 1)
+        rows = np.clip(ys // self.cell_size, 0, self.rows - 1)
+        return self.dx[rows, columns], self.dy[rows, columns]
@@ -7,38 +7,155 @@
 import pygame
 import os
 import sys
+import json
+import hashlib
+from collections import OrderedDict
+from typing import Dict, List, Optional
 
-def get_korean_font(size: int) -> pygame.font.Font:
-    """한글 폰트를 로드합니다."""
+# Windows에서 사용 가능한 한글 폰트 목록
+KOREAN_FONTS = [
+    "Malgun Gothic",      # 맑은 고딕
+    "Nanum Gothic",       # 나눔고딕
+    "Dotum",              # 돋움
+    "Gulim",              # 굴림
+    "Batang",             # 바탕
+    "Arial Unicode MS",   # Arial Unicode
+    "Microsoft YaHei",    # 마이크로소프트 야헤이
+]
+
+def font_directories() -> List[str]:
+    """플랫폼별 시스템 폰트 폴더 목록"""
+    home = os.path.expanduser("~")
+    if sys.platform.startswith("win"):
+        return [os.path.join(os.environ.get("WINDIR", "C:\\Windows"), "Fonts"),
+                os.path.join(os.environ.get("LOCALAPPDATA", home), "Microsoft", "Windows", "Fonts")]
+    if sys.platform == "darwin":
+        return ["/Library/Fonts", "/System/Library/Fonts", os.path.join(home, "Library", "Fonts")]
+    return ["/usr/share/fonts", "/usr/local/share/fonts",
+            os.path.join(home, ".fonts"), os.path.join(home, ".local", "share", "fonts")]
+
+def font_directories_fingerprint() -> str:
+    """폰트 폴더 지문 (최상위 폴더 수정 시각만 사용, 하위 폴더는 훑지 않음)"""
+    # 폰트 패키지를 설치/삭제하면 보통 최상위 폴더의 항목이 바뀌고,
+    # 캐시된 파일이 지워진 경우는 resolve_face에서 경로 존재 여부로 따로 확인함
+    digest = hashlib.sha1("|".join(KOREAN_FONTS).encode("utf-8"))
+    for dir_path in font_directories():
+        try:
+            mtime = os.stat(dir_path).st_mtime_ns
+        except OSError:
+            mtime = None
+        digest.update(f"{dir_path}:{mtime};".encode("utf-8", "surrogateescape"))
+    return digest.hexdigest()
+
+def default_font_index_path() -> str:
+    """폰트 탐색 결과 캐시 파일 위치"""
+    base = os.environ.get("XDG_CACHE_HOME") or os.environ.get("LOCALAPPDATA") or \
+        os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "protoType", "font_index.json")
+
+class FontRegistry:
+    def __init__(self, index_path: Optional[str] = None):
+        """프로세스 전체 폰트 레지스트리 초기화"""
+        self.fonts: Dict[int, pygame.font.Font] = {}
+        self.index_path = index_path or default_font_index_path()
+        self.font_path: Optional[str] = None  # None이면 pygame 기본 폰트
+        self.face_name: Optional[str] = None
+        self.resolved = False
+        self.index_hit = False
     
-    # Windows에서 사용 가능한 한글 폰트 목록
-    korean_fonts = [
-        "Malgun Gothic",      # 맑은 고딕
-        "Nanum Gothic",       # 나눔고딕
-        "Dotum",              # 돋움
-        "Gulim",              # 굴림
-        "Batang",             # 바탕
-        "Arial Unicode MS",   # Arial Unicode
-        "Microsoft YaHei",    # 마이크로소프트 야헤이
-    ]
+    def resolve_face(self) -> Optional[str]:
+        """한글을 렌더링할 수 있는 폰트 파일을 한 번만 찾습니다. (디스크 캐시 우선)"""
+        if self.resolved:
+            return self.font_path
+        
+        fingerprint = font_directories_fingerprint()
+        index = self._load_index()
+        if index is not None and index.get('fingerprint') == fingerprint and \
+                (index.get('path') is None or os.path.exists(index['path'])):
+            # 지문이 같으면 시스템 폰트 목록을 다시 만들지 않고 파일을 바로 사용
+            self.font_path = index.get('path')
+            self.face_name = index.get('face_name')
+            self.index_hit = True
+        else:
+            self._discover()
+            self._save_index(fingerprint)
+        
+        self.resolved = True
+        return self.font_path
     
-    # 폰트 로드 시도
-    for font_name in korean_fonts:
+    def _discover(self):
+        """시스템 폰트에서 한글 폰트 파일 찾기"""
+        for font_name in KOREAN_FONTS:
+            try:
+                path = pygame.font.match_font(font_name)
+                if not path:
+                    continue
+                font = pygame.font.Font(path, 24)
+                # 테스트: 한글 문자 렌더링 가능한지 확인
+                test_surface = font.render("가", True, (255, 255, 255))
+                if test_surface.get_width() > 0:
+                    self.font_path = path
+                    self.face_name = font_name
+                    return
+            except:
+                continue
+    
+    def _load_index(self) -> Optional[dict]:
+        """디스크 캐시 읽기 (없거나 깨졌으면 None)"""
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+    
+    def _save_index(self, fingerprint: str):
+        """디스크 캐시 쓰기 (실패해도 게임은 계속)"""
+        index = {'fingerprint': fingerprint, 'path': self.font_path, 'face_name': self.face_name}
+        try:
+            os.makedirs(os.path.dirname(self.index_path), exist_ok=True)
+            with open(self.index_path, "w", encoding="utf-8") as f:
+                json.dump(index, f, ensure_ascii=False)
+        except OSError:
+            pass
+    
+    def get(self, size: int) -> pygame.font.Font:
+        """크기별 공유 폰트 반환 (처음 요청할 때 생성)"""
+        font = self.fonts.get(size)
+        if font is None:
+            font = self._create(size)
+            self.fonts[size] = font
+        return font
+    
+    def _create(self, size: int) -> pygame.font.Font:
+        """찾아 둔 폰트 파일로 새 Font 생성"""
+        font_path = self.resolve_face()
+        if font_path is not None:
+            try:
+                return pygame.font.Font(font_path, size)
+            except:
+                pass
+        
+        # 한글 폰트를 찾지 못하면 기본 폰트 사용
         try:
-            font = pygame.font.SysFont(font_name, size)
-            # 테스트: 한글 문자 렌더링 가능한지 확인
-            test_surface = font.render("가", True, (255, 255, 255))
-            if test_surface.get_width() > 0:
-                return font
+            return pygame.font.Font(None, size)
         except:
-            continue
+            # 최후의 수단: 기본 폰트
+            return pygame.font.SysFont("arial", size)
     
-    # 시스템 폰트로도 실패하면 기본 폰트 사용
-    try:
-        return pygame.font.Font(None, size)
-    except:
-        # 최후의 수단: 기본 폰트
-        return pygame.font.SysFont("arial", size)
+    def clear(self):
+        """생성한 폰트와 찾은 폰트 정보 모두 버리기 (pygame 재초기화 후 사용)"""
+        self.fonts.clear()
+        self.font_path = None
+        self.face_name = None
+        self.resolved = False
+        self.index_hit = False
+
+# 프로세스 전체에서 공유하는 폰트 레지스트리
+font_registry = FontRegistry()
+
+def get_korean_font(size: int) -> pygame.font.Font:
+    """한글 폰트를 로드합니다. (같은 크기는 같은 Font 객체를 공유)"""
+    return font_registry.get(size)
 
 def get_font_with_fallback(size: int, fallback_size: int = None) -> pygame.font.Font:
     """폰트를 로드하고 실패 시 fallback 폰트를 사용합니다."""
@@ -53,10 +170,68 @@ def get_font_with_fallback(size: int, fallback_size: int = None) -> pygame.font.
         except:
             return pygame.font.SysFont("arial", fallback_size)
 
-def render_text_safe(font: pygame.font.Font, text: str, color: tuple) -> pygame.Surface:
-    """안전하게 텍스트를 렌더링합니다."""
+class TextSurfaceCache:
+    def __init__(self, max_size: int = 512):
+        """렌더링된 텍스트 Surface LRU 캐시 초기화"""
+        self.max_size = max_size
+        self.surfaces: "OrderedDict[tuple, pygame.Surface]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def get(self, key: tuple) -> Optional[pygame.Surface]:
+        """캐시된 Surface 반환 (없으면 None)"""
+        surface = self.surfaces.get(key)
+        if surface is None:
+            self.misses += 1
+            return None
+        
+        self.surfaces.move_to_end(key)
+        self.hits += 1
+        return surface
+    
+    def put(self, key: tuple, surface: pygame.Surface):
+        """Surface 저장 (가장 오래 쓰지 않은 항목부터 제거)"""
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_size:
+            self.surfaces.popitem(last=False)
+            self.evictions += 1
+    
+    def clear(self):
+        """캐시 비우기"""
+        self.surfaces.clear()
+    
+    def get_stats(self) -> dict:
+        """적중/실패 횟수와 적중률 반환"""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'size': len(self.surfaces),
+            'hit_rate': self.hits / lookups if lookups else 0.0
+        }
+
+# 프로세스 전체에서 공유하는 텍스트 캐시
+text_cache = TextSurfaceCache()
+
+def render_text_safe(font: pygame.font.Font, text: str, color: tuple, antialias: bool = True) -> pygame.Surface:
+    """안전하게 텍스트를 렌더링합니다. (같은 폰트/텍스트/색상은 캐시된 Surface를 공유하므로 수정하지 마세요)"""
+    key = (font, text, tuple(color), antialias)
+    surface = text_cache.get(key)
+    if surface is None:
+        surface = _render_text(font, text, color, antialias)
+        text_cache.put(key, surface)
+    return surface
+
+def get_text_cache_stats() -> dict:
+    """텍스트 캐시 통계 반환"""
+    return text_cache.get_stats()
+
+def _render_text(font: pygame.font.Font, text: str, color: tuple, antialias: bool) -> pygame.Surface:
+    """텍스트 렌더링 (한글 렌더링 실패 시 영어로 대체)"""
     try:
-        return font.render(text, True, color)
+        return font.render(text, antialias, color)
     except:
         # 한글이 깨지면 영어로 표시
         english_text = text.replace("가위", "Scissors").replace("바위", "Rock").replace("보", "Paper")
@@ -67,4 +242,4 @@ def render_text_safe(font: pygame.font.Font, text: str, color: tuple) -> pygame.
         english_text = english_text.replace("확인", "OK").replace("다음 라운드", "Next Round")
         english_text = english_text.replace("재시작", "Restart")
         
-        return font.render(english_text, True, color)
+        return font.render(english_text, antialias, color)
@@ -5,12 +5,15 @@
 """
 
 import pygame
-import random
+import numpy as np
 from typing import Tuple, Optional
 from enum import Enum
 from .player import Player, Choice
 from .ai_player import AIPlayer
+from .engine import MatchEngine
+from .allocation_optimizer import load_allocation_table
 from .font_utils import get_korean_font
+from .particles import ParticleSystem
 
 class GameState(Enum):
     MODE_SELECTION = "모드 선택"
@@ -25,13 +28,16 @@ class GameMode(Enum):
     STORY = "스토리모드"
 
 class GameManager:
-    def __init__(self):
+    def __init__(self, screen_size: Tuple[int, int] = (800, 600)):
         """게임 매니저 초기화"""
         self.state = GameState.MODE_SELECTION
         self.game_mode = None
         self.player = Player("플레이어", 50, 100)
         self.computer = AIPlayer("컴퓨터", 550, 100)
         
+        # 규칙 엔진 (pygame 비의존)
+        self.engine = MatchEngine(self.player, self.computer)
+        
         # 라운드 정보
         self.round_number = 1
         self.round_result = None
@@ -39,9 +45,13 @@ class GameManager:
         
         # 애니메이션 관련 속성
         self.animation_frame = 0
-        self.animation_duration = 120  # 2초 (60fps 기준)
+        self.animation_duration = 120  # 2초 (60Hz 고정 스텝 기준)
+        self.animation_alpha = 1.0  # 그리기 보간 비율 (고정 스텝 사이 진행도)
         self.dead_player = None  # 사망한 플레이어
-        self.health_bar_fragments = []  # 체력바 파편들
+        self.fragment_count = 400  # 체력바 파편 수
+        self.health_bar_particles = ParticleSystem(capacity=4096, gravity=0.3,  # 중력 효과
+                                                   bounds=pygame.Rect((0, 0), screen_size))
+        self.rng = np.random.default_rng()
         
         # UI 요소 - 한글 폰트 사용
         self.font = get_korean_font(36)
@@ -74,92 +84,30 @@ class GameManager:
         self.game_mode = None
         print("홈 화면으로 돌아갑니다.")
     
-    def setup_computer_damage(self):
-        """컴퓨터 데미지 배분 설정"""
-        # 랜덤하게 데미지 배분 (총합 20)
-        total = 20
-        scissors = random.randint(0, total)
-        remaining = total - scissors
-        rock = random.randint(0, remaining)
-        paper = remaining - rock
-        
-        self.computer.set_damage_allocation(scissors, rock, paper)
+    def setup_computer_damage(self, difficulty: Optional[float] = None):
+        """컴퓨터 데미지 배분 설정 (난이도가 주어지면 배분 표에서 선택)"""
+        table = load_allocation_table() if difficulty is not None else None
+        self.engine.setup_computer_damage(difficulty, table)
     
     def get_winner(self, choice1: Choice, choice2: Choice) -> Optional[Player]:
         """승자 결정"""
-        if choice1 == choice2:
-            return None  # 무승부
-        
-        # 상성 규칙
-        if (choice1 == Choice.SCISSORS and choice2 == Choice.PAPER) or \
-           (choice1 == Choice.ROCK and choice2 == Choice.SCISSORS) or \
-           (choice1 == Choice.PAPER and choice2 == Choice.ROCK):
-            return self.player
-        else:
-            return self.computer
+        return self.engine.get_winner(choice1, choice2)
     
     def calculate_damage(self, winner: Player, choice: Choice) -> int:
         """데미지 계산"""
-        base_damage = winner.damage_allocation[choice]
-        
-        # 특수 능력 적용
-        special_multiplier = winner.get_special_ability_damage_multiplier()
-        
-        # 연속 보너스 적용
-        bonus_multiplier = winner.get_bonus_damage_multiplier()
-        
-        # 최종 데미지 계산
-        final_damage = int(base_damage * special_multiplier * bonus_multiplier)
-        
-        return final_damage
+        return self.engine.calculate_damage(winner, choice)
     
     def process_round(self):
         """라운드 처리"""
-        player_choice = self.player.get_choice()
-        computer_choice = self.computer.get_choice()
-        
-        if player_choice is None or computer_choice is None:
+        result = self.engine.process_round()
+        if result is None:
             return
         
-        # AI가 플레이어 선택 기록
-        self.computer.record_player_choice(player_choice)
-        self.computer.record_ai_choice(computer_choice)
-        
-        winner = self.get_winner(player_choice, computer_choice)
-        
-        if winner:
-            damage = self.calculate_damage(winner, winner.get_choice())
-            loser = self.computer if winner == self.player else self.player
-            
-            # 바위 특수 능력 적용 (승리한 플레이어가 바위를 선택했을 때)
-            if winner.get_choice() == Choice.ROCK and winner.special_ability_active:
-                winner.apply_rock_special_ability()
-            
-            # 연속 보너스 적용
-            winner.record_win()
-            loser.record_loss()
-            
-            # 보너스 데미지 사용 후 리셋
-            if winner.bonus_damage > 0:
-                winner.reset_bonus_damage()
-            
-            loser.take_damage(damage)
-            self.round_damage = damage
-        else:
-            self.round_damage = 0
-        
-        # AI가 라운드 결과 기록
-        self.computer.record_round_result(player_choice, computer_choice, winner)
-        
-        self.round_result = {
-            'player_choice': player_choice,
-            'computer_choice': computer_choice,
-            'winner': winner,
-            'damage': self.round_damage
-        }
+        self.round_damage = result['damage']
+        self.round_result = result
         
         # 체력이 0 이하가 되었는지 확인
-        if not self.player.is_alive() or not self.computer.is_alive():
+        if self.engine.is_over():
             dead_player = self.computer if not self.computer.is_alive() else self.player
             self.start_death_animation(dead_player)
         else:
@@ -175,7 +123,7 @@ class GameManager:
     
     def check_game_over(self) -> bool:
         """게임 종료 확인"""
-        if not self.player.is_alive() or not self.computer.is_alive():
+        if self.engine.is_over():
             if self.state != GameState.DEATH_ANIMATION:  # 이미 애니메이션 중이면 무시
                 self.state = GameState.GAME_OVER
             return True
@@ -183,16 +131,15 @@ class GameManager:
     
     def get_winner_player(self) -> Optional[Player]:
         """게임 승자 반환"""
-        if not self.player.is_alive():
-            return self.computer
-        elif not self.computer.is_alive():
-            return self.player
-        return None
+        return self.engine.get_winner_player()
     
-    def computer_choose(self):
-        """컴퓨터 선택"""
-        # AI 패턴 분석 기반 선택
-        choice = self.computer.make_choice()
+    def computer_choose(self, planned: Optional[Tuple[Choice, str]] = None):
+        """컴퓨터 선택 (미리 계산한 (선택, 분석 메시지)가 있으면 사용)"""
+        if planned is not None:
+            choice, self.computer.analysis_message = planned
+        else:
+            # AI 패턴 분석 기반 선택
+            choice = self.computer.make_choice()
         self.computer.set_choice(choice)
     
     def get_state(self) -> GameState:
@@ -214,54 +161,45 @@ class GameManager:
     
     def reset_game(self):
         """게임 리셋"""
-        self.player.health = self.player.max_health
-        self.computer.health = self.computer.max_health
-        self.player.reset_choice()
-        self.computer.reset_choice()
+        self.engine.reset()
         self.round_number = 1
         self.round_result = None
         self.state = GameState.MODE_SELECTION
         self.game_mode = None
         self.setup_computer_damage()
-
+    
     def start_death_animation(self, dead_player: Player):
         """사망 애니메이션 시작"""
         self.dead_player = dead_player
         self.animation_frame = 0
+        self.animation_alpha = 1.0
         self.state = GameState.DEATH_ANIMATION
         self.create_health_bar_fragments()
         print(f"{dead_player.name} 사망! 애니메이션 시작...")
     
     def create_health_bar_fragments(self):
         """체력바 파편 생성"""
-        self.health_bar_fragments = []
+        self.health_bar_particles.clear()
         # 체력바 위치에 파편들 생성
         if self.dead_player == self.player:
             base_x, base_y = 50, 100
         else:
             base_x, base_y = 550, 100
         
-        # 여러 개의 파편 생성
-        for i in range(8):
-            fragment = {
-                'x': base_x + i * 10,
-                'y': base_y,
-                'vx': random.randint(-5, 5),
-                'vy': random.randint(-8, -2),
-                'size': random.randint(3, 8),
-                'color': self.RED
-            }
-            self.health_bar_fragments.append(fragment)
+        # 체력바 너비 (200)를 따라 파편들을 흩뿌림
+        count = self.fragment_count
+        positions = np.column_stack((base_x + self.rng.uniform(0, 200, count), np.full(count, base_y)))
+        velocities = np.column_stack((self.rng.uniform(-5, 5, count), self.rng.uniform(-8, -2, count)))
+        sizes = self.rng.integers(3, 9, count)
+        lifetimes = np.full(count, self.animation_duration)
+        self.health_bar_particles.emit(positions, velocities, sizes, [self.RED], lifetimes)
     
     def update_death_animation(self):
-        """사망 애니메이션 업데이트"""
+        """사망 애니메이션 고정 스텝 하나 진행"""
         self.animation_frame += 1
         
-        # 파편들 업데이트
-        for fragment in self.health_bar_fragments:
-            fragment['x'] += fragment['vx']
-            fragment['y'] += fragment['vy']
-            fragment['vy'] += 0.3  # 중력 효과
+        # 파편들 업데이트 (이동, 중력, 화면 밖 제거)
+        self.health_bar_particles.update()
         
         # 애니메이션 완료 확인
         if self.animation_frame >= self.animation_duration:
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+글자 단위 렌더링 캐시 (글리프 아틀라스)
+숫자가 자주 바뀌는 HUD 문자열을 문자열 단위로 캐시하면 적중률이 낮으므로
+(폰트, 색상)마다 글자 Surface를 미리 만들어 두고 blit만으로 문자열을 그립니다.
+글자 위치는 폰트가 문자열 전체를 렌더링할 때와 같도록 font.size로 잽니다 (커닝 포함).
+잰 위치는 문자열마다 캐시하므로 같은 문자열을 다시 그릴 때는 blit만 합니다.
+"""
+
+import string
+from collections import OrderedDict
+import pygame
+from typing import Dict, List, Optional, Tuple
+from .font_utils import render_text_safe
+
+# 미리 만들어 둘 글자: 숫자, 영문, 기호, 게임 HUD에서 쓰는 한글
+HUD_HANGUL = "라운드총합데미지배분가위바보선택플레이어컴퓨터체력"
+DEFAULT_CHARSET = string.digits + string.ascii_letters + " :/|()+-.,!?%" + HUD_HANGUL
+
+# 아틀라스마다 위치를 기억해 둘 문자열 수 (HUD 문자열 종류보다 넉넉하게)
+LAYOUT_CACHE_SIZE = 256
+
+# 글자 렌더링이나 크기 측정이 실패할 때 pygame이 내는 예외
+RENDER_ERRORS = (pygame.error, UnicodeError, ValueError)
+
+class GlyphAtlas:
+    def __init__(self, font: pygame.font.Font, color: Tuple[int, int, int], antialias: bool = True,
+                 charset: str = DEFAULT_CHARSET):
+        """(폰트, 색상) 글리프 아틀라스 초기화 (charset 글자는 미리 렌더링)"""
+        self.font = font
+        self.color = tuple(color)
+        self.antialias = antialias
+        self.glyphs: Dict[str, Tuple[pygame.Surface, int]] = {}  # 글자 -> (Surface, 너비)
+        self.height = font.get_height()
+        self.layouts: "OrderedDict[str, Tuple[List[Tuple[pygame.Surface, int]], int]]" = OrderedDict()  # 문자열 -> ((글자, x 위치) 목록, 너비)
+        for char in charset:
+            self.glyph(char)
+    
+    def glyph(self, char: str) -> Tuple[pygame.Surface, int]:
+        """글자 (Surface, 너비) 반환 (처음 쓰는 글자는 렌더링해서 추가)"""
+        entry = self.glyphs.get(char)
+        if entry is None:
+            surface = self.font.render(char, self.antialias, self.color)
+            entry = self.glyphs[char] = (surface, surface.get_width())
+        return entry
+    
+    def _measure(self, text: str) -> Tuple[List[Tuple[pygame.Surface, int]], int]:
+        """문자열의 ((글자 Surface, x 위치) 목록, 너비) (캐시에 없으면 재서 넣고, 넘치면 가장 오래된 것 제거)"""
+        layouts = self.layouts
+        entry = layouts.get(text)
+        if entry is not None:
+            layouts.move_to_end(text)
+            return entry
+        # 글자 너비를 단순히 더하면 커닝이 빠져서 "11"처럼 폭이 달라짐
+        size = self.font.size
+        glyph = self.glyph
+        placed = []
+        for i, char in enumerate(text):
+            surface, width = glyph(char)
+            placed.append((surface, size(text[:i + 1])[0] - width))
+        entry = layouts[text] = (placed, size(text)[0] if text else 0)
+        if len(layouts) > LAYOUT_CACHE_SIZE:
+            layouts.popitem(last=False)
+        return entry
+    
+    def layout(self, text: str) -> List[int]:
+        """문자열 안 각 글자의 x 위치 (font.render와 같은 커닝/반올림 적용)"""
+        return [offset for _, offset in self._measure(text)[0]]
+    
+    def size(self, text: str) -> Tuple[int, int]:
+        """문자열을 그렸을 때의 (너비, 높이)"""
+        return self._measure(text)[1], self.height
+    
+    def draw(self, screen: pygame.Surface, text: str, pos: Tuple[int, int]) -> pygame.Rect:
+        """문자열을 글자 단위 blit으로 그리고 영역 반환 (pos는 왼쪽 위)"""
+        placed, width = self._measure(text)
+        x, y = pos
+        screen.blits([(surface, (x + offset, y)) for surface, offset in placed], False)
+        return pygame.Rect(x, y, width, self.height)
+
+# (폰트, 색상, 안티앨리어싱) -> 아틀라스
+_atlases: Dict[tuple, Optional[GlyphAtlas]] = {}
+
+def get_glyph_atlas(font: pygame.font.Font, color: Tuple[int, int, int], antialias: bool = True) -> Optional[GlyphAtlas]:
+    """공유 아틀라스 반환 (글자 렌더링이 불가능한 폰트면 None)"""
+    key = (font, tuple(color), antialias)
+    if key not in _atlases:
+        try:
+            _atlases[key] = GlyphAtlas(font, color, antialias)
+        except RENDER_ERRORS:
+            _atlases[key] = None
+    return _atlases[key]
+
+def clear_glyph_atlases():
+    """모든 아틀라스 제거 (pygame 재초기화 후 사용)"""
+    _atlases.clear()
+
+def draw_dynamic_text(screen: pygame.Surface, font: pygame.font.Font, text: str,
+                      color: Tuple[int, int, int], pos: Tuple[int, int]) -> pygame.Rect:
+    """자주 바뀌는 문자열 그리기 (아틀라스를 쓸 수 없으면 render_text_safe로 대체)"""
+    atlas = get_glyph_atlas(font, color)
+    if atlas is not None:
+        try:
+            return atlas.draw(screen, text, pos)
+        except RENDER_ERRORS:
+            pass
+    return screen.blit(render_text_safe(font, text, color), pos)
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+파티클 시스템
+위치, 속도, 크기, 색상, 수명을 미리 할당한 NumPy 배열에 담아
+고정 스텝 적분과 화면 밖 제거를 한 번에 처리하고
+크기/색상별로 미리 그려 둔 스프라이트를 screen.blits로 한꺼번에 그립니다.
+"""
+
+import numpy as np
+import pygame
+from typing import Dict, List, Optional, Sequence, Tuple
+
+class ParticleSystem:
+    def __init__(self, capacity: int = 4096, gravity: float = 0.3, bounds: Optional[pygame.Rect] = None):
+        """파티클 시스템 초기화 (bounds 밖으로 나간 파티클은 제거)"""
+        self.capacity = capacity
+        self.gravity = gravity
+        self.bounds = pygame.Rect(bounds) if bounds is not None else None
+        
+        # 살아 있는 파티클은 항상 배열 앞쪽 [0, count)에 모여 있음
+        self.count = 0
+        self.position = np.zeros((capacity, 2), dtype=np.float32)
+        self.previous = np.zeros((capacity, 2), dtype=np.float32)  # 직전 스텝 위치 (보간용)
+        self.velocity = np.zeros((capacity, 2), dtype=np.float32)
+        self.size = np.zeros(capacity, dtype=np.int16)
+        self.life = np.zeros(capacity, dtype=np.float32)  # 남은 스텝 수
+        self.sprite_index = np.zeros(capacity, dtype=np.int32)
+        
+        # (크기, 색상) -> 스프라이트 번호
+        self.sprite_keys: Dict[Tuple[int, Tuple[int, int, int]], int] = {}
+        self.sprites: List[pygame.Surface] = []
+    
+    def __len__(self) -> int:
+        """살아 있는 파티클 수"""
+        return self.count
+    
+    def _sprite(self, size: int, color: Tuple[int, int, int]) -> int:
+        """(크기, 색상) 원 스프라이트 번호 반환 (없으면 그려서 추가)"""
+        key = (int(size), tuple(int(c) for c in color))
+        index = self.sprite_keys.get(key)
+        if index is None:
+            radius = key[0]
+            # 알파 채널 대신 컬러키 + RLE 사용 (불투명 원은 이쪽이 훨씬 빠르게 blit됨)
+            colorkey = (255, 0, 255) if key[1] == (0, 0, 0) else (0, 0, 0)
+            sprite = pygame.Surface((radius * 2 + 1, radius * 2 + 1))
+            sprite.fill(colorkey)
+            pygame.draw.circle(sprite, key[1], (radius, radius), radius)
+            sprite.set_colorkey(colorkey, pygame.RLEACCEL)
+            if pygame.display.get_surface() is not None:
+                sprite = sprite.convert()
+            index = self.sprite_keys[key] = len(self.sprites)
+            self.sprites.append(sprite)
+        return index
+    
+    def emit(self, positions: np.ndarray, velocities: np.ndarray, sizes: np.ndarray,
+             colors: Sequence[Tuple[int, int, int]], lifetimes: Optional[np.ndarray] = None) -> int:
+        """파티클 여러 개 추가 (용량을 넘는 파티클은 버림), 추가된 수 반환"""
+        n = min(len(positions), self.capacity - self.count)
+        if n <= 0:
+            return 0
+        
+        start, end = self.count, self.count + n
+        sizes = np.asarray(sizes[:n], dtype=np.int16)
+        self.position[start:end] = positions[:n]
+        self.previous[start:end] = positions[:n]
+        self.velocity[start:end] = velocities[:n]
+        self.size[start:end] = sizes
+        self.life[start:end] = np.inf if lifetimes is None else lifetimes[:n]
+        
+        # 색상이 하나면 모든 파티클이 같은 색
+        if len(colors) == 1:
+            colors = [colors[0]] * n
+        self.sprite_index[start:end] = [self._sprite(size, color) for size, color in zip(sizes, colors)]
+        
+        self.count = end
+        return n
+    
+    def update(self):
+        """고정 스텝 하나 진행 (이동, 중력, 수명 감소, 화면 밖 제거)"""
+        n = self.count
+        if n == 0:
+            return
+        
+        position = self.position[:n]
+        self.previous[:n] = position
+        position += self.velocity[:n]
+        self.velocity[:n, 1] += self.gravity
+        self.life[:n] -= 1
+        
+        alive = self.life[:n] > 0
+        if self.bounds is not None:
+            # 중력 때문에 아래/옆으로 나간 파티클은 돌아오지 않음 (위로 나간 것은 다시 떨어짐)
+            size = self.size[:n]
+            alive &= position[:, 0] + size >= self.bounds.left
+            alive &= position[:, 0] - size < self.bounds.right
+            alive &= position[:, 1] - size < self.bounds.bottom
+        
+        if not alive.all():
+            self._compact(np.flatnonzero(alive))
+    
+    def _compact(self, keep: np.ndarray):
+        """살아남은 파티클만 배열 앞쪽으로 모으기"""
+        k = len(keep)
+        for array in (self.position, self.previous, self.velocity, self.size, self.life, self.sprite_index):
+            array[:k] = array[keep]
+        self.count = k
+    
+    def get_positions(self, alpha: float = 1.0) -> np.ndarray:
+        """보간된 정수 위치 배열 (count x 2)"""
+        n = self.count
+        previous = self.previous[:n]
+        return (previous + (self.position[:n] - previous) * alpha).astype(np.int32)
+    
+    def get_bounding_rect(self, alpha: float = 1.0) -> Optional[pygame.Rect]:
+        """모든 파티클을 감싸는 사각형 (파티클이 없으면 None)"""
+        if self.count == 0:
+            return None
+        positions = self.get_positions(alpha)
+        size = self.size[:self.count, None]
+        low = (positions - size).min(axis=0)
+        high = (positions + size).max(axis=0)
+        return pygame.Rect(int(low[0]), int(low[1]), int(high[0] - low[0]) + 1, int(high[1] - low[1]) + 1)
+    
+    def draw(self, screen: pygame.Surface, alpha: float = 1.0):
+        """모든 파티클을 스프라이트 blit 한 번으로 그리기"""
+        if self.count == 0:
+            return
+        corners = (self.get_positions(alpha) - self.size[:self.count, None]).tolist()
+        sprites = self.sprites
+        screen.blits([(sprites[index], corner) for index, corner in zip(self.sprite_index[:self.count].tolist(), corners)], False)
+    
+    def clear(self):
+        """모든 파티클 제거 (스프라이트는 재사용을 위해 유지)"""
+        self.count = 0
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+AI 플레이어 예측기 모음
+AIPlayerState의 기본 패턴 분석 옆에 붙여 쓰는 추가 예측기들입니다.
+선택은 engine.CHOICE_ORDER 인덱스 (0: 가위, 1: 바위, 2: 보)로 다룹니다.
+"""
+
+import numpy as np
+from collections import OrderedDict, deque
+from typing import List, Optional, Sequence
+
+# (플레이어 선택, AI 선택, 결과 코드) 조합 수
+TOKEN_COUNT = 27
+
+def encode_token(player_index: int, ai_index: int, outcome: int) -> int:
+    """한 라운드를 0 ~ 26 정수로 인코딩"""
+    return player_index * 9 + ai_index * 3 + outcome
+
+class ContextPredictor:
+    def __init__(self, max_order: int = 4, max_nodes: int = 4096,
+                 order_weights: Optional[Sequence[float]] = None):
+        """가변 차수 마르코프 예측기 초기화 (차수 1 ~ max_order)"""
+        if max_order < 1:
+            raise ValueError("max_order는 1 이상이어야 합니다!")
+        if max_nodes < 1:
+            raise ValueError("max_nodes는 1 이상이어야 합니다!")
+        self.max_order = max_order
+        self.max_nodes = max_nodes
+        
+        # 차수별 가중치 (기본: 긴 문맥일수록 높은 가중치)
+        if order_weights is None:
+            order_weights = [float(order) for order in range(1, max_order + 1)]
+        if len(order_weights) != max_order:
+            raise ValueError("order_weights 길이는 max_order와 같아야 합니다!")
+        self.order_weights = list(order_weights)
+        
+        # 문맥 키 -> 다음 플레이어 선택 횟수, 오래 쓰지 않은 문맥부터 제거 (LRU)
+        self.nodes: "OrderedDict[int, List[int]]" = OrderedDict()
+        self.history = deque(maxlen=max_order)
+        self.evictions = 0
+    
+    def _context_keys(self) -> List[int]:
+        """현재 기록으로 만들 수 있는 차수 1 ~ k 문맥 키 목록"""
+        # 최근 라운드부터 거꾸로 27진수로 쌓고, 차수를 섞어 차수별로 다른 키를 만듦
+        keys = []
+        code = 0
+        for order, token in enumerate(reversed(self.history), start=1):
+            code = code * TOKEN_COUNT + token
+            keys.append(code * (self.max_order + 1) + order)
+        return keys
+    
+    def update(self, player_index: int, ai_index: int, outcome: int):
+        """라운드 결과 반영 (이전 문맥들에 이번 플레이어 선택을 기록)"""
+        nodes = self.nodes
+        for key in self._context_keys():
+            counts = nodes.get(key)
+            if counts is None:
+                if len(nodes) >= self.max_nodes:
+                    nodes.popitem(last=False)
+                    self.evictions += 1
+                counts = nodes[key] = [0, 0, 0]
+            else:
+                nodes.move_to_end(key)
+            counts[player_index] += 1
+        
+        self.history.append(encode_token(player_index, ai_index, outcome))
+    
+    def predict(self) -> List[float]:
+        """다음 플레이어 선택 확률 [가위, 바위, 보] (아는 문맥이 없으면 균등 분포)"""
+        probabilities = [0.0, 0.0, 0.0]
+        total_weight = 0.0
+        for order, key in enumerate(self._context_keys(), start=1):
+            counts = self.nodes.get(key)
+            if counts is None:
+                continue
+            self.nodes.move_to_end(key)
+            total = counts[0] + counts[1] + counts[2]
+            weight = self.order_weights[order - 1]
+            for i in range(3):
+                probabilities[i] += weight * counts[i] / total
+            total_weight += weight
+        
+        if total_weight == 0.0:
+            return [1/3, 1/3, 1/3]
+        return [p / total_weight for p in probabilities]
+    
+    def reset(self):
+        """학습한 문맥 모두 제거"""
+        self.nodes.clear()
+        self.history.clear()
+        self.evictions = 0
+
+class EnsemblePredictor:
+    def __init__(self, windows: Sequence[int] = (5, 20, 100), decays: Sequence[float] = (0.5, 0.9, 0.99)):
+        """여러 후보 예측기 중 최근 성적이 가장 좋은 것을 고르는 메타 전략 (Iocaine Powder 방식)"""
+        self.windows = np.array(sorted(windows), dtype=np.int64)
+        self.max_window = int(self.windows[-1])
+        
+        # 최근 선택 기록 (원형 버퍼)
+        self.player_moves = np.zeros(self.max_window, dtype=np.int8)
+        self.ai_moves = np.zeros(self.max_window, dtype=np.int8)
+        self.count = 0
+        
+        # 마르코프 전이 횟수 (직전 플레이어 선택 / 직전 (플레이어, AI) 쌍 -> 다음 플레이어 선택)
+        self.transition = np.zeros((3, 3), dtype=np.int64)
+        self.pair_transition = np.zeros((9, 3), dtype=np.int64)
+        
+        # 기본 예측기: 각자 플레이어의 다음 선택 하나를 예측
+        self.base_names = ([f"player-frequency-{w}" for w in self.windows] +
+                           [f"ai-frequency-{w}" for w in self.windows] +
+                           ["markov", "markov-pair", "repeat", "mirror"])
+        
+        # 후보 = 기본 예측 x 회전 (0: 그대로, 1: 두 번 꼬기, 2: 세 번 꼬기)
+        self.names = [f"{name}+{rotation}" for name in self.base_names for rotation in range(3)]
+        self.rotations = np.arange(3, dtype=np.int8)
+        
+        # 감쇠율별 후보 점수 (감쇠율 수 x 후보 수)
+        self.decays = np.array(decays, dtype=np.float64)[:, None]
+        self.scores = np.zeros((len(decays), len(self.names)), dtype=np.float64)
+        
+        # 다음 라운드에 대한 후보들의 플레이어 선택 예측
+        self.pending: Optional[np.ndarray] = None
+    
+    def _base_predictions(self) -> np.ndarray:
+        """기본 예측기들의 다음 플레이어 선택 예측 배열"""
+        n = min(self.count, self.max_window)
+        recent = (self.count - 1 - np.arange(n)) % self.max_window  # 최근 순서
+        lengths = np.minimum(self.windows, n) - 1
+        
+        # 창 크기별 빈도: 최근 순서 one-hot 누적합을 창 길이 위치에서 읽음
+        player_counts = np.cumsum(np.eye(3, dtype=np.int64)[self.player_moves[recent]], axis=0)[lengths]
+        ai_counts = np.cumsum(np.eye(3, dtype=np.int64)[self.ai_moves[recent]], axis=0)[lengths]
+        
+        last_player = int(self.player_moves[recent[0]])
+        last_ai = int(self.ai_moves[recent[0]])
+        return np.concatenate((
+            np.argmax(player_counts, axis=1),                 # 플레이어가 자주 낸 선택을 다시 냄
+            (np.argmax(ai_counts, axis=1) + 1) % 3,           # AI가 자주 낸 선택을 이기려 함
+            [np.argmax(self.transition[last_player]),
+             np.argmax(self.pair_transition[last_player * 3 + last_ai]),
+             last_player,                                     # 같은 선택 반복
+             last_ai],                                        # AI의 직전 선택 따라하기
+        )).astype(np.int8)
+    
+    def update(self, player_index: int, ai_index: int, outcome: int):
+        """라운드 결과 반영 (후보 점수 갱신 후 다음 예측 계산)"""
+        # 후보가 예측한 선택을 이기는 수를 냈다고 보고 승 +1, 패 -1
+        if self.pending is not None:
+            reward = (self.pending == player_index).astype(np.float64) - (self.pending == (player_index + 1) % 3)
+            self.scores = self.scores * self.decays + reward
+        
+        if self.count:
+            last = (self.count - 1) % self.max_window
+            last_player = self.player_moves[last]
+            self.transition[last_player, player_index] += 1
+            self.pair_transition[last_player * 3 + self.ai_moves[last], player_index] += 1
+        
+        position = self.count % self.max_window
+        self.player_moves[position] = player_index
+        self.ai_moves[position] = ai_index
+        self.count += 1
+        
+        base = self._base_predictions()
+        self.pending = ((base[:, None] + self.rotations) % 3).ravel()
+    
+    def best_candidate(self) -> Optional[int]:
+        """현재 가장 점수가 높은 후보 번호 (점수가 양수인 후보가 없으면 None)"""
+        if self.pending is None:
+            return None
+        best = int(np.argmax(self.scores))
+        if self.scores.flat[best] <= 0:
+            return None
+        return best % len(self.names)
+    
+    def predict(self) -> List[float]:
+        """다음 플레이어 선택 확률 [가위, 바위, 보] (최고 후보의 예측)"""
+        best = self.best_candidate()
+        if best is None:
+            return [1/3, 1/3, 1/3]
+        probabilities = [0.0, 0.0, 0.0]
+        probabilities[self.pending[best]] = 1.0
+        return probabilities
+    
+    def reset(self):
+        """기록과 점수 초기화"""
+        self.count = 0
+        self.transition[:] = 0
+        self.pair_transition[:] = 0
+        self.scores[:] = 0.0
+        self.pending = None
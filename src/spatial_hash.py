@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+공간 해시 (균일 격자)
+SpatialHash는 오브젝트의 사각형이 걸치는 격자 칸마다 오브젝트를 등록해 두고
+충돌 후보를 주변 칸에서만 찾습니다. 이동할 때는 칸이 바뀐 경우에만 갱신합니다.
+GridIndex는 같은 격자를 NumPy 배열로 만든 것으로, 수만 개 이상이 매 스텝 움직여서
+하나씩 갱신하는 것보다 통째로 다시 정렬하는 편이 빠를 때 씁니다 (EnemyManager).
+"""
+
+import numpy as np
+import pygame
+from typing import Dict, Hashable, List, Optional, Tuple
+
+# 칸 범위 (x0, y0, x1, y1) - 양 끝 포함
+CellRange = Tuple[int, int, int, int]
+
+class SpatialHash:
+    def __init__(self, cell_size: int = 64):
+        """공간 해시 초기화 (cell_size: 칸 한 변 길이, 오브젝트 크기의 2 ~ 4배 정도가 적당)"""
+        self.cell_size = cell_size
+        self.cells: Dict[Tuple[int, int], Dict[Hashable, None]] = {}  # 칸 -> 오브젝트 (삽입 순서 유지)
+        self.rects: Dict[Hashable, pygame.Rect] = {}
+        self.ranges: Dict[Hashable, CellRange] = {}
+        self.serials: Dict[Hashable, int] = {}  # 쌍 중복 제거용 등록 번호
+        self.next_serial = 0
+    
+    def __len__(self) -> int:
+        """등록된 오브젝트 수"""
+        return len(self.rects)
+    
+    def __contains__(self, obj: Hashable) -> bool:
+        """등록 여부"""
+        return obj in self.rects
+    
+    def _cell_range(self, rect: pygame.Rect) -> CellRange:
+        """사각형이 걸치는 칸 범위"""
+        size = self.cell_size
+        return (rect.left // size, rect.top // size,
+                (rect.right - 1) // size, (rect.bottom - 1) // size)
+    
+    def _add_to_cells(self, obj: Hashable, cell_range: CellRange):
+        """칸 범위의 모든 칸에 오브젝트 추가"""
+        x0, y0, x1, y1 = cell_range
+        cells = self.cells
+        for cell_x in range(x0, x1 + 1):
+            for cell_y in range(y0, y1 + 1):
+                cell = cells.get((cell_x, cell_y))
+                if cell is None:
+                    cell = cells[(cell_x, cell_y)] = {}
+                cell[obj] = None
+    
+    def _remove_from_cells(self, obj: Hashable, cell_range: CellRange):
+        """칸 범위의 모든 칸에서 오브젝트 제거 (빈 칸은 삭제)"""
+        x0, y0, x1, y1 = cell_range
+        cells = self.cells
+        for cell_x in range(x0, x1 + 1):
+            for cell_y in range(y0, y1 + 1):
+                cell = cells[(cell_x, cell_y)]
+                del cell[obj]
+                if not cell:
+                    del cells[(cell_x, cell_y)]
+    
+    def insert(self, obj: Hashable, rect: pygame.Rect):
+        """오브젝트 등록 (이미 있으면 위치 갱신)"""
+        if obj in self.rects:
+            self.update(obj, rect)
+            return
+        cell_range = self._cell_range(rect)
+        self.rects[obj] = pygame.Rect(rect)
+        self.ranges[obj] = cell_range
+        self.serials[obj] = self.next_serial
+        self.next_serial += 1
+        self._add_to_cells(obj, cell_range)
+    
+    def update(self, obj: Hashable, rect: pygame.Rect):
+        """오브젝트 위치 갱신 (걸치는 칸이 바뀐 경우에만 칸 목록 수정)"""
+        self.rects[obj].update(rect)
+        cell_range = self._cell_range(rect)
+        old_range = self.ranges[obj]
+        if cell_range != old_range:
+            self._remove_from_cells(obj, old_range)
+            self._add_to_cells(obj, cell_range)
+            self.ranges[obj] = cell_range
+    
+    def remove(self, obj: Hashable):
+        """오브젝트 제거 (없으면 무시)"""
+        if obj not in self.rects:
+            return
+        self._remove_from_cells(obj, self.ranges.pop(obj))
+        del self.rects[obj]
+        del self.serials[obj]
+    
+    def clear(self):
+        """모든 오브젝트 제거"""
+        self.cells.clear()
+        self.rects.clear()
+        self.ranges.clear()
+        self.serials.clear()
+    
+    def _candidates(self, cell_range: CellRange) -> List[Hashable]:
+        """칸 범위 안의 오브젝트들 (중복 제거)"""
+        x0, y0, x1, y1 = cell_range
+        cells = self.cells
+        found: Dict[Hashable, None] = {}
+        for cell_x in range(x0, x1 + 1):
+            for cell_y in range(y0, y1 + 1):
+                cell = cells.get((cell_x, cell_y))
+                if cell:
+                    found.update(cell)
+        return list(found)
+    
+    def query_rect(self, rect: pygame.Rect) -> List[Hashable]:
+        """사각형과 겹치는 오브젝트들"""
+        rect = pygame.Rect(rect)
+        rects = self.rects
+        return [obj for obj in self._candidates(self._cell_range(rect)) if rects[obj].colliderect(rect)]
+    
+    def query_point(self, pos: Tuple[int, int]) -> List[Hashable]:
+        """점을 포함하는 오브젝트들"""
+        size = self.cell_size
+        cell = self.cells.get((int(pos[0]) // size, int(pos[1]) // size))
+        if not cell:
+            return []
+        rects = self.rects
+        return [obj for obj in cell if rects[obj].collidepoint(pos)]
+    
+    def query_radius(self, center: Tuple[float, float], radius: float) -> List[Hashable]:
+        """원과 겹치는 오브젝트들"""
+        cx, cy = center
+        bounds = pygame.Rect(int(cx - radius), int(cy - radius), int(radius * 2) + 2, int(radius * 2) + 2)
+        radius_sq = radius * radius
+        result = []
+        for obj in self._candidates(self._cell_range(bounds)):
+            rect = self.rects[obj]
+            # 원 중심에서 사각형까지 가장 가까운 점과의 거리
+            dx = cx - max(rect.left, min(cx, rect.right))
+            dy = cy - max(rect.top, min(cy, rect.bottom))
+            if dx * dx + dy * dy <= radius_sq:
+                result.append(obj)
+        return result
+    
+    def query_pairs(self) -> List[Tuple[Hashable, Hashable]]:
+        """서로 겹치는 오브젝트 쌍 목록 (각 쌍은 한 번만, 등록 순서대로)"""
+        rects = self.rects
+        serials = self.serials
+        seen = set()
+        pairs = []
+        for cell in self.cells.values():
+            if len(cell) < 2:
+                continue
+            members = list(cell)
+            for i, a in enumerate(members):
+                rect_a = rects[a]
+                for b in members[i + 1:]:
+                    if not rect_a.colliderect(rects[b]):
+                        continue
+                    key = (serials[a], serials[b]) if serials[a] < serials[b] else (serials[b], serials[a])
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    pairs.append((a, b) if serials[a] < serials[b] else (b, a))
+        return pairs
+    
+    def get_rect(self, obj: Hashable) -> Optional[pygame.Rect]:
+        """등록된 오브젝트의 사각형 (없으면 None)"""
+        return self.rects.get(obj)
+
+class GridIndex:
+    def __init__(self, cell_size: int = 64):
+        """배열 기반 균일 격자 (오브젝트 왼쪽 위 꼭짓점이 속한 칸으로 정렬해 두고 칸 단위로 잘라 씀)"""
+        self.cell_size = cell_size
+        self.order = np.zeros(0, dtype=np.int64)   # 칸 순서로 정렬한 오브젝트 번호
+        self.starts = np.zeros(1, dtype=np.int64)  # 칸별 order 시작 위치 (칸 수 + 1)
+        self.cells = np.zeros(0, dtype=np.int64)   # order 순서대로 각 오브젝트의 칸 번호
+        self.origin = (0, 0)
+        self.shape = (0, 0)  # (열 수, 행 수)
+        self.reach = (1, 1)  # 겹칠 수 있는 이웃 칸 거리 (가장 큰 오브젝트 크기 기준)
+        self.x = self.y = self.width = self.height = None
+    
+    def build(self, x: np.ndarray, y: np.ndarray, width: np.ndarray, height: np.ndarray, valid: np.ndarray):
+        """오브젝트 배열로 격자 다시 만들기 (valid가 False인 오브젝트는 제외)"""
+        size = self.cell_size
+        self.x, self.y, self.width, self.height = x, y, width, height
+        index = np.flatnonzero(valid)
+        if len(index) == 0:
+            self.order = self.cells = index
+            self.starts = np.zeros(1, dtype=np.int64)
+            self.shape = (0, 0)
+            return
+        
+        cell_x = x[index] // size
+        cell_y = y[index] // size
+        x0, y0 = int(cell_x.min()), int(cell_y.min())
+        columns = int(cell_x.max()) - x0 + 1
+        rows = int(cell_y.max()) - y0 + 1
+        keys = (cell_y - y0) * columns + (cell_x - x0)
+        
+        # 칸 수가 적으면 16비트 키로 정렬 (기수 정렬이라 훨씬 빠름)
+        if columns * rows <= np.iinfo(np.uint16).max:
+            keys = keys.astype(np.uint16)
+        order = np.argsort(keys, kind='stable')
+        self.order = index[order]
+        self.cells = keys[order].astype(np.int64)
+        counts = np.bincount(keys, minlength=columns * rows)
+        self.starts = np.concatenate(([0], np.cumsum(counts)))
+        self.origin = (x0, y0)
+        self.shape = (columns, rows)
+        self.reach = (-(-int(width[index].max()) // size), -(-int(height[index].max()) // size))
+    
+    def query_candidates(self, rect: pygame.Rect) -> np.ndarray:
+        """사각형과 겹칠 수 있는 오브젝트 번호들 (정밀 검사 전 후보)"""
+        columns, rows = self.shape
+        if columns == 0:
+            return self.order
+        size = self.cell_size
+        x0, y0 = self.origin
+        reach_x, reach_y = self.reach
+        
+        # 왼쪽/위쪽 칸에 꼭짓점이 있는 큰 오브젝트도 겹칠 수 있으므로 reach만큼 넓혀서 찾음
+        left = max(rect.left // size - x0 - reach_x, 0)
+        right = min((rect.right - 1) // size - x0, columns - 1)
+        top = max(rect.top // size - y0 - reach_y, 0)
+        bottom = min((rect.bottom - 1) // size - y0, rows - 1)
+        if left > right or top > bottom:
+            return self.order[:0]
+        
+        # 행 안의 칸들은 order에서 연속이므로 행마다 한 번씩 잘라 붙임
+        starts = self.starts
+        parts = [self.order[starts[row * columns + left]:starts[row * columns + right + 1]]
+                 for row in range(top, bottom + 1)]
+        return np.concatenate(parts) if len(parts) > 1 else parts[0]
+    
+    def query_rect(self, rect: pygame.Rect) -> np.ndarray:
+        """사각형과 겹치는 오브젝트 번호들"""
+        candidates = self.query_candidates(rect)
+        x, y = self.x[candidates], self.y[candidates]
+        hit = ((x < rect.right) & (x + self.width[candidates] > rect.left) &
+               (y < rect.bottom) & (y + self.height[candidates] > rect.top))
+        return candidates[hit]
+    
+    def query_point(self, pos: Tuple[int, int]) -> np.ndarray:
+        """점을 포함하는 오브젝트 번호들"""
+        return self.query_rect(pygame.Rect(int(pos[0]), int(pos[1]), 1, 1))
+    
+    def query_radius(self, center: Tuple[float, float], radius: float) -> np.ndarray:
+        """원과 겹치는 오브젝트 번호들"""
+        cx, cy = center
+        bounds = pygame.Rect(int(cx - radius), int(cy - radius), int(radius * 2) + 2, int(radius * 2) + 2)
+        candidates = self.query_candidates(bounds)
+        x, y = self.x[candidates], self.y[candidates]
+        # 원 중심에서 사각형까지 가장 가까운 점과의 거리
+        dx = cx - np.clip(cx, x, x + self.width[candidates])
+        dy = cy - np.clip(cy, y, y + self.height[candidates])
+        return candidates[dx * dx + dy * dy <= radius * radius]
+    
+    def query_pairs(self) -> np.ndarray:
+        """서로 겹치는 오브젝트 번호 쌍 (k x 2, 각 쌍은 한 번만, 작은 번호가 앞)"""
+        columns, rows = self.shape
+        order, starts = self.order, self.starts
+        if len(order) < 2:
+            return np.zeros((0, 2), dtype=np.int64)
+        reach_x, reach_y = self.reach
+        x, y, width, height = self.x, self.y, self.width, self.height
+        column, row = self.cells % columns, self.cells // columns
+        
+        # 같은 칸과 오른쪽/아래쪽 이웃 칸만 보면 모든 쌍을 한 번씩 검사함
+        found = []
+        for dy in range(0, reach_y + 1):
+            for dx in range(-reach_x, reach_x + 1):
+                if dy == 0 and dx < 0:
+                    continue
+                other_column, other_row = column + dx, row + dy
+                valid = (other_column >= 0) & (other_column < columns) & (other_row < rows)
+                other_cell = np.where(valid, other_row * columns + other_column, 0)
+                first = starts[other_cell]
+                counts = np.where(valid, starts[other_cell + 1] - first, 0)
+                total = int(counts.sum())
+                if total == 0:
+                    continue
+                
+                # 오브젝트마다 이웃 칸의 모든 오브젝트와 짝지음
+                a = np.repeat(order, counts)
+                skip = np.repeat(first - (np.cumsum(counts) - counts), counts)
+                b = order[np.arange(total) + skip]
+                if dx == 0 and dy == 0:
+                    keep = a < b
+                    a, b = a[keep], b[keep]
+                hit = ((x[a] < x[b] + width[b]) & (x[b] < x[a] + width[a]) &
+                       (y[a] < y[b] + height[b]) & (y[b] < y[a] + height[a]))
+                a, b = a[hit], b[hit]
+                found.append(np.column_stack((np.minimum(a, b), np.maximum(a, b))))
+        if not found:
+            return np.zeros((0, 2), dtype=np.int64)
+        pairs = np.concatenate(found)
+        return pairs[np.lexsort((pairs[:, 1], pairs[:, 0]))]
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+AI 선택 선계산
+플레이어 입력을 기다리는 동안 다음 AI 선택을 백그라운드에서 미리 계산합니다.
+"""
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional, Tuple
+from .engine import Choice
+from .ai_engine import AIPlayerState
+
+class AIMoveSpeculator:
+    def __init__(self, ai: AIPlayerState):
+        """AI 선택 선계산기 초기화"""
+        self.ai = ai
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ai-speculation")
+        self.future: Optional[Future] = None
+        self.key = None
+        
+        # 통계
+        self.hits = 0
+        self.misses = 0
+    
+    def _current_key(self) -> tuple:
+        """AI 선택에 영향을 주는 입력 (기록한 라운드 수, 난이도)"""
+        return (self.ai.rounds_recorded, self.ai.difficulty)
+    
+    def prefetch(self):
+        """다음 선택 미리 계산 시작 (이미 같은 입력으로 계산 중이면 무시)"""
+        key = self._current_key()
+        if self.future is not None and self.key == key:
+            return
+        
+        self.discard()
+        self.key = key
+        self.future = self.executor.submit(self.ai.plan_choice)
+    
+    def discard(self):
+        """미리 계산한 결과 버리기 (계산 중이면 끝날 때까지 기다려 AI 상태 동시 접근 방지)"""
+        if self.future is None:
+            return
+        
+        if not self.future.cancel():
+            self.future.exception()
+        self.future = None
+        self.key = None
+    
+    def take(self) -> Optional[Tuple[Choice, str]]:
+        """입력이 그대로인 선계산 결과 (선택, 분석 메시지) 반환, 없으면 None"""
+        if self.future is None or self.key != self._current_key():
+            self.discard()
+            self.misses += 1
+            return None
+        
+        future = self.future
+        self.future = None
+        self.key = None
+        if future.exception() is not None:
+            self.misses += 1
+            return None
+        
+        self.hits += 1
+        return future.result()
+    
+    def shutdown(self):
+        """백그라운드 작업자 종료"""
+        self.discard()
+        self.executor.shutdown(wait=True)
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+스크립트 상대 전략 모음
+AI 평가용 토너먼트에서 플레이어 역할을 하는 고정 전략들입니다.
+"""
+
+import random
+from typing import Dict, Callable, Optional
+from .engine import Choice, CHOICE_ORDER, CHOICE_INDEX
+
+def beats(choice: Choice) -> Choice:
+    """주어진 선택을 이기는 선택 반환"""
+    return CHOICE_ORDER[(CHOICE_INDEX[choice] + 1) % 3]
+
+class ScriptedStrategy:
+    name = "scripted"
+    
+    def __init__(self, rng=random):
+        """스크립트 전략 초기화"""
+        self.rng = rng
+        self.reset()
+    
+    def reset(self):
+        """대전 시작 시 상태 초기화"""
+        pass
+    
+    def choose(self) -> Choice:
+        """다음 선택 반환"""
+        raise NotImplementedError
+    
+    def observe(self, own_choice: Choice, opponent_choice: Choice):
+        """라운드 결과 관찰 (자신의 선택, 상대의 선택)"""
+        pass
+
+class ConstantStrategy(ScriptedStrategy):
+    name = "constant"
+    
+    def __init__(self, rng=random, choice: Choice = Choice.ROCK):
+        """항상 같은 선택을 하는 전략"""
+        self.choice = choice
+        super().__init__(rng)
+    
+    def choose(self) -> Choice:
+        """고정 선택 반환"""
+        return self.choice
+
+class CycleStrategy(ScriptedStrategy):
+    name = "cycle"
+    
+    def __init__(self, rng=random, sequence=(Choice.ROCK, Choice.PAPER, Choice.SCISSORS)):
+        """정해진 순서를 반복하는 전략"""
+        self.sequence = tuple(sequence)
+        super().__init__(rng)
+    
+    def reset(self):
+        """순서 처음으로 이동"""
+        self.position = 0
+    
+    def choose(self) -> Choice:
+        """현재 순서의 선택 반환"""
+        return self.sequence[self.position % len(self.sequence)]
+    
+    def observe(self, own_choice: Choice, opponent_choice: Choice):
+        """다음 순서로 이동"""
+        self.position += 1
+
+class BeatLastStrategy(ScriptedStrategy):
+    name = "beat-last"
+    
+    def reset(self):
+        """상대 직전 선택 초기화"""
+        self.last_opponent_choice: Optional[Choice] = None
+    
+    def choose(self) -> Choice:
+        """상대의 직전 선택을 이기는 선택"""
+        if self.last_opponent_choice is None:
+            return self.rng.choice(CHOICE_ORDER)
+        return beats(self.last_opponent_choice)
+    
+    def observe(self, own_choice: Choice, opponent_choice: Choice):
+        """상대 선택 기록"""
+        self.last_opponent_choice = opponent_choice
+
+class FrequencyStrategy(ScriptedStrategy):
+    name = "frequency"
+    
+    def reset(self):
+        """상대 선택 빈도 초기화"""
+        self.opponent_counts = {choice: 0 for choice in CHOICE_ORDER}
+    
+    def choose(self) -> Choice:
+        """상대가 가장 많이 낸 선택을 이기는 선택"""
+        if not any(self.opponent_counts.values()):
+            return self.rng.choice(CHOICE_ORDER)
+        most_frequent = max(self.opponent_counts, key=self.opponent_counts.get)
+        return beats(most_frequent)
+    
+    def observe(self, own_choice: Choice, opponent_choice: Choice):
+        """상대 선택 빈도 갱신"""
+        self.opponent_counts[opponent_choice] += 1
+
+class RandomStrategy(ScriptedStrategy):
+    name = "random"
+    
+    def choose(self) -> Choice:
+        """무작위 선택"""
+        return self.rng.choice(CHOICE_ORDER)
+
+# 이름으로 전략 생성
+STRATEGIES: Dict[str, Callable[..., ScriptedStrategy]] = {
+    ConstantStrategy.name: ConstantStrategy,
+    CycleStrategy.name: CycleStrategy,
+    BeatLastStrategy.name: BeatLastStrategy,
+    FrequencyStrategy.name: FrequencyStrategy,
+    RandomStrategy.name: RandomStrategy,
+}
+
+def create_strategy(name: str, rng=random) -> ScriptedStrategy:
+    """이름으로 스크립트 전략 생성"""
+    if name not in STRATEGIES:
+        raise ValueError(f"알 수 없는 전략입니다: {name}")
+    return STRATEGIES[name](rng)
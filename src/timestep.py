@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+고정 시간 간격 (fixed timestep) 누산기
+렌더링 프레임 수와 상관없이 게임 로직을 일정한 간격으로 진행시키고
+남은 시간 비율로 그리기 보간값을 제공합니다.
+"""
+
+import time
+from typing import Callable
+
+# 기존 프레임 단위 상수들이 60 FPS를 기준으로 만들어져 있으므로 같은 간격 사용
+DEFAULT_STEP = 1 / 60
+
+class FixedTimestep:
+    def __init__(self, step: float = DEFAULT_STEP, max_steps: int = 5,
+                 clock: Callable[[], float] = time.perf_counter):
+        """고정 스텝 누산기 초기화 (max_steps: 한 프레임에 따라잡을 최대 스텝 수)"""
+        self.step = step
+        self.max_steps = max_steps
+        self.clock = clock
+        self.accumulator = 0.0
+        self.last_time = None
+        self.dropped_time = 0.0
+    
+    def reset(self):
+        """누적 시간 초기화 (다음 advance부터 다시 측정)"""
+        self.accumulator = 0.0
+        self.last_time = None
+    
+    def advance(self) -> int:
+        """지난 호출 이후 흐른 시간을 쌓고 이번 프레임에 실행할 스텝 수 반환"""
+        now = self.clock()
+        if self.last_time is None:
+            self.last_time = now
+            return 0
+        
+        self.accumulator += now - self.last_time
+        self.last_time = now
+        
+        steps = int(self.accumulator / self.step)
+        if steps > self.max_steps:
+            # 너무 밀리면 따라잡지 않고 버림 (느린 기기에서 무한히 밀리는 것 방지)
+            self.dropped_time += (steps - self.max_steps) * self.step
+            steps = self.max_steps
+            self.accumulator = self.step * steps + self.accumulator % self.step
+        self.accumulator -= steps * self.step
+        return steps
+    
+    @property
+    def alpha(self) -> float:
+        """이전 스텝과 현재 스텝 사이 보간 비율 (0.0 ~ 1.0)"""
+        return min(1.0, self.accumulator / self.step)
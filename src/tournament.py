@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+AI 토너먼트 실행기
+AIPlayer 난이도별로 스크립트 전략들과 대전을 반복해 승률과 게임 길이를 집계합니다.
+pygame 없이 규칙 엔진만 사용하며 여러 프로세스로 나누어 실행합니다.
+"""
+
+import random
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple
+from .engine import MatchEngine, PlayerState, random_allocation
+from .ai_engine import AIPlayerState
+from .strategies import STRATEGIES, create_strategy
+
+DEFAULT_DIFFICULTIES = (0.0, 0.25, 0.5, 0.75, 1.0)
+DEFAULT_STRATEGIES = tuple(STRATEGIES.keys())
+
+# 끝나지 않는 대전 방지 (데미지 배분이 0인 선택만 이기는 경우 등)
+MAX_ROUNDS = 200
+
+def play_match(difficulty: float, strategy, rng: random.Random, max_rounds: int = MAX_ROUNDS) -> Tuple[Optional[str], int]:
+    """한 대전 실행 후 (승자 'ai' / 'strategy' / None, 라운드 수) 반환"""
+    player = PlayerState("플레이어")
+    computer = AIPlayerState("컴퓨터")
+    computer.rng = rng
+    computer.set_difficulty(difficulty)
+    player.set_damage_allocation(*random_allocation(rng))
+    computer.set_damage_allocation(*random_allocation(rng))
+    
+    engine = MatchEngine(player, computer)
+    strategy.reset()
+    
+    rounds = 0
+    while not engine.is_over() and rounds < max_rounds:
+        # 게임과 같은 순서: 플레이어 선택 후 컴퓨터 선택, 라운드 처리
+        player_choice = strategy.choose()
+        computer_choice = computer.make_choice()
+        engine.play_round(player_choice, computer_choice)
+        strategy.observe(player_choice, computer_choice)
+        rounds += 1
+    
+    winner = engine.get_winner_player()
+    if winner is computer:
+        return 'ai', rounds
+    elif winner is player:
+        return 'strategy', rounds
+    return None, rounds
+
+def run_chunk(task: Tuple[float, str, int, int, int]) -> dict:
+    """작업 묶음 하나를 실행 (난이도, 전략, 대전 수, 시드, 최대 라운드)"""
+    difficulty, strategy_name, games, seed, max_rounds = task
+    rng = random.Random(seed)
+    strategy = create_strategy(strategy_name, rng)
+    
+    stats = {'difficulty': difficulty, 'strategy': strategy_name,
+             'games': 0, 'ai_wins': 0, 'strategy_wins': 0, 'unfinished': 0, 'rounds': 0}
+    for _ in range(games):
+        winner, rounds = play_match(difficulty, strategy, rng, max_rounds)
+        stats['games'] += 1
+        stats['rounds'] += rounds
+        if winner == 'ai':
+            stats['ai_wins'] += 1
+        elif winner == 'strategy':
+            stats['strategy_wins'] += 1
+        else:
+            stats['unfinished'] += 1
+    return stats
+
+def build_tasks(difficulties: Sequence[float], strategies: Sequence[str], games: int,
+                chunk_size: int, seed: int, max_rounds: int = MAX_ROUNDS) -> List[tuple]:
+    """대전을 chunk_size 단위 작업으로 분할 (작업마다 고유 시드)"""
+    tasks = []
+    for difficulty in difficulties:
+        for strategy_name in strategies:
+            remaining = games
+            while remaining > 0:
+                count = min(chunk_size, remaining)
+                chunk_seed = seed * 1000003 + len(tasks)
+                tasks.append((difficulty, strategy_name, count, chunk_seed, max_rounds))
+                remaining -= count
+    return tasks
+
+def merge_results(chunks) -> Dict[Tuple[float, str], dict]:
+    """작업 결과를 (난이도, 전략)별로 합산"""
+    results = {}
+    for chunk in chunks:
+        key = (chunk['difficulty'], chunk['strategy'])
+        if key not in results:
+            results[key] = {'games': 0, 'ai_wins': 0, 'strategy_wins': 0, 'unfinished': 0, 'rounds': 0}
+        for field in results[key]:
+            results[key][field] += chunk[field]
+    return results
+
+def run_tournament(difficulties: Sequence[float] = DEFAULT_DIFFICULTIES,
+                   strategies: Sequence[str] = DEFAULT_STRATEGIES,
+                   games: int = 200, workers: Optional[int] = None, chunk_size: int = 50,
+                   seed: int = 0, max_rounds: int = MAX_ROUNDS) -> Dict[Tuple[float, str], dict]:
+    """토너먼트 실행 (workers가 1이면 현재 프로세스에서 실행)"""
+    if games < 1:
+        raise ValueError("games는 1 이상이어야 합니다!")
+    if chunk_size < 1:
+        raise ValueError("chunk_size는 1 이상이어야 합니다!")
+    for strategy_name in strategies:
+        if strategy_name not in STRATEGIES:
+            raise ValueError(f"알 수 없는 전략입니다: {strategy_name}")
+    
+    tasks = build_tasks(difficulties, strategies, games, chunk_size, seed, max_rounds)
+    if workers == 1:
+        return merge_results(map(run_chunk, tasks))
+    
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return merge_results(executor.map(run_chunk, tasks))
+
+def format_tables(results: Dict[Tuple[float, str], dict], difficulties: Sequence[float],
+                  strategies: Sequence[str]) -> str:
+    """AI 승률 표와 평균 게임 길이 표 문자열 생성"""
+    header = f"{'전략':<12}" + "".join(f"{difficulty:>10.2f}" for difficulty in difficulties)
+    lines = ["AI 승률 (난이도별)", header]
+    for strategy_name in strategies:
+        row = f"{strategy_name:<12}"
+        for difficulty in difficulties:
+            stats = results[(difficulty, strategy_name)]
+            row += f"{stats['ai_wins'] / stats['games']:>10.1%}"
+        lines.append(row)
+    
+    lines += ["", "평균 게임 길이 (라운드)", header]
+    for strategy_name in strategies:
+        row = f"{strategy_name:<12}"
+        for difficulty in difficulties:
+            stats = results[(difficulty, strategy_name)]
+            row += f"{stats['rounds'] / stats['games']:>10.1f}"
+        lines.append(row)
+    return "\n".join(lines)
@@ -5,10 +5,11 @@
 """
 
 import pygame
-from typing import Tuple, Optional, List
+from typing import Dict, Tuple, Optional, List
 from .player import Choice
 from .game_manager import GameState
 from .font_utils import get_korean_font, render_text_safe
+from .glyph_atlas import draw_dynamic_text
 
 class Button:
     def __init__(self, x: int, y: int, width: int, height: int, text: str, color: Tuple[int, int, int]):
@@ -30,6 +31,10 @@ class Button:
         text_rect = text_surface.get_rect(center=self.rect.center)
         screen.blit(text_surface, text_rect)
     
+    def get_draw_signature(self) -> tuple:
+        """화면에 보이는 상태 (바뀌면 다시 그려야 함)"""
+        return (self.text, self.color, self.is_hovered)
+    
     def handle_mouse(self, pos: Tuple[int, int]):
         """마우스 이벤트 처리"""
         self.is_hovered = self.rect.collidepoint(pos)
@@ -62,8 +67,12 @@ class Slider:
         pygame.draw.rect(screen, (255, 255, 0), handle_rect)
         
         # 값 표시
-        value_text = render_text_safe(self.font, str(self.value), (255, 255, 255))
-        screen.blit(value_text, (self.rect.x + self.rect.width + 10, self.rect.y))
+        draw_dynamic_text(screen, self.font, str(self.value), (255, 255, 255), (self.rect.x + self.rect.width + 10, self.rect.y))
+    
+    def get_draw_rect(self) -> pygame.Rect:
+        """슬라이더가 그리는 영역 (핸들과 값 텍스트 포함)"""
+        height = max(self.rect.height + 10, self.font.get_height() + 5)
+        return pygame.Rect(self.rect.x - 5, self.rect.y - 5, self.rect.width + 70, height)
     
     def handle_mouse(self, pos: Tuple[int, int], click: bool):
         """마우스 이벤트 처리"""
@@ -150,6 +159,26 @@ class LinkedSliders:
         """유효한 배분인지 확인"""
         return self.get_total() == self.max_total
 
+class WidgetGrid:
+    def __init__(self, cell_size: int = 100):
+        """위젯 공간 색인 (화면을 격자로 나눠 칸마다 겹치는 위젯 목록 보관)"""
+        self.cell_size = cell_size
+        self.cells: Dict[Tuple[int, int], List[tuple]] = {}
+    
+    def insert(self, rect: pygame.Rect, entry: tuple):
+        """위젯 등록 (영역이 걸치는 모든 칸에 추가)"""
+        size = self.cell_size
+        for cell_x in range(rect.left // size, (rect.right - 1) // size + 1):
+            for cell_y in range(rect.top // size, (rect.bottom - 1) // size + 1):
+                self.cells.setdefault((cell_x, cell_y), []).append((rect, entry))
+    
+    def query(self, pos: Tuple[int, int]) -> List[tuple]:
+        """위치 아래에 있는 위젯들 반환 (등록 순서)"""
+        cell = self.cells.get((pos[0] // self.cell_size, pos[1] // self.cell_size))
+        if not cell:
+            return []
+        return [entry for rect, entry in cell if rect.collidepoint(pos)]
+
 class UI:
     def __init__(self, screen_width: int, screen_height: int):
         """UI 초기화"""
@@ -174,6 +203,12 @@ class UI:
         
         # 연동된 슬라이더 그룹
         self.linked_sliders = LinkedSliders(20)
+        
+        # 상태별 정적 배경 캐시: 상태 -> (화면 키, Surface)
+        self.background_cache = {}
+        
+        # 상태별로 화면에 보이는 버튼만 등록
+        self.setup_widget_registry()
     
     def setup_buttons(self):
         """버튼 설정"""
@@ -198,8 +233,127 @@ class UI:
         # 게임 재시작 버튼
         self.restart_button = Button(350, 500, 100, 40, "재시작", (100, 0, 0))
     
-    def draw_mode_selection_screen(self, screen):
-        """모드 선택 화면 그리기"""
+    def setup_widget_registry(self):
+        """상태별 버튼 등록 (이름, 버튼, 클릭 액션)과 상태별 공간 색인 생성"""
+        home = ('home', self.home_button, "home")
+        self.state_buttons: Dict[GameState, List[tuple]] = {
+            GameState.MODE_SELECTION: [('practice', self.practice_button, "select_practice"),
+                                       ('story', self.story_button, "select_story"), home],
+            GameState.SETUP: [('confirm', self.confirm_button, "confirm_setup")],
+            GameState.PLAYING: [home, ('scissors', self.scissors_button, "choose_scissors"),
+                                ('rock', self.rock_button, "choose_rock"),
+                                ('paper', self.paper_button, "choose_paper")],
+            GameState.ROUND_RESULT: [('next_round', self.next_round_button, "next_round"), home],
+            GameState.DEATH_ANIMATION: [home],
+            GameState.GAME_OVER: [('restart', self.restart_button, "restart"), home],
+        }
+        
+        self.state_grids: Dict[GameState, WidgetGrid] = {}
+        for state, entries in self.state_buttons.items():
+            grid = WidgetGrid()
+            for entry in entries:
+                grid.insert(entry[1].rect, entry)
+            self.state_grids[state] = grid
+        
+        # 현재 호버 상태인 버튼들
+        self.hovered_buttons = set()
+    
+    def get_screen_key(self, state: GameState, game_manager) -> tuple:
+        """위젯으로 추적하지 않는 화면 내용의 키 (바뀌면 화면 전체 다시 그리기)"""
+        if state == GameState.PLAYING:
+            return (state, game_manager.round_number, game_manager.player.get_damage_allocation_tuple())
+        elif state == GameState.ROUND_RESULT:
+            result = game_manager.round_result
+            winner = result['winner']
+            bonus = (winner is game_manager.player, winner.special_ability_active,
+                     winner.consecutive_wins >= 3, winner.consecutive_losses >= 3) if winner else None
+            return (state, game_manager.round_number, game_manager.player.get_damage_allocation_tuple(),
+                    result['player_choice'], result['computer_choice'], result['damage'], bonus)
+        elif state == GameState.DEATH_ANIMATION:
+            return (state, id(game_manager.dead_player))
+        elif state == GameState.GAME_OVER:
+            winner = game_manager.get_winner_player()
+            return (state, winner.name if winner else None, game_manager.player.get_damage_allocation_tuple())
+        return (state,)
+    
+    def get_dirty_widgets(self, state: GameState, game_manager) -> List[tuple]:
+        """현재 상태 화면에서 바뀔 수 있는 위젯들의 (이름, 영역, 시그니처) 목록"""
+        # 버튼 상태 외에 모양에 영향을 주는 값 (확인 버튼 활성화, 선택 버튼 표시 여부)
+        extra = {}
+        if state == GameState.SETUP:
+            extra['confirm'] = self.linked_sliders.is_valid()
+        elif state == GameState.PLAYING:
+            chosen = game_manager.player.get_choice() is not None
+            extra.update(scissors=chosen, rock=chosen, paper=chosen)
+        
+        widgets = [(name, button.rect, (button.get_draw_signature(), extra.get(name)))
+                   for name, button, _ in self.state_buttons[state]]
+        
+        if state == GameState.SETUP:
+            for name, slider in self.linked_sliders.sliders.items():
+                widgets.append((name, slider.get_draw_rect(), slider.value))
+            total = self.linked_sliders.get_total()
+            widgets.append(('total', pygame.Rect(200, 320, 400, self.font.get_height()), total))
+        
+        elif state == GameState.PLAYING:
+            player = game_manager.player
+            for name, target in (('player', player), ('computer', game_manager.computer)):
+                widgets.append((name, target.get_draw_rect(), target.get_draw_signature()))
+            
+            # 선택 완료 후 메시지 영역
+            analysis_msg = game_manager.computer.get_analysis_message() if hasattr(game_manager.computer, 'get_analysis_message') else None
+            messages = (player.get_choice(), player.special_ability_active, player.consecutive_choices,
+                        player.consecutive_wins, player.consecutive_losses, analysis_msg)
+            widgets.append(('messages', pygame.Rect(0, 390, self.screen_width, 160), messages))
+        
+        elif state == GameState.DEATH_ANIMATION:
+            # 파편들을 감싸는 영역 (이전 프레임 영역은 추적기가 함께 지움)
+            fragments_rect = game_manager.health_bar_particles.get_bounding_rect(game_manager.animation_alpha)
+            if fragments_rect is not None:
+                widgets.append(('fragments', fragments_rect, (game_manager.animation_frame, game_manager.animation_alpha)))
+            show_end = game_manager.get_animation_progress() > 0.8
+            widgets.append(('end', pygame.Rect(350, 300, 200, self.font.get_height()), show_end))
+        
+        return widgets
+    
+    def get_background(self, state: GameState, game_manager=None) -> pygame.Surface:
+        """상태별 정적 배경 (제목, 라벨, 설명) - 화면 키가 바뀔 때만 다시 만듦"""
+        key = self.get_screen_key(state, game_manager)
+        cached = self.background_cache.get(state)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        
+        background = pygame.Surface((self.screen_width, self.screen_height))
+        if pygame.display.get_surface() is not None:
+            background = background.convert()
+        background.fill(self.BLACK)
+        
+        if state == GameState.MODE_SELECTION:
+            self.draw_mode_selection_background(background)
+        elif state == GameState.SETUP:
+            self.draw_setup_background(background)
+        elif state == GameState.PLAYING:
+            self.draw_game_background(background, game_manager)
+        elif state == GameState.ROUND_RESULT:
+            self.draw_result_background(background, game_manager)
+        elif state == GameState.GAME_OVER:
+            self.draw_game_over_background(background, game_manager)
+        
+        self.background_cache[state] = (key, background)
+        return background
+    
+    def clear_backgrounds(self):
+        """캐시된 배경 모두 버리기"""
+        self.background_cache.clear()
+    
+    def draw_damage_allocation_info(self, screen, player, pos: Tuple[int, int]):
+        """데미지 배분 정보 표시"""
+        damage_info = player.get_damage_allocation_tuple()
+        damage_text = render_text_safe(self.small_font, f"데미지 배분: 가위 {damage_info[0]} | 바위 {damage_info[1]} | 보 {damage_info[2]}", self.YELLOW)
+        screen.blit(damage_text, pos)
+    
+    def draw_mode_selection_background(self, screen):
+        """모드 선택 화면 정적 요소"""
         # 제목
         title = render_text_safe(self.title_font, "심리전 가위바위보", self.WHITE)
         screen.blit(title, (200, 100))
@@ -208,16 +362,20 @@ class UI:
         subtitle = render_text_safe(self.font, "게임 모드를 선택하세요", self.WHITE)
         screen.blit(subtitle, (250, 180))
         
-        # 모드 선택 버튼들
-        self.practice_button.draw(screen)
-        self.story_button.draw(screen)
-        
         # 모드 설명
         practice_desc = render_text_safe(self.small_font, "AI와 자유롭게 대전", self.WHITE)
         story_desc = render_text_safe(self.small_font, "스토리와 함께하는 모험", self.WHITE)
         
         screen.blit(practice_desc, (250, 320))
         screen.blit(story_desc, (430, 320))
+    
+    def draw_mode_selection_screen(self, screen):
+        """모드 선택 화면 그리기"""
+        screen.blit(self.get_background(GameState.MODE_SELECTION), (0, 0))
+        
+        # 모드 선택 버튼들
+        self.practice_button.draw(screen)
+        self.story_button.draw(screen)
         
         # 홈으로 돌아가기 버튼
         self.home_button.draw(screen)
@@ -236,10 +394,7 @@ class UI:
         screen.blit(death_text, (250, 200))
         
         # 체력바 파편들 그리기
-        for fragment in game_manager.health_bar_fragments:
-            pygame.draw.circle(screen, fragment['color'], 
-                             (int(fragment['x']), int(fragment['y'])), 
-                             fragment['size'])
+        game_manager.health_bar_particles.draw(screen, game_manager.animation_alpha)
         
         # 애니메이션 진행률에 따른 효과
         progress = game_manager.get_animation_progress()
@@ -251,8 +406,8 @@ class UI:
         # 홈으로 돌아가기 버튼 (애니메이션 중에도 사용 가능)
         self.home_button.draw(screen)
     
-    def draw_setup_screen(self, screen, player):
-        """데미지 배분 화면 그리기"""
+    def draw_setup_background(self, screen):
+        """데미지 배분 화면 정적 요소"""
         # 제목
         title = render_text_safe(self.title_font, "데미지 배분 (총합 20)", self.WHITE)
         screen.blit(title, (200, 50))
@@ -269,14 +424,17 @@ class UI:
         screen.blit(scissors_label, (150, 200))
         screen.blit(rock_label, (150, 230))
         screen.blit(paper_label, (150, 260))
+    
+    def draw_setup_screen(self, screen, player):
+        """데미지 배분 화면 그리기"""
+        screen.blit(self.get_background(GameState.SETUP), (0, 0))
         
         # 연동된 슬라이더들 그리기
         self.linked_sliders.draw(screen)
         
         # 총합 표시
         total = self.linked_sliders.get_total()
-        total_text = render_text_safe(self.font, f"총합: {total}/20", self.YELLOW if total == 20 else self.RED)
-        screen.blit(total_text, (200, 320))
+        draw_dynamic_text(screen, self.font, f"총합: {total}/20", self.YELLOW if total == 20 else self.RED, (200, 320))
         
         # 확인 버튼 (총합이 20일 때만 활성화)
         if self.linked_sliders.is_valid():
@@ -286,16 +444,18 @@ class UI:
         
         self.confirm_button.draw(screen)
     
-    def draw_game_screen(self, screen, game_manager):
-        """게임 화면 그리기"""
+    def draw_game_background(self, screen, game_manager):
+        """게임 화면 정적 요소 (라운드 번호와 데미지 배분이 바뀌면 다시 만듦)"""
         # 제목
         title = render_text_safe(self.title_font, f"라운드 {game_manager.round_number}", self.WHITE)
         screen.blit(title, (300, 30))
         
         # 데미지 배분 정보 표시
-        damage_info = game_manager.player.get_damage_allocation_tuple()
-        damage_text = render_text_safe(self.small_font, f"데미지 배분: 가위 {damage_info[0]} | 바위 {damage_info[1]} | 보 {damage_info[2]}", self.YELLOW)
-        screen.blit(damage_text, (50, 80))
+        self.draw_damage_allocation_info(screen, game_manager.player, (50, 80))
+    
+    def draw_game_screen(self, screen, game_manager):
+        """게임 화면 그리기"""
+        screen.blit(self.get_background(GameState.PLAYING, game_manager), (0, 0))
         
         # 홈으로 돌아가기 버튼 (게임 화면에서도 표시)
         self.home_button.draw(screen)
@@ -335,8 +495,8 @@ class UI:
                     analysis_text = render_text_safe(self.small_font, f"AI 분석: {analysis_msg}", self.BLUE)
                     screen.blit(analysis_text, (50, 450))
     
-    def draw_result_screen(self, screen, game_manager):
-        """결과 화면 그리기"""
+    def draw_result_background(self, screen, game_manager):
+        """결과 화면 정적 요소 (라운드 결과가 바뀌면 다시 만듦)"""
         result = game_manager.round_result
         
         # 결과 제목
@@ -349,9 +509,7 @@ class UI:
         screen.blit(title, (300, 100))
         
         # 데미지 배분 정보 표시
-        damage_info = game_manager.player.get_damage_allocation_tuple()
-        damage_text = render_text_safe(self.small_font, f"데미지 배분: 가위 {damage_info[0]} | 바위 {damage_info[1]} | 보 {damage_info[2]}", self.YELLOW)
-        screen.blit(damage_text, (50, 50))
+        self.draw_damage_allocation_info(screen, game_manager.player, (50, 50))
         
         # 선택 표시
         player_choice = render_text_safe(self.font, f"플레이어: {result['player_choice'].value}", self.WHITE)
@@ -379,6 +537,10 @@ class UI:
                 elif winner.consecutive_losses >= 3:
                     bonus_damage_text = render_text_safe(self.small_font, "연속 패배 보너스로 데미지 증가!", self.RED)
                     screen.blit(bonus_damage_text, (300, 310))
+    
+    def draw_result_screen(self, screen, game_manager):
+        """결과 화면 그리기"""
+        screen.blit(self.get_background(GameState.ROUND_RESULT, game_manager), (0, 0))
         
         # 다음 라운드 버튼
         self.next_round_button.draw(screen)
@@ -386,8 +548,8 @@ class UI:
         # 홈으로 돌아가기 버튼
         self.home_button.draw(screen)
     
-    def draw_game_over_screen(self, screen, game_manager):
-        """게임 오버 화면 그리기"""
+    def draw_game_over_background(self, screen, game_manager):
+        """게임 오버 화면 정적 요소"""
         winner = game_manager.get_winner_player()
         
         if winner:
@@ -399,9 +561,11 @@ class UI:
         screen.blit(title, (300, 150))
         
         # 데미지 배분 정보 표시
-        damage_info = game_manager.player.get_damage_allocation_tuple()
-        damage_text = render_text_safe(self.small_font, f"데미지 배분: 가위 {damage_info[0]} | 바위 {damage_info[1]} | 보 {damage_info[2]}", self.YELLOW)
-        screen.blit(damage_text, (50, 50))
+        self.draw_damage_allocation_info(screen, game_manager.player, (50, 50))
+    
+    def draw_game_over_screen(self, screen, game_manager):
+        """게임 오버 화면 그리기"""
+        screen.blit(self.get_background(GameState.GAME_OVER, game_manager), (0, 0))
         
         # 재시작 버튼
         self.restart_button.draw(screen)
@@ -409,42 +573,28 @@ class UI:
         # 홈으로 돌아가기 버튼
         self.home_button.draw(screen)
     
-    def handle_mouse(self, pos: Tuple[int, int], click: bool) -> Optional[str]:
-        """마우스 이벤트 처리"""
-        # 모든 버튼의 호버 상태 업데이트
-        self.practice_button.handle_mouse(pos)
-        self.story_button.handle_mouse(pos)
-        self.home_button.handle_mouse(pos) # 홈으로 돌아가기 버튼 추가
-        self.confirm_button.handle_mouse(pos)
-        self.scissors_button.handle_mouse(pos)
-        self.rock_button.handle_mouse(pos)
-        self.paper_button.handle_mouse(pos)
-        self.next_round_button.handle_mouse(pos)
-        self.restart_button.handle_mouse(pos)
-        
-        # 연동된 슬라이더 처리
-        self.linked_sliders.handle_mouse(pos, click)
+    def handle_mouse(self, pos: Tuple[int, int], click: bool, state: GameState) -> Optional[str]:
+        """마우스 이벤트 처리 (현재 상태 화면에 보이는 위젯만 검사)"""
+        hits = self.state_grids[state].query(pos)
+        
+        # 호버 상태 갱신 (바뀐 버튼만)
+        hovered = {button for _, button, _ in hits}
+        for button in self.hovered_buttons - hovered:
+            button.is_hovered = False
+        for button in hovered:
+            button.is_hovered = True
+        self.hovered_buttons = hovered
+        
+        # 연동된 슬라이더 처리 (드래그 중에는 영역 밖에서도 따라가야 하므로 전부 전달)
+        if state == GameState.SETUP:
+            self.linked_sliders.handle_mouse(pos, click)
         
         # 클릭 이벤트 처리
         if click:
-            if self.practice_button.is_clicked(pos, click):
-                return "select_practice"
-            elif self.story_button.is_clicked(pos, click):
-                return "select_story"
-            elif self.confirm_button.is_clicked(pos, click) and self.linked_sliders.is_valid():
-                return "confirm_setup"
-            elif self.home_button.is_clicked(pos, click):
-                return "home"
-            elif self.scissors_button.is_clicked(pos, click):
-                return "choose_scissors"
-            elif self.rock_button.is_clicked(pos, click):
-                return "choose_rock"
-            elif self.paper_button.is_clicked(pos, click):
-                return "choose_paper"
-            elif self.next_round_button.is_clicked(pos, click):
-                return "next_round"
-            elif self.restart_button.is_clicked(pos, click):
-                return "restart"
+            for _, button, action in hits:
+                if action == "confirm_setup" and not self.linked_sliders.is_valid():
+                    continue
+                return action
         
         return None
     
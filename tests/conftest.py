@@ -0,0 +1,18 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+테스트 공통 설정
+폰트 탐색 결과 캐시가 실제 홈 폴더 (~/.cache/protoType)에 쓰이지 않도록 임시 폴더로 돌립니다.
+"""
+
+import os
+
+import pytest
+
+from src import font_utils
+
+@pytest.fixture(autouse=True)
+def font_index_in_tmp(tmp_path, monkeypatch):
+    """폰트 캐시 위치를 테스트마다 임시 폴더로 변경"""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    monkeypatch.setattr(font_utils.font_registry, "index_path", os.path.join(tmp_path, "protoType", "font_index.json"))
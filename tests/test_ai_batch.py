@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+AI 배치 추론 테스트
+같은 시드의 AIPlayerState를 두 벌 만들어 한쪽은 make_choice, 한쪽은 decide_batch로 진행하면서
+매 라운드 선택과 분석 메시지가 같은지 확인합니다.
+"""
+
+import random
+
+import pytest
+
+from src.ai_batch import decide_batch
+from src.ai_engine import AIPlayerState
+from src.engine import CHOICE_INDEX, CHOICE_ORDER, PlayerState
+
+SESSIONS = 120
+ROUNDS = 40
+
+# 세션별로 켜는 옵션 (문맥 예측기, 앙상블, 예측 캐시 조합)
+OPTIONS = [
+    (),
+    ('context',),
+    ('ensemble',),
+    ('cache',),
+    ('context', 'cache'),
+    ('ensemble', 'cache'),
+    ('context', 'ensemble'),
+]
+
+def make_ai(seed: int, difficulty: float, options: tuple) -> AIPlayerState:
+    """시드가 고정된 AI 생성"""
+    ai = AIPlayerState("컴퓨터")
+    ai.rng = random.Random(seed)
+    ai.set_difficulty(difficulty)
+    if 'context' in options:
+        ai.enable_context_predictor()
+    if 'ensemble' in options:
+        ai.enable_ensemble_predictor()
+    if 'cache' in options:
+        ai.enable_prediction_cache()
+    return ai
+
+def player_choice(rng: random.Random, style: int, round_number: int, previous):
+    """패턴이 있는 플레이어 선택 (반복, 순환, 무작위 섞음)"""
+    if style == 0 and previous is not None and rng.random() < 0.7:
+        return previous
+    if style == 1 and rng.random() < 0.8:
+        return CHOICE_ORDER[round_number % 3]
+    return rng.choice(CHOICE_ORDER)
+
+def record_round(ai: AIPlayerState, player: PlayerState, player_choice_value, ai_choice):
+    """한 라운드 결과를 AI에 기록 (MatchEngine.process_round와 같은 순서)"""
+    ai.record_player_choice(player_choice_value)
+    ai.record_ai_choice(ai_choice)
+    difference = (CHOICE_INDEX[ai_choice] - CHOICE_INDEX[player_choice_value]) % 3
+    winner = None if difference == 0 else (ai if difference == 1 else player)
+    ai.record_round_result(player_choice_value, ai_choice, winner)
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_decide_batch_matches_make_choice(seed):
+    """문맥/앙상블/캐시 옵션을 섞은 세션들에서 선택과 분석 메시지가 make_choice와 같음"""
+    rng = random.Random(seed)
+    player = PlayerState("플레이어")
+    scalar, batch, styles = [], [], []
+    for i in range(SESSIONS):
+        session_seed = rng.randrange(2 ** 32)
+        difficulty = rng.choice((0.0, 0.3, 0.7, 1.0))
+        options = OPTIONS[i % len(OPTIONS)]
+        scalar.append(make_ai(session_seed, difficulty, options))
+        batch.append(make_ai(session_seed, difficulty, options))
+        styles.append(rng.randrange(3))
+    
+    previous = [None] * SESSIONS
+    for round_number in range(ROUNDS):
+        batch_choices = decide_batch(batch)
+        for i, (scalar_ai, batch_ai) in enumerate(zip(scalar, batch)):
+            scalar_choice = scalar_ai.make_choice()
+            scalar_ai.set_choice(scalar_choice)
+            assert batch_choices[i] == scalar_choice
+            assert batch_ai.current_choice == scalar_choice
+            assert batch_ai.analysis_message == scalar_ai.analysis_message
+            
+            choice = player_choice(rng, styles[i], round_number, previous[i])
+            previous[i] = choice
+            record_round(scalar_ai, player, choice, scalar_choice)
+            record_round(batch_ai, player, choice, batch_choices[i])
+
+def test_decide_batch_without_apply_keeps_choice():
+    """apply=False면 선택만 돌려주고 AI의 현재 선택은 바꾸지 않음"""
+    ai = make_ai(5, 0.7, ())
+    choices = decide_batch([ai], apply=False)
+    assert choices[0] in CHOICE_ORDER
+    assert ai.current_choice is None
+
+def test_decide_batch_empty():
+    """세션이 없으면 빈 목록"""
+    assert decide_batch([]) == []
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+AI 패턴 분석 테스트
+증분 통계로 계산한 패턴 분석이 기록 목록을 매번 처음부터 훑던 기존 분석과 같은지 확인합니다.
+"""
+
+import random
+
+import pytest
+
+from src.ai_engine import UNIFORM_DISTRIBUTION, AIPlayerState
+from src.engine import CHOICE_ORDER, COMPUTER_WIN, DRAW, PLAYER_WIN, PlayerState
+
+def count_distribution(choices) -> dict:
+    """선택 목록의 확률 분포 (비어 있으면 균등 분포)"""
+    if not choices:
+        return dict(UNIFORM_DISTRIBUTION)
+    return {choice: choices.count(choice) / len(choices) for choice in CHOICE_ORDER}
+
+def reference_recent(history: list) -> dict:
+    """기존 최근 선택 분석 (player_history 마지막 3개)"""
+    if len(history) < 3:
+        return dict(UNIFORM_DISTRIBUTION)
+    return count_distribution(history[-3:])
+
+def reference_after(history: list, outcomes: list, outcome: int) -> dict:
+    """기존 승리/패배 후 분석 (outcome 라운드 수만큼 player_history[1:]을 셈)"""
+    rounds = [result for result in outcomes if result == outcome]
+    if len(outcomes) < 2 or len(rounds) < 2:
+        return dict(UNIFORM_DISTRIBUTION)
+    next_choices = [history[i + 1] for i in range(len(rounds) - 1) if i + 1 < len(history)]
+    return count_distribution(next_choices)
+
+@pytest.mark.parametrize("seed", range(5))
+def test_patterns_match_reference(seed):
+    """무작위 대전 동안 매 라운드 세 가지 패턴 분석이 기존 방식 결과와 같음"""
+    rng = random.Random(seed)
+    ai = AIPlayerState("컴퓨터")
+    player = PlayerState("플레이어")
+    history, outcomes = [], []
+    for _ in range(60):
+        player_choice = rng.choice(CHOICE_ORDER)
+        ai_choice = rng.choice(CHOICE_ORDER)
+        outcome = rng.choice((DRAW, PLAYER_WIN, COMPUTER_WIN))
+        winner = {DRAW: None, PLAYER_WIN: player, COMPUTER_WIN: ai}[outcome]
+        
+        ai.record_player_choice(player_choice)
+        ai.record_ai_choice(ai_choice)
+        ai.record_round_result(player_choice, ai_choice, winner)
+        history = (history + [player_choice])[-10:]
+        outcomes = (outcomes + [outcome])[-10:]
+        
+        assert ai.analyze_recent_pattern() == pytest.approx(reference_recent(history))
+        assert ai.analyze_win_pattern() == pytest.approx(reference_after(history, outcomes, PLAYER_WIN))
+        assert ai.analyze_lose_pattern() == pytest.approx(reference_after(history, outcomes, COMPUTER_WIN))
+
+def test_recent_pattern_uses_player_history_length():
+    """최근 패턴은 결과 기록이 아니라 플레이어 선택이 3개 이상이면 분석"""
+    ai = AIPlayerState("컴퓨터")
+    for choice in (CHOICE_ORDER[0], CHOICE_ORDER[0], CHOICE_ORDER[1]):
+        ai.record_player_choice(choice)
+    assert ai.analyze_recent_pattern() == pytest.approx({CHOICE_ORDER[0]: 2 / 3, CHOICE_ORDER[1]: 1 / 3, CHOICE_ORDER[2]: 0})
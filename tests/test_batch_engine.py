@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+배치 라운드 판정기 테스트
+무작위 대전을 MatchEngine.play_round와 resolve_rounds로 함께 진행하면서
+매 라운드 결과와 양쪽 상태가 완전히 같은지 확인합니다.
+"""
+
+import random
+
+import numpy as np
+import pytest
+
+from src.batch_engine import BatchSide, resolve_rounds
+from src.engine import (CHOICE_INDEX, CHOICE_ORDER, COMPUTER_WIN, DRAW, PLAYER_WIN,
+                        MatchEngine, PlayerState, random_allocation)
+
+MATCHES = 1000
+ROUNDS = 60
+
+def random_choice_sequence(rng: random.Random, repeat_rate: float):
+    """연속 선택 (특수 능력, 연속 보너스)이 자주 나오도록 직전 선택을 반복하는 선택 생성기"""
+    previous = None
+    while True:
+        if previous is None or rng.random() >= repeat_rate:
+            previous = rng.choice(CHOICE_ORDER)
+        yield previous
+
+def side_values(side: BatchSide, i: int) -> tuple:
+    """배치 상태의 i번째 대전 값"""
+    return (int(side.health[i]), float(side.bonus_damage[i]), bool(side.defense_bonus[i]),
+            int(side.consecutive_wins[i]), int(side.consecutive_losses[i]),
+            int(side.consecutive_choices[i]), bool(side.special_ability_active[i]))
+
+def state_values(state: PlayerState) -> tuple:
+    """PlayerState의 같은 값"""
+    return (state.health, float(state.bonus_damage), state.defense_bonus,
+            state.consecutive_wins, state.consecutive_losses,
+            state.consecutive_choices, state.special_ability_active)
+
+def result_code(engine: MatchEngine, result: dict) -> int:
+    """play_round 결과의 승자를 결과 코드로"""
+    if result['winner'] is None:
+        return DRAW
+    return PLAYER_WIN if result['winner'] is engine.player else COMPUTER_WIN
+
+@pytest.mark.parametrize("seed, repeat_rate", [(0, 0.0), (1, 0.5), (2, 0.8)])
+def test_resolve_rounds_matches_scalar_engine(seed, repeat_rate):
+    """무작위 대전 (반복 선택 포함)에서 결과, 데미지, 체력, 보너스, 방어, 연속 기록이 모두 같음"""
+    rng = random.Random(seed)
+    engines = []
+    choices = []
+    for _ in range(MATCHES):
+        player, computer = PlayerState("플레이어"), PlayerState("컴퓨터")
+        player.set_damage_allocation(*random_allocation(rng))
+        computer.set_damage_allocation(*random_allocation(rng))
+        engines.append(MatchEngine(player, computer))
+        choices.append((random_choice_sequence(rng, repeat_rate), random_choice_sequence(rng, repeat_rate)))
+    
+    batch_player = BatchSide.from_states([engine.player for engine in engines])
+    batch_computer = BatchSide.from_states([engine.computer for engine in engines])
+    
+    for _ in range(ROUNDS):
+        player_choices = np.zeros(MATCHES, dtype=np.int8)
+        computer_choices = np.zeros(MATCHES, dtype=np.int8)
+        expected = {}
+        for i, (engine, (player_sequence, computer_sequence)) in enumerate(zip(engines, choices)):
+            player_choice, computer_choice = next(player_sequence), next(computer_sequence)
+            player_choices[i] = CHOICE_INDEX[player_choice]
+            computer_choices[i] = CHOICE_INDEX[computer_choice]
+            if not engine.is_over():
+                result = engine.play_round(player_choice, computer_choice)
+                expected[i] = (result_code(engine, result), result['damage'])
+        
+        batch_player, batch_computer, results, damage = resolve_rounds(
+            player_choices, computer_choices, batch_player, batch_computer)
+        
+        for i, engine in enumerate(engines):
+            if i in expected:
+                assert (int(results[i]), int(damage[i])) == expected[i]
+            else:
+                # 이미 끝난 대전은 판정하지 않음
+                assert (int(results[i]), int(damage[i])) == (DRAW, 0)
+            assert side_values(batch_player, i) == state_values(engine.player)
+            assert side_values(batch_computer, i) == state_values(engine.computer)
+
+def test_write_to_round_trips_state():
+    """from_states로 읽은 상태를 write_to로 다시 쓰면 원래 값과 같음"""
+    rng = random.Random(3)
+    states = []
+    for _ in range(50):
+        state = PlayerState("플레이어")
+        state.set_damage_allocation(*random_allocation(rng))
+        state.health = rng.randint(0, 20)
+        state.last_choice = rng.choice((None,) + CHOICE_ORDER)
+        state.consecutive_choices = rng.randint(0, 4)
+        state.special_ability_active = rng.random() < 0.5
+        state.defense_bonus = rng.random() < 0.5
+        state.consecutive_wins = rng.randint(0, 3)
+        state.consecutive_losses = rng.randint(0, 3)
+        state.bonus_damage = rng.choice((0, 2.0))
+        states.append(state)
+    
+    side = BatchSide.from_states(states)
+    for i, state in enumerate(states):
+        copy = PlayerState("복사본")
+        side.write_to(i, copy)
+        assert state_values(copy) == state_values(state)
+        assert copy.last_choice == state.last_choice
+        assert copy.get_damage_allocation_tuple() == state.get_damage_allocation_tuple()
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+적 관리자 테스트
+슬롯 풀과 Enemy 뷰가 예전 목록 기반 EnemyManager처럼 보이는지 확인합니다.
+"""
+
+import gc
+
+import pytest
+
+from src.enemy import Enemy, EnemyManager, shared_enemy_manager
+
+def test_enemies_lists_only_active_slots():
+    """enemies에는 미리 만든 빈 슬롯이나 반납된 슬롯이 들어가지 않음"""
+    manager = EnemyManager(capacity=8, seed=0)
+    assert manager.enemies == []
+    
+    first, second, third = manager.add_enemies([10, 20, 30], [40, 50, 60])
+    second.deactivate()
+    assert manager.enemies == [first, third]
+    assert all(enemy.width == 24 and enemy.active for enemy in manager.enemies)
+    
+    manager.clear()
+    assert len(manager.enemies) == 0
+
+def test_claim_reuses_released_slot_and_rejects_unused_slots():
+    """반납된 슬롯은 원래 값 그대로 되살리고, 한 번도 쓰지 않은 슬롯은 IndexError"""
+    manager = EnemyManager(capacity=8, seed=0)
+    first, second = manager.add_enemies([10, 20], [30, 40])
+    first.deactivate()
+    first.activate()
+    assert manager.enemies == [first, second]
+    assert (first.get_position(), first.width, first.speed) == ((10, 30), 24, 2)
+    assert manager.active_count == 2 and manager.free_count == 0
+    
+    for index in (2, 7, -1):
+        with pytest.raises(IndexError):
+            manager.claim(index)
+    assert manager.count == 2 and manager.active_count == 2
+
+def test_standalone_enemies_share_one_manager():
+    """Enemy(x, y)들은 공유 관리자의 슬롯을 하나씩 쓰고 사라지면 슬롯을 반납함"""
+    manager = shared_enemy_manager()
+    before = manager.active_count
+    a, b = Enemy(10, 20), Enemy(30, 40, 10, 10)
+    assert a.manager is b.manager is manager
+    assert a.index != b.index
+    assert (a.rect.topleft, b.rect.size) == ((10, 20), (10, 10))
+    assert manager.active_count == before + 2
+    
+    # 비활성화한 적의 슬롯을 새 적이 받은 뒤 옛 적이 사라져도 새 적은 그대로
+    b.deactivate()
+    c = Enemy(5, 5)
+    del a, b
+    gc.collect()
+    assert c.active and c.get_position() == (5, 5)
+    assert manager.active_count == before + 1
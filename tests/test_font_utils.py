@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+폰트 탐색 캐시 테스트
+폰트 폴더 지문이 최상위 폴더만 보고 바뀌는지, 디스크 캐시가 다음 실행에서 쓰이는지 확인합니다.
+"""
+
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+import pytest
+
+from src import font_utils
+from src.font_utils import FontRegistry, default_font_index_path, font_directories_fingerprint
+
+@pytest.fixture
+def font_dirs(tmp_path, monkeypatch):
+    """임시 폴더 두 개를 시스템 폰트 폴더로 사용"""
+    dirs = [tmp_path / "fonts", tmp_path / "more_fonts"]
+    dirs[0].mkdir()
+    monkeypatch.setattr(font_utils, "font_directories", lambda: [str(path) for path in dirs])
+    return dirs
+
+def test_default_index_path_uses_tmp_cache(tmp_path):
+    """테스트에서는 캐시 파일이 임시 폴더에 만들어짐"""
+    assert default_font_index_path() == os.path.join(str(tmp_path), "protoType", "font_index.json")
+    assert font_utils.font_registry.index_path.startswith(str(tmp_path))
+
+def test_fingerprint_tracks_only_top_level_directories(font_dirs):
+    """최상위 폴더가 바뀌거나 생기면 지문이 바뀌고, 하위 폴더 안의 변경은 훑지 않음"""
+    nested = font_dirs[0] / "truetype"
+    nested.mkdir()
+    before = font_directories_fingerprint()
+    
+    (nested / "extra.ttf").write_bytes(b"")
+    os.utime(font_dirs[0], ns=(0, 0))
+    pinned = font_directories_fingerprint()
+    (nested / "another.ttf").write_bytes(b"")
+    assert font_directories_fingerprint() == pinned
+    assert pinned != before
+    
+    font_dirs[1].mkdir()
+    assert font_directories_fingerprint() != pinned
+
+def test_index_is_reused_by_next_registry(font_dirs, tmp_path, monkeypatch):
+    """첫 레지스트리가 쓴 캐시를 다음 레지스트리가 그대로 읽음"""
+    # 시스템 폰트 검색은 환경마다 다르므로 한글 폰트가 없는 것으로 고정
+    monkeypatch.setattr(pygame.font, "match_font", lambda name: None)
+    index_path = str(tmp_path / "index.json")
+    first = FontRegistry(index_path)
+    first.resolve_face()
+    assert not first.index_hit and os.path.exists(index_path)
+    
+    second = FontRegistry(index_path)
+    assert second.resolve_face() == first.font_path
+    assert second.index_hit
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+글리프 아틀라스 테스트
+아틀라스로 조립한 HUD 문자열이 font.render 결과와 같은 폭, 같은 픽셀로 그려지는지 확인합니다.
+"""
+
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import numpy as np
+import pygame
+import pytest
+
+from src.glyph_atlas import LAYOUT_CACHE_SIZE, GlyphAtlas
+
+BACKGROUND = (30, 40, 50)
+COLOR = (250, 200, 10)
+
+# (폰트 크기, 문자열) - HUD에 그리는 문자열들
+HUD_CASES = ([(20, str(value)) for value in range(21)] +
+             [(36, f"총합: {total}/20") for total in range(41)] +
+             [(48, f"라운드 {round_number}") for round_number in range(1, 30)] +
+             [(36, f"데미지: {damage}") for damage in range(21)] +
+             [(18, f"{health}/20") for health in range(-5, 21)])
+
+@pytest.fixture(scope="module", autouse=True)
+def pygame_display():
+    """더미 디스플레이로 pygame 초기화"""
+    pygame.init()
+    pygame.display.set_mode((10, 10))
+    yield
+    pygame.quit()
+
+def render_both(size: int, text: str):
+    """같은 배경에 font.render 결과와 아틀라스 결과를 각각 그려서 반환"""
+    font = pygame.font.Font(None, size)
+    expected = pygame.Surface((400, 80))
+    expected.fill(BACKGROUND)
+    expected.blit(font.render(text, True, COLOR), (5, 5))
+    
+    actual = pygame.Surface((400, 80))
+    actual.fill(BACKGROUND)
+    rect = GlyphAtlas(font, COLOR).draw(actual, text, (5, 5))
+    return font, expected, actual, rect
+
+@pytest.mark.parametrize("text, width", [("11", 12), ("20/20", 33), ("총합: 17/20", 48)])
+def test_size_includes_kerning(text, width):
+    """글자 너비의 합이 아니라 커닝이 적용된 폭을 돌려줌"""
+    font = pygame.font.Font(None, 18)
+    atlas = GlyphAtlas(font, COLOR)
+    assert atlas.size(text) == (width, font.get_height())
+    assert atlas.size(text)[0] == font.size(text)[0]
+
+@pytest.mark.parametrize("size, text", HUD_CASES)
+def test_draw_matches_render(size, text):
+    """HUD 문자열이 font.render와 같은 폭, 같은 위치로 그려지고 픽셀 차이는 글자 가장자리 안티앨리어싱뿐임"""
+    font, expected, actual, rect = render_both(size, text)
+    assert rect == pygame.Rect((5, 5), font.size(text))
+    
+    difference = np.abs(pygame.surfarray.array3d(expected).astype(int) - pygame.surfarray.array3d(actual))
+    # SDL_ttf는 문자열 전체를 그릴 때 일부 글자를 픽셀 이하 단위로 옮겨서 안티앨리어싱하므로
+    # 글자 하나를 정수 위치에 찍는 아틀라스는 그 글자의 가장자리 몇 픽셀만 조금 달라질 수 있음
+    changed = difference.max(axis=2) > 0
+    assert changed.sum() <= 16
+    assert difference.max() <= 48
+
+def test_draw_matches_render_exactly_for_digits():
+    """커닝 쌍이 있는 숫자 문자열도 픽셀 단위로 똑같음"""
+    for size in (18, 20, 24, 36, 48):
+        for text in ("11", "0123456789", "20"):
+            _, expected, actual, _ = render_both(size, text)
+            assert pygame.image.tobytes(expected, "RGB") == pygame.image.tobytes(actual, "RGB"), (size, text)
+
+def test_layout_cache_is_bounded():
+    """문자열별 위치 캐시는 최근에 쓴 LAYOUT_CACHE_SIZE개만 남기고 다시 그려도 폭이 같음"""
+    font = pygame.font.Font(None, 20)
+    atlas = GlyphAtlas(font, COLOR)
+    surface = pygame.Surface((200, 40))
+    first = atlas.draw(surface, "0", (0, 0))
+    for value in range(LAYOUT_CACHE_SIZE + 10):
+        atlas.draw(surface, str(value), (0, 0))
+    assert len(atlas.layouts) == LAYOUT_CACHE_SIZE
+    assert "0" not in atlas.layouts
+    assert atlas.draw(surface, "0", (0, 0)) == first
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+공간 해시 테스트
+오브젝트를 무작위로 등록하고 옮기고 지우면서 SpatialHash의 질의 결과가
+모든 오브젝트를 하나씩 검사한 결과와 같은지 확인합니다.
+"""
+
+import random
+
+import pygame
+
+from src.spatial_hash import SpatialHash
+
+def brute_rect(rects: dict, query: pygame.Rect) -> set:
+    """사각형과 겹치는 오브젝트 (전체 검사)"""
+    return {obj for obj, rect in rects.items() if rect.colliderect(query)}
+
+def brute_radius(rects: dict, center, radius: float) -> set:
+    """원과 겹치는 오브젝트 (전체 검사)"""
+    cx, cy = center
+    found = set()
+    for obj, rect in rects.items():
+        dx = cx - max(rect.left, min(cx, rect.right))
+        dy = cy - max(rect.top, min(cy, rect.bottom))
+        if dx * dx + dy * dy <= radius * radius:
+            found.add(obj)
+    return found
+
+def random_rect(rng: random.Random) -> pygame.Rect:
+    """화면 안팎에 걸친 무작위 사각형 (칸 여러 개에 걸치는 큰 것 포함)"""
+    return pygame.Rect(rng.randint(-100, 900), rng.randint(-100, 700), rng.randint(1, 150), rng.randint(1, 150))
+
+def test_queries_match_brute_force():
+    """등록, 이동, 제거를 섞어도 사각형/점/원/쌍 질의가 전체 검사와 같음"""
+    rng = random.Random(0)
+    spatial_hash = SpatialHash(cell_size=64)
+    rects = {}
+    for obj in range(300):
+        rects[obj] = random_rect(rng)
+        spatial_hash.insert(obj, rects[obj])
+    
+    for _ in range(20):
+        for obj in rng.sample(sorted(rects), 100):
+            rects[obj] = rects[obj].move(rng.randint(-40, 40), rng.randint(-40, 40))
+            spatial_hash.update(obj, rects[obj])
+        for obj in rng.sample(sorted(rects), 5):
+            del rects[obj]
+            spatial_hash.remove(obj)
+        assert len(spatial_hash) == len(rects)
+        
+        for _ in range(20):
+            query = random_rect(rng)
+            assert set(spatial_hash.query_rect(query)) == brute_rect(rects, query)
+            point = (rng.randint(-100, 900), rng.randint(-100, 700))
+            assert set(spatial_hash.query_point(point)) == {obj for obj, rect in rects.items() if rect.collidepoint(point)}
+            radius = rng.uniform(0, 120)
+            assert set(spatial_hash.query_radius(point, radius)) == brute_radius(rects, point, radius)
+        
+        pairs = spatial_hash.query_pairs()
+        assert len(pairs) == len(set(pairs))
+        expected = {(a, b) for a in rects for b in rects if a < b and rects[a].colliderect(rects[b])}
+        assert set(pairs) == expected
+
+def test_remove_and_clear():
+    """없는 오브젝트 제거는 무시하고 clear 후에는 비어 있음"""
+    spatial_hash = SpatialHash()
+    spatial_hash.insert("a", pygame.Rect(0, 0, 10, 10))
+    spatial_hash.remove("b")
+    assert "a" in spatial_hash
+    spatial_hash.clear()
+    assert len(spatial_hash) == 0
+    assert spatial_hash.cells == {}
+    assert spatial_hash.query_point((5, 5)) == []
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+AI 토너먼트
+화면 없이 AIPlayer와 스크립트 전략들의 대전을 돌려 승률 표를 출력합니다.
+"""
+
+import argparse
+import time
+from src.tournament import run_tournament, format_tables, DEFAULT_DIFFICULTIES, DEFAULT_STRATEGIES, MAX_ROUNDS
+
+def positive_int(value: str) -> int:
+    """1 이상의 정수 인자 (argparse type)"""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"1 이상이어야 합니다: {value}")
+    return number
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="AI 토너먼트")
+    parser.add_argument("--games", type=positive_int, default=200, help="난이도와 전략 조합마다 진행할 대전 수")
+    parser.add_argument("--difficulties", type=float, nargs="+", default=list(DEFAULT_DIFFICULTIES))
+    parser.add_argument("--strategies", nargs="+", default=list(DEFAULT_STRATEGIES))
+    parser.add_argument("--workers", type=int, default=None, help="프로세스 수 (기본: CPU 수)")
+    parser.add_argument("--chunk-size", type=positive_int, default=50, help="작업 하나에 들어가는 대전 수")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-rounds", type=int, default=MAX_ROUNDS)
+    args = parser.parse_args()
+    
+    start = time.perf_counter()
+    results = run_tournament(args.difficulties, args.strategies, args.games,
+                             args.workers, args.chunk_size, args.seed, args.max_rounds)
+    elapsed = time.perf_counter() - start
+    
+    print(format_tables(results, args.difficulties, args.strategies))
+    print(f"\n총 {sum(stats['games'] for stats in results.values())}판, {elapsed:.1f}초")
+
+if __name__ == "__main__":
+    main()